@@ -0,0 +1,26 @@
+"""Add content hash to project files
+
+Revision ID: 3a9c2e41d7b0
+Revises: 0754d9a91fce
+Create Date: 2026-10-16 09:12:44.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9c2e41d7b0'
+down_revision: Union[str, None] = '0754d9a91fce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('project_files', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('project_files', 'content_hash')
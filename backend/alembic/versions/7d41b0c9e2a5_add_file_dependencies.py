@@ -0,0 +1,43 @@
+"""Add file dependencies
+
+Revision ID: 7d41b0c9e2a5
+Revises: 3a9c2e41d7b0
+Create Date: 2026-10-16 10:03:17.204655
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d41b0c9e2a5'
+down_revision: Union[str, None] = '3a9c2e41d7b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('file_dependencies',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('project_id', sa.String(), nullable=False),
+    sa.Column('source_file_id', sa.String(), nullable=False),
+    sa.Column('target_file_id', sa.String(), nullable=False),
+    sa.Column('symbols', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['source_file_id'], ['project_files.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['target_file_id'], ['project_files.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_file_dependencies_project_id'), 'file_dependencies', ['project_id'], unique=False)
+    op.create_index(op.f('ix_file_dependencies_source_file_id'), 'file_dependencies', ['source_file_id'], unique=False)
+    op.create_index(op.f('ix_file_dependencies_target_file_id'), 'file_dependencies', ['target_file_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_file_dependencies_target_file_id'), table_name='file_dependencies')
+    op.drop_index(op.f('ix_file_dependencies_source_file_id'), table_name='file_dependencies')
+    op.drop_index(op.f('ix_file_dependencies_project_id'), table_name='file_dependencies')
+    op.drop_table('file_dependencies')
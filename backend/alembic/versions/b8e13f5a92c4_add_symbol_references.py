@@ -0,0 +1,43 @@
+"""Add symbol references
+
+Revision ID: b8e13f5a92c4
+Revises: 7d41b0c9e2a5
+Create Date: 2026-10-16 13:41:52.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e13f5a92c4'
+down_revision: Union[str, None] = '7d41b0c9e2a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('symbol_references',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('project_id', sa.String(), nullable=False),
+    sa.Column('target_file_id', sa.String(), nullable=False),
+    sa.Column('symbol', sa.String(length=255), nullable=False),
+    sa.Column('source_file_id', sa.String(), nullable=False),
+    sa.Column('line', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['source_file_id'], ['project_files.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['target_file_id'], ['project_files.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_symbol_references_target_symbol', 'symbol_references', ['target_file_id', 'symbol'], unique=False)
+    op.create_index('ix_symbol_references_project_symbol', 'symbol_references', ['project_id', 'symbol'], unique=False)
+    op.create_index(op.f('ix_symbol_references_source_file_id'), 'symbol_references', ['source_file_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_symbol_references_source_file_id'), table_name='symbol_references')
+    op.drop_index('ix_symbol_references_project_symbol', table_name='symbol_references')
+    op.drop_index('ix_symbol_references_target_symbol', table_name='symbol_references')
+    op.drop_table('symbol_references')
@@ -0,0 +1,154 @@
+"""Split parsed symbols storage
+
+Revision ID: c41e7d9a0b63
+Revises: b8e13f5a92c4
+Create Date: 2026-10-16 15:02:37.604118
+
+Moves imports/exports into file_imports/file_exports and definitions/calls
+into project_files.symbol_blob. Existing parsed_symbols are copied, not
+cleared, so a downgrade only loses files parsed after the upgrade (they need
+a reparse); new parses stop writing the JSONB column.
+"""
+import json
+import uuid
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7d9a0b63'
+down_revision: Union[str, None] = 'b8e13f5a92c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 500
+
+try:
+    import msgpack
+    import zstandard
+except ImportError:
+    msgpack = zstandard = None
+
+
+def upgrade() -> None:
+    op.add_column('project_files', sa.Column('symbol_blob', sa.LargeBinary(), nullable=True))
+    file_imports = op.create_table('file_imports',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('project_id', sa.String(), nullable=False),
+    sa.Column('file_id', sa.String(), nullable=False),
+    sa.Column('ordinal', sa.Integer(), nullable=False),
+    sa.Column('source', sa.Text(), nullable=False),
+    sa.Column('symbols', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('is_default', sa.Boolean(), nullable=False),
+    sa.Column('is_wildcard', sa.Boolean(), nullable=False),
+    sa.Column('line', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['file_id'], ['project_files.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_file_imports_file_id'), 'file_imports', ['file_id'], unique=False)
+    op.create_index(op.f('ix_file_imports_project_id'), 'file_imports', ['project_id'], unique=False)
+    file_exports = op.create_table('file_exports',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('project_id', sa.String(), nullable=False),
+    sa.Column('file_id', sa.String(), nullable=False),
+    sa.Column('ordinal', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('signature', sa.Text(), nullable=False),
+    sa.Column('line', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['file_id'], ['project_files.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_file_exports_file_id'), 'file_exports', ['file_id'], unique=False)
+    op.create_index(op.f('ix_file_exports_project_id'), 'file_exports', ['project_id'], unique=False)
+
+    _backfill(file_imports, file_exports)
+
+
+# ── Backfill ───────────────────────────────────────────────────────────────────
+# A frozen copy of app.services.impact.symbol_store as of this revision, so the
+# migration neither imports app settings nor changes when the live codec does.
+# Format byte 1 is msgpack + zstd, 2 is json + zlib.
+
+def _encode_symbol_blob(data: dict) -> bytes:
+    body = {
+        "language": data.get("language", ""),
+        "definitions": [
+            [d["name"], d["kind"], d.get("signature", ""), d.get("start_line", 0), d.get("end_line", 0), d.get("parent")]
+            for d in data.get("definitions", [])
+        ],
+        "calls": [[c["callee"], c.get("line", 0), c.get("parent_def")] for c in data.get("calls", [])],
+    }
+    if msgpack is not None:
+        return bytes([1]) + zstandard.ZstdCompressor().compress(msgpack.packb(body))
+    return bytes([2]) + zlib.compress(json.dumps(body, separators=(",", ":")).encode())
+
+
+def _split_parsed_symbols(project_id: str, file_id: str, data: dict) -> tuple[list[dict], list[dict], bytes]:
+    imports = [
+        {
+            "id": str(uuid.uuid4()), "project_id": project_id, "file_id": file_id, "ordinal": n,
+            "source": i["source"], "symbols": i.get("symbols") or [],
+            "is_default": i.get("is_default", False), "is_wildcard": i.get("is_wildcard", False),
+            "line": i.get("line", 0),
+        }
+        for n, i in enumerate(data.get("imports", []))
+    ]
+    exports = []
+    for n, e in enumerate(data.get("exports", [])):
+        # Rows written before the extractor registry stored bare export names
+        if isinstance(e, str):
+            e = {"name": e, "kind": "variable"}
+        exports.append({
+            "id": str(uuid.uuid4()), "project_id": project_id, "file_id": file_id, "ordinal": n,
+            "name": e["name"], "kind": e["kind"], "signature": e.get("signature", ""), "line": e.get("line", 0),
+        })
+    return imports, exports, _encode_symbol_blob(data)
+
+
+def _backfill(file_imports: sa.Table, file_exports: sa.Table) -> None:
+    bind = op.get_bind()
+    files = sa.table(
+        'project_files',
+        sa.column('id', sa.String()),
+        sa.column('project_id', sa.String()),
+        sa.column('parsed_symbols', postgresql.JSONB()),
+        sa.column('symbol_blob', sa.LargeBinary()),
+    )
+    set_blob = (
+        files.update()
+        .where(files.c.id == sa.bindparam('file_id'))
+        .values(symbol_blob=sa.bindparam('blob'))
+    )
+    rows = bind.execution_options(yield_per=BACKFILL_BATCH).execute(
+        sa.select(files.c.id, files.c.project_id, files.c.parsed_symbols)
+        .where(files.c.parsed_symbols.isnot(None))
+    )
+    for batch in rows.partitions():
+        imports, exports, blobs = [], [], []
+        for file_id, project_id, data in batch:
+            file_import_rows, file_export_rows, blob = _split_parsed_symbols(project_id, file_id, data)
+            imports += file_import_rows
+            exports += file_export_rows
+            blobs.append({"file_id": file_id, "blob": blob})
+        if imports:
+            bind.execute(file_imports.insert(), imports)
+        if exports:
+            bind.execute(file_exports.insert(), exports)
+        bind.execute(set_blob, blobs)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_file_exports_project_id'), table_name='file_exports')
+    op.drop_index(op.f('ix_file_exports_file_id'), table_name='file_exports')
+    op.drop_table('file_exports')
+    op.drop_index(op.f('ix_file_imports_project_id'), table_name='file_imports')
+    op.drop_index(op.f('ix_file_imports_file_id'), table_name='file_imports')
+    op.drop_table('file_imports')
+    op.drop_column('project_files', 'symbol_blob')
@@ -0,0 +1,51 @@
+"""Unique component dependency edges
+
+Revision ID: d2a6b8f31c57
+Revises: c41e7d9a0b63
+Create Date: 2026-10-16 16:20:11.482905
+
+Existing duplicates are merged into the row with the lowest id (symbols
+unioned) before the constraint is added.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a6b8f31c57'
+down_revision: Union[str, None] = 'c41e7d9a0b63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EDGE_COLUMNS = ['source_component_id', 'target_component_id', 'dependency_type', 'detection_method']
+
+
+def upgrade() -> None:
+    same_edge = " AND ".join(f"d.{c} = keep.{c}" for c in EDGE_COLUMNS)
+    group_by = ", ".join(f"d.{c}" for c in EDGE_COLUMNS)
+    op.execute(sa.text(f"""
+        UPDATE component_dependencies AS keep
+        SET symbols = merged.symbols
+        FROM (
+            SELECT min(d.id) AS id,
+                   COALESCE(jsonb_agg(DISTINCT e.symbol ORDER BY e.symbol)
+                            FILTER (WHERE e.symbol IS NOT NULL), '[]'::jsonb) AS symbols
+            FROM component_dependencies AS d
+            LEFT JOIN LATERAL jsonb_array_elements_text(COALESCE(d.symbols, '[]'::jsonb)) AS e(symbol) ON true
+            GROUP BY {group_by}
+            HAVING count(DISTINCT d.id) > 1
+        ) AS merged
+        WHERE keep.id = merged.id
+    """))
+    op.execute(sa.text(f"""
+        DELETE FROM component_dependencies AS d
+        USING component_dependencies AS keep
+        WHERE {same_edge} AND d.id > keep.id
+    """))
+    op.create_unique_constraint('uq_component_dependencies_edge', 'component_dependencies', EDGE_COLUMNS)
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_component_dependencies_edge', 'component_dependencies', type_='unique')
@@ -13,7 +13,9 @@ from app.models.project import Project
 from app.models.component import Component, ComponentContributor, ProjectFile, FileDraft, ProjectSnapshot, SnapshotFile
 from app.models.change import ChangeRequest, ChangeImpact, Notification
 from app.tasks.impact import analyze_impact
+from app.tasks.parsing import reparse_files
 from app.core.redis import publish
+from app.services.impact.parse_cache import content_hash
 
 router = APIRouter(tags=["changes"])
 
@@ -79,7 +81,8 @@ async def submit_change(project_id: str, req: ChangeCreateReq, db: AsyncSession
         db.add(SnapshotFile(
             snapshot_id=snap.id,
             file_id=af.id,
-            s3_key=af.s3_key
+            s3_key=af.s3_key,
+            content_hash=af.content_hash
         ))
         
     # update component status
@@ -325,6 +328,7 @@ async def approve_change(change_id: str, db: AsyncSession = Depends(get_db), cur
         await upload_bytes(new_key, b_content, "text/plain")
         
         f.s3_key = new_key
+        f.content_hash = content_hash(b_content)
         d.is_active = False
         
     await db.flush()
@@ -336,7 +340,8 @@ async def approve_change(change_id: str, db: AsyncSession = Depends(get_db), cur
         db.add(SnapshotFile(
             snapshot_id=snap2.id,
             file_id=af.id,
-            s3_key=af.s3_key
+            s3_key=af.s3_key,
+            content_hash=af.content_hash
         ))
         
     cr.status = "approved"
@@ -351,6 +356,10 @@ async def approve_change(change_id: str, db: AsyncSession = Depends(get_db), cur
        await db.execute(update(Component).where(Component.id == cid).values(status="stable"))
        
     await db.commit()
+
+    # Re-parse the approved files and patch only the graph edges they touch
+    if drafts:
+        reparse_files.delay(cr.project_id, [d.file_id for d in drafts])
     
     import json
     # publish to ALL contributors of project
@@ -11,6 +11,7 @@ from app.models.project import Project
 from app.models.component import Component, ComponentContributor, ProjectFile
 from app.models.change import Notification
 from app.core.redis import publish
+from app.services.impact.graph_cache import invalidate_project_graph
 import json
 
 from pydantic import BaseModel
@@ -128,6 +129,8 @@ async def update_component(project_id: str, component_id: str, req: ComponentUpd
 
     await db.commit()
     await db.refresh(comp)
+    if req.name is not None:
+        await invalidate_project_graph(project_id)
 
     return {
         "data": {
@@ -156,6 +159,7 @@ async def delete_component(project_id: str, component_id: str, db: AsyncSession
 
     await db.delete(comp)
     await db.commit()
+    await invalidate_project_graph(project_id)
 
     return {"message": "Component deleted"}
 
@@ -2,16 +2,16 @@ import uuid
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update
 from pydantic import BaseModel
 
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.project import Project
-from app.models.component import ProjectFile, Component, ComponentContributor, FileDraft, ComponentDependency
-from app.core.storage import generate_presigned_put_url, object_exists, generate_presigned_get_url, download_bytes
-from sqlalchemy import update
+from app.models.component import ProjectFile, Component, ComponentContributor, FileDraft
+from app.core.storage import presign_put_urls, object_exists, presign_get_urls, download_bytes
+from app.services.impact.graph_cache import get_project_graph
 from app.services.language_detector import detect_language
 from app.tasks.parsing import parse_project
 
@@ -40,32 +40,29 @@ async def generate_presigned_urls(req: UploadBatchReq, db: AsyncSession = Depend
     if project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Only owner can upload files for now")
 
-    response_data = []
-
+    # One multi-row INSERT for the batch; URLs are signed locally, no per-file round trips
+    rows = []
     for fReq in req.files:
         unique_uuid = str(uuid.uuid4())
-        s3_key = f"projects/{req.project_id}/{unique_uuid}/{fReq.name}"
-        
-        project_file = ProjectFile(
-            project_id=req.project_id,
-            path=fReq.name,
-            language=detect_language(fReq.name),
-            size_bytes=fReq.size,
-            s3_key=s3_key,
-            component_id=None,
-            confirmed=False
-        )
-        db.add(project_file)
-        await db.flush()
-        
-        upload_url = await generate_presigned_put_url(s3_key, fReq.content_type)
-        
-        response_data.append({
-            "file_id": project_file.id,
-            "upload_url": upload_url,
-            "storage_key": s3_key
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "project_id": req.project_id,
+            "path": fReq.name,
+            "language": detect_language(fReq.name),
+            "size_bytes": fReq.size,
+            "s3_key": f"projects/{req.project_id}/{unique_uuid}/{fReq.name}",
+            "component_id": None,
+            "confirmed": False,
         })
-        
+    if rows:
+        await db.execute(insert(ProjectFile), rows)
+    upload_urls = presign_put_urls([(row["s3_key"], fReq.content_type) for row, fReq in zip(rows, req.files)])
+
+    response_data = [
+        {"file_id": row["id"], "upload_url": url, "storage_key": row["s3_key"]}
+        for row, url in zip(rows, upload_urls)
+    ]
+
     await db.commit()
     
     return {"data": response_data}
@@ -360,9 +357,9 @@ async def get_component_files(cid: str, db: AsyncSession = Depends(get_db), curr
     f_res = await db.execute(select(ProjectFile).where(ProjectFile.component_id == cid))
     files = f_res.scalars().all()
     
+    urls = presign_get_urls([f.s3_key for f in files])
     out = []
-    for f in files:
-        url = await generate_presigned_get_url(f.s3_key)
+    for f, url in zip(files, urls):
         out.append({
             "id": f.id,
             "path": f.path,
@@ -395,36 +392,24 @@ async def get_component_dependencies(cid: str, db: AsyncSession = Depends(get_db
         if not has_access.scalars().first():
              raise HTTPException(status_code=403, detail="Not authorized")
              
-    from sqlalchemy.orm import selectinload
-    
-    deps_on_res = await db.execute(
-        select(ComponentDependency)
-        .options(selectinload(ComponentDependency.target_component))
-        .where(ComponentDependency.source_component_id == cid)
-    )
-    depends_on = deps_on_res.scalars().all()
-    
-    deps_by_res = await db.execute(
-        select(ComponentDependency)
-        .options(selectinload(ComponentDependency.source_component))
-        .where(ComponentDependency.target_component_id == cid)
-    )
-    depended_by = deps_by_res.scalars().all()
+    graph = await get_project_graph(comp.project_id, db)
+    depends_on = graph.depends_on(cid)
+    depended_by = graph.depended_by(cid)
     
     return {"data": {
         "depends_on": [
             {
                 "id": d.id, 
-                "target_component_id": d.target_component_id,
-                "target_component_name": d.target_component.name,
+                "target_component_id": d.target,
+                "target_component_name": graph.names.get(d.target),
                 "dependency_type": d.dependency_type
             } for d in depends_on
         ],
         "depended_by": [
             {
                 "id": d.id, 
-                "source_component_id": d.source_component_id,
-                "source_component_name": d.source_component.name,
+                "source_component_id": d.source,
+                "source_component_name": graph.names.get(d.source),
                 "dependency_type": d.dependency_type
             } for d in depended_by
         ]
@@ -26,6 +26,12 @@ class Settings(BaseSettings):
     aws_s3_bucket: str = "ripple-files"
     aws_endpoint_url: str = "http://localhost:9000"
     aws_region: str = "us-east-1"
+    s3_async_client: bool = True  # native asyncio S3 (httpx + SigV4); False = boto3 on a thread pool
+    s3_max_connections: int = 64  # pooled connections per event loop for the asyncio client
+    s3_keepalive_expiry: float = 30.0  # seconds an idle pooled connection is kept open
+    s3_download_concurrency: int = 32  # parallel GETs per download_many(); also sizes the boto3 pool
+    presign_cache_window_seconds: int = 300  # presigned GET URLs are reused within a window; 0 = sign every time
+    presign_cache_max_entries: int = 100_000
 
     # Authentication / JWT
     jwt_secret: str
@@ -49,5 +55,18 @@ class Settings(BaseSettings):
     # Impact engine
     impact_engine_timeout: int = 60
 
+    # Parse pipeline
+    parse_workers: int = 4  # parser processes per worker; <= 1 parses on a thread instead
+    parse_download_concurrency: int = 32
+    parse_batch_size: int = 500
+    parse_cache_ttl_seconds: int = 30 * 24 * 3600
+    parse_query_engine: bool = True  # tree-sitter Query extraction where a spec exists; False = hand-written only
+    parse_tree_cache_size: int = 64  # parsed trees kept per process for incremental reparsing
+
+    # Dependency graph
+    graph_cache_max_projects: int = 128  # component graphs kept in memory per process
+    impact_max_depth: int = 5  # hops of transitive dependents flagged per change
+    graph_stream_chunk_size: int = 2000  # rows per server-side cursor fetch when rebuilding a graph
+
 
 settings = Settings()
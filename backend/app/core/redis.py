@@ -20,6 +20,17 @@ async def publish(channel: str, message: str) -> None:
     await r.publish(channel, message)
 
 
+async def publish_many(messages: list[tuple[str, str]]) -> None:
+    """Publishes (channel, message) pairs in one pipelined round trip."""
+    if not messages:
+        return
+    r = await get_redis()
+    async with r.pipeline(transaction=False) as pipe:
+        for channel, message in messages:
+            pipe.publish(channel, message)
+        await pipe.execute()
+
+
 async def subscribe(channel: str):
     r = await get_redis()
     pubsub = r.pubsub()
@@ -0,0 +1,325 @@
+"""
+Native asyncio S3 client: SigV4-signed requests over a pooled httpx client.
+Covers the object calls app.core.storage makes, with path-style addressing
+so MinIO and AWS are reached the same way. One client (and one connection
+pool) per event loop, since httpx connections cannot cross loops.
+
+Presigned URLs are signed locally by Presigner, which needs no I/O at all,
+so a batch of them is a tight loop over one cached signing key.
+"""
+from __future__ import annotations
+
+import asyncio
+import datetime
+import hashlib
+import hmac
+import re
+import time
+import weakref
+from collections import OrderedDict
+from urllib.parse import quote
+
+import httpx
+
+from app.core.config import settings
+
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+_ERROR_CODE = re.compile(rb"<Code>([^<]+)</Code>")
+
+
+class S3Error(Exception):
+    def __init__(self, status_code: int, code: str, key: str):
+        super().__init__(f"S3 {code} ({status_code}) for {key}")
+        self.status_code = status_code
+        self.code = code
+        self.key = key
+
+
+# ── Signing ────────────────────────────────────────────────────────────────────
+
+def _uri_encode(value: str, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+class SigV4Signer:
+    """AWS Signature Version 4 for one set of credentials and region."""
+
+    def __init__(self, access_key: str, secret_key: str, region: str, service: str = "s3"):
+        self.access_key = access_key
+        self.region = region
+        self.service = service
+        self._secret = ("AWS4" + secret_key).encode()
+        # The derived key only changes with the date; keep the current one
+        self._key_date: str | None = None
+        self._key: bytes = b""
+        self._query_key: tuple | None = None
+        self._query = ""
+
+    def signing_key(self, datestamp: str) -> bytes:
+        if datestamp != self._key_date:
+            key = self._secret
+            for part in (datestamp, self.region, self.service, "aws4_request"):
+                key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+            self._key_date, self._key = datestamp, key
+        return self._key
+
+    def scope(self, datestamp: str) -> str:
+        return f"{datestamp}/{self.region}/{self.service}/aws4_request"
+
+    def signature(self, canonical_request: str, amz_date: str) -> str:
+        datestamp = amz_date[:8]
+        string_to_sign = "\n".join((
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            self.scope(datestamp),
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ))
+        return hmac.new(self.signing_key(datestamp), string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    def sign_headers(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        headers: dict[str, str],
+        payload_hash: str,
+        now: datetime.datetime | None = None,
+    ) -> dict[str, str]:
+        """Returns headers plus x-amz-date, x-amz-content-sha256 and Authorization."""
+        amz_date = _amz_date(now)
+        signed = _normalize_headers(headers, host)
+        signed.update({"x-amz-content-sha256": payload_hash, "x-amz-date": amz_date})
+        signed_headers, canonical_headers = _canonical_headers(signed)
+        canonical_request = "\n".join((method, path, "", canonical_headers, signed_headers, payload_hash))
+        signed["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{self.scope(amz_date[:8])}, "
+            f"SignedHeaders={signed_headers}, Signature={self.signature(canonical_request, amz_date)}"
+        )
+        del signed["host"]  # httpx sends it from the URL
+        return signed
+
+    def presign(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        expires: int,
+        headers: dict[str, str] | None = None,
+        now: datetime.datetime | None = None,
+    ) -> str:
+        """Query string authorizing method on path for `expires` seconds; headers must be sent as given."""
+        amz_date = _amz_date(now)
+        signed_headers, canonical_headers = _canonical_headers(_normalize_headers(headers or {}, host))
+        # Identical for every URL of a batch, so encoded once
+        query_key = (amz_date, expires, signed_headers)
+        if query_key != self._query_key:
+            self._query_key, self._query = query_key, "&".join(f"{name}={_uri_encode(value)}" for name, value in (
+                ("X-Amz-Algorithm", "AWS4-HMAC-SHA256"),
+                ("X-Amz-Credential", f"{self.access_key}/{self.scope(amz_date[:8])}"),
+                ("X-Amz-Date", amz_date),
+                ("X-Amz-Expires", str(expires)),
+                ("X-Amz-SignedHeaders", signed_headers),
+            ))
+        query = self._query
+        canonical_request = "\n".join((method, path, query, canonical_headers, signed_headers, UNSIGNED_PAYLOAD))
+        return f"{query}&X-Amz-Signature={self.signature(canonical_request, amz_date)}"
+
+
+def _amz_date(now: datetime.datetime | None) -> str:
+    return (now or datetime.datetime.now(datetime.timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _normalize_headers(headers: dict[str, str], host: str) -> dict[str, str]:
+    normalized = {k.lower(): " ".join(str(v).split()) for k, v in headers.items()}
+    normalized["host"] = host
+    return normalized
+
+
+def _canonical_headers(headers: dict[str, str]) -> tuple[str, str]:
+    names = sorted(headers)
+    return ";".join(names), "".join(f"{name}:{headers[name]}\n" for name in names)
+
+
+def _endpoint(endpoint_url: str, region: str) -> tuple[str, str]:
+    """(base URL, Host header) of an endpoint; AWS's regional one when unset."""
+    endpoint = httpx.URL(endpoint_url or f"https://s3.{region}.amazonaws.com")
+    return str(endpoint).rstrip("/"), endpoint.netloc.decode()
+
+
+def object_path(bucket: str, key: str) -> str:
+    return f"/{_uri_encode(bucket)}/{_uri_encode(key, safe='/-_.~')}"
+
+
+# ── Presigning ─────────────────────────────────────────────────────────────────
+
+class Presigner:
+    def __init__(self, *, endpoint_url: str, bucket: str, region: str, access_key: str, secret_key: str):
+        self.bucket = bucket
+        self.signer = SigV4Signer(access_key, secret_key, region)
+        self._base, self._host = _endpoint(endpoint_url, region)
+
+    def urls(
+        self,
+        method: str,
+        keys: list[str],
+        expires: int,
+        headers: list[dict[str, str]] | None = None,
+        now: datetime.datetime | None = None,
+    ) -> list[str]:
+        """One presigned URL per key, all stamped with the same time."""
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        headers = headers or [{}] * len(keys)
+        presign, base, host = self.signer.presign, self._base, self._host
+        out = []
+        for key, key_headers in zip(keys, headers):
+            path = object_path(self.bucket, key)
+            out.append(f"{base}{path}?{presign(method, host, path, expires, key_headers, now)}")
+        return out
+
+
+class PresignedUrlCache:
+    """
+    Per-process LRU of presigned GET URLs keyed by (s3 key, expiry bucket).
+    Time is cut into windows of `window` seconds and every URL of a window is
+    signed as of the window's start, so a cached URL is served for at most
+    `window` seconds and always has at least expires - window left to run.
+    Entries of past windows can never hit again and are dropped on rollover.
+    """
+
+    def __init__(self, window: int, maxsize: int):
+        self.window = window
+        self.maxsize = maxsize
+        self._bucket: int | None = None
+        self._entries: OrderedDict[tuple[str, int], str] = OrderedDict()
+
+    def urls(self, presigner: Presigner, keys: list[str], expires: int, now: float | None = None) -> list[str]:
+        if self.window <= 0 or self.window >= expires:
+            return presigner.urls("GET", keys, expires)
+        bucket = int((time.time() if now is None else now) // self.window)
+        if bucket != self._bucket:
+            self._bucket = bucket
+            self._entries.clear()
+
+        entries = self._entries
+        out: list[str | None] = []
+        misses: list[int] = []
+        for n, key in enumerate(keys):
+            url = entries.get((key, expires))
+            if url is None:
+                misses.append(n)
+            else:
+                entries.move_to_end((key, expires))
+            out.append(url)
+
+        if misses:
+            signed_at = datetime.datetime.fromtimestamp(bucket * self.window, datetime.timezone.utc)
+            signed = presigner.urls("GET", [keys[n] for n in misses], expires, now=signed_at)
+            for n, url in zip(misses, signed):
+                out[n] = entries[(keys[n], expires)] = url
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+        return out
+
+
+_presigner: Presigner | None = None
+
+
+def get_presigner() -> Presigner:
+    global _presigner
+    if _presigner is None:
+        _presigner = Presigner(
+            endpoint_url=settings.aws_endpoint_url,
+            bucket=settings.aws_s3_bucket,
+            region=settings.aws_region,
+            access_key=settings.aws_access_key_id,
+            secret_key=settings.aws_secret_access_key,
+        )
+    return _presigner
+
+
+# ── Client ─────────────────────────────────────────────────────────────────────
+
+class AsyncS3Client:
+    def __init__(
+        self,
+        *,
+        endpoint_url: str,
+        bucket: str,
+        region: str,
+        access_key: str,
+        secret_key: str,
+        max_connections: int = 64,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0,
+    ):
+        self.bucket = bucket
+        self.signer = SigV4Signer(access_key, secret_key, region)
+        self._base, self._host = _endpoint(endpoint_url, region)
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout,
+        )
+
+    async def _request(
+        self, method: str, key: str, content: bytes = b"", headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        path = object_path(self.bucket, key)
+        payload_hash = hashlib.sha256(content).hexdigest() if content else EMPTY_SHA256
+        signed = self.signer.sign_headers(method, self._host, path, headers or {}, payload_hash)
+        response = await self._http.request(method, self._base + path, content=content or None, headers=signed)
+        if response.status_code >= 300:
+            match = _ERROR_CODE.search(response.content)
+            code = match.group(1).decode() if match else str(response.status_code)
+            raise S3Error(response.status_code, code, key)
+        return response
+
+    async def put_object(self, key: str, data: bytes, content_type: str = "application/octet-stream") -> None:
+        await self._request("PUT", key, data, {"content-type": content_type})
+
+    async def get_object(self, key: str) -> bytes:
+        return (await self._request("GET", key)).content
+
+    async def head_object(self, key: str) -> bool:
+        try:
+            await self._request("HEAD", key)
+        except S3Error as e:
+            if e.status_code == 404:
+                return False
+            raise
+        return True
+
+    async def delete_object(self, key: str) -> None:
+        await self._request("DELETE", key)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncS3Client] = weakref.WeakKeyDictionary()
+
+
+def get_async_s3_client() -> AsyncS3Client:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = AsyncS3Client(
+            endpoint_url=settings.aws_endpoint_url,
+            bucket=settings.aws_s3_bucket,
+            region=settings.aws_region,
+            access_key=settings.aws_access_key_id,
+            secret_key=settings.aws_secret_access_key,
+            max_connections=settings.s3_max_connections,
+            keepalive_expiry=settings.s3_keepalive_expiry,
+        )
+    return client
+
+
+async def close_async_s3_client() -> None:
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,12 +1,18 @@
 import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
+from app.core.s3 import PresignedUrlCache, get_async_s3_client, get_presigner
 
 _s3_client = None
+_download_executor: ThreadPoolExecutor | None = None
+_get_url_cache = PresignedUrlCache(settings.presign_cache_window_seconds, settings.presign_cache_max_entries)
 
 
 def get_s3_client():
@@ -18,10 +24,21 @@ def get_s3_client():
             aws_access_key_id=settings.aws_access_key_id,
             aws_secret_access_key=settings.aws_secret_access_key,
             region_name=settings.aws_region,
+            # botocore pools 10 connections by default; batch downloads would queue on them
+            config=Config(max_pool_connections=max(10, settings.s3_download_concurrency)),
         )
     return _s3_client
 
 
+def _get_download_executor() -> ThreadPoolExecutor:
+    global _download_executor
+    if _download_executor is None:
+        _download_executor = ThreadPoolExecutor(
+            max_workers=settings.s3_download_concurrency, thread_name_prefix="s3-download"
+        )
+    return _download_executor
+
+
 def ensure_bucket_exists() -> None:
     s3 = get_s3_client()
     try:
@@ -47,7 +64,25 @@ def ensure_bucket_exists() -> None:
             raise
 
 
+def presign_put_urls(files: list[tuple[str, str]], expires: int = 900) -> list[str]:
+    """Presigned PUT URLs for (key, content type) pairs, signed locally in one pass."""
+    return get_presigner().urls(
+        "PUT", [key for key, _ in files], expires, [{"content-type": ct} for _, ct in files]
+    )
+
+
+def presign_get_urls(keys: list[str], expires: int = 900) -> list[str]:
+    """
+    Presigned GET URLs for keys, signed locally in one pass. URLs are cached
+    for settings.presign_cache_window_seconds, so repeated listings of the
+    same files re-sign nothing.
+    """
+    return _get_url_cache.urls(get_presigner(), keys, expires)
+
+
 async def generate_presigned_put_url(key: str, content_type: str, expires: int = 900) -> str:
+    if settings.s3_async_client:
+        return presign_put_urls([(key, content_type)], expires)[0]
     s3 = get_s3_client()
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(
@@ -61,6 +96,8 @@ async def generate_presigned_put_url(key: str, content_type: str, expires: int =
 
 
 async def generate_presigned_get_url(key: str, expires: int = 900) -> str:
+    if settings.s3_async_client:
+        return presign_get_urls([key], expires)[0]
     s3 = get_s3_client()
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(
@@ -81,7 +118,12 @@ async def generate_presigned_download_url(s3_key: str, expires_in: int = 3600) -
      return await generate_presigned_get_url(s3_key, expires_in)
 
 
+# Object calls go through the asyncio client unless settings.s3_async_client is
+# off, in which case boto3 runs them on the default thread pool.
+
 async def upload_bytes(key: str, data: bytes, content_type: str = "application/octet-stream") -> None:
+    if settings.s3_async_client:
+        return await get_async_s3_client().put_object(key, data, content_type)
     s3 = get_s3_client()
     loop = asyncio.get_event_loop()
     def _upload():
@@ -95,6 +137,8 @@ async def upload_bytes(key: str, data: bytes, content_type: str = "application/o
 
 
 async def download_bytes(key: str) -> bytes:
+    if settings.s3_async_client:
+        return await get_async_s3_client().get_object(key)
     s3 = get_s3_client()
     loop = asyncio.get_event_loop()
     def _download():
@@ -103,13 +147,50 @@ async def download_bytes(key: str) -> bytes:
     return await loop.run_in_executor(None, _download)
 
 
+async def download_many(keys: Iterable[str], concurrency: int | None = None) -> list[bytes | Exception]:
+    """
+    Downloads several objects in parallel, at most `concurrency` at a time
+    (on a dedicated thread pool with boto3). Results are in key order; a key
+    that failed gets its exception instead of bytes, as with
+    gather(return_exceptions=True).
+    """
+    keys = list(keys)
+    if not keys:
+        return []
+    semaphore = asyncio.Semaphore(concurrency or settings.s3_download_concurrency)
+
+    if settings.s3_async_client:
+        client = get_async_s3_client()
+
+        async def fetch(key: str) -> bytes:
+            async with semaphore:
+                return await client.get_object(key)
+    else:
+        s3 = get_s3_client()
+        loop = asyncio.get_running_loop()
+        executor = _get_download_executor()
+
+        def _download(key: str) -> bytes:
+            return s3.get_object(Bucket=settings.aws_s3_bucket, Key=key)["Body"].read()
+
+        async def fetch(key: str) -> bytes:
+            async with semaphore:
+                return await loop.run_in_executor(executor, _download, key)
+
+    return await asyncio.gather(*(fetch(key) for key in keys), return_exceptions=True)
+
+
 async def delete_object(key: str) -> None:
+    if settings.s3_async_client:
+        return await get_async_s3_client().delete_object(key)
     s3 = get_s3_client()
     loop = asyncio.get_event_loop()
     await loop.run_in_executor(None, lambda: s3.delete_object(Bucket=settings.aws_s3_bucket, Key=key))
 
 
 async def object_exists(key: str) -> bool:
+    if settings.s3_async_client:
+        return await get_async_s3_client().head_object(key)
     s3 = get_s3_client()
     loop = asyncio.get_event_loop()
     def _exists():
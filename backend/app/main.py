@@ -7,8 +7,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.routers import auth, projects, components, files, changes, notifications, users
 from app.core.config import settings
 from app.core.websocket import manager, redis_listener
+from app.core.s3 import close_async_s3_client
 from app.core.storage import ensure_bucket_exists
 from app.core.security import verify_access_token
+from app.services.impact.graph_cache import invalidation_listener
 
 
 @asynccontextmanager
@@ -16,8 +18,11 @@ async def lifespan(app: FastAPI):
     ensure_bucket_exists()
     
     redis_listener_task = asyncio.create_task(redis_listener(manager))
+    graph_listener_task = asyncio.create_task(invalidation_listener())
     yield
     redis_listener_task.cancel()
+    graph_listener_task.cancel()
+    await close_async_s3_client()
 
 
 app = FastAPI(
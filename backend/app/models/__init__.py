@@ -1,13 +1,13 @@
 # Import all models here so Alembic autopilot can find them
 from app.models.user import User, RefreshToken
 from app.models.project import Project
-from app.models.component import Component, ComponentContributor, ComponentDependency, ProjectFile, FileDraft, ProjectSnapshot
+from app.models.component import Component, ComponentContributor, ComponentDependency, FileDependency, FileExport, FileImport, ProjectFile, FileDraft, ProjectSnapshot, SymbolReference
 from app.models.change import ChangeRequest, ChangeImpact, Notification, Invite
 
 __all__ = [
     "User", "RefreshToken",
     "Project",
-    "Component", "ComponentContributor", "ComponentDependency",
-    "ProjectFile", "FileDraft", "ProjectSnapshot",
+    "Component", "ComponentContributor", "ComponentDependency", "FileDependency",
+    "FileImport", "FileExport", "ProjectFile", "FileDraft", "ProjectSnapshot", "SymbolReference",
     "ChangeRequest", "ChangeImpact", "Notification", "Invite",
 ]
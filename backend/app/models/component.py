@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -60,6 +60,13 @@ class ComponentContributor(Base):
 
 class ComponentDependency(Base):
     __tablename__ = "component_dependencies"
+    __table_args__ = (
+        # One edge per pair and kind; graph builders upsert against this
+        UniqueConstraint(
+            "source_component_id", "target_component_id", "dependency_type", "detection_method",
+            name="uq_component_dependencies_edge",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -75,6 +82,66 @@ class ComponentDependency(Base):
     target_component: Mapped["Component"] = relationship(foreign_keys=[target_component_id], back_populates="target_dependencies")
 
 
+class FileDependency(Base):
+    """File-level import edge; ComponentDependency rows are aggregated from these."""
+    __tablename__ = "file_dependencies"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    source_file_id: Mapped[str] = mapped_column(ForeignKey("project_files.id", ondelete="CASCADE"), nullable=False, index=True)
+    target_file_id: Mapped[str] = mapped_column(ForeignKey("project_files.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Confirmed imported symbols; None when the import resolves here but names nothing the file exports
+    symbols: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+
+
+class SymbolReference(Base):
+    """
+    Reverse symbol index: one row per symbol a file imports from another
+    project file. symbol is "*" for wildcard/package imports.
+    """
+    __tablename__ = "symbol_references"
+    __table_args__ = (
+        Index("ix_symbol_references_target_symbol", "target_file_id", "symbol"),
+        Index("ix_symbol_references_project_symbol", "project_id", "symbol"),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    target_file_id: Mapped[str] = mapped_column(ForeignKey("project_files.id", ondelete="CASCADE"), nullable=False)
+    symbol: Mapped[str] = mapped_column(String(255), nullable=False)
+    source_file_id: Mapped[str] = mapped_column(ForeignKey("project_files.id", ondelete="CASCADE"), nullable=False, index=True)
+    line: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class FileImport(Base):
+    """One import statement of a parsed file, in source order (ordinal)."""
+    __tablename__ = "file_imports"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    file_id: Mapped[str] = mapped_column(ForeignKey("project_files.id", ondelete="CASCADE"), nullable=False, index=True)
+    ordinal: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    source: Mapped[str] = mapped_column(Text, nullable=False)
+    symbols: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    is_default: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    is_wildcard: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    line: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class FileExport(Base):
+    """One exported symbol of a parsed file, in source order (ordinal)."""
+    __tablename__ = "file_exports"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    file_id: Mapped[str] = mapped_column(ForeignKey("project_files.id", ondelete="CASCADE"), nullable=False, index=True)
+    ordinal: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    signature: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    line: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
 class ProjectFile(Base):
     __tablename__ = "project_files"
 
@@ -86,7 +153,12 @@ class ProjectFile(Base):
     size_bytes: Mapped[int] = mapped_column(Integer, default=0)
     s3_key: Mapped[str] = mapped_column(Text, nullable=False)
     confirmed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)  # SHA-256 of the object at s3_key
+    # Legacy single-blob symbols; files parsed since file_imports/file_exports were
+    # added keep their symbols there and in symbol_blob instead
     parsed_symbols: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Compressed definitions + calls (services.impact.symbol_store); non-null once parsed
+    symbol_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
 
     project: Mapped["Project"] = relationship(back_populates="files")  # type: ignore[name-defined]
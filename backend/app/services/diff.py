@@ -1,6 +1,13 @@
 import difflib
 
-def generate_diff(original: str, modified: str) -> dict:
+from app.services.impact.changed_symbols import detect_changed_symbols
+
+def generate_diff(original: str, modified: str, path: str | None = None) -> dict:
+    """
+    Unified-diff hunks between two versions of a file. With a path, also
+    reports the exported symbols the edit touches ("changed_symbols"); None
+    there means the file could not be analysed.
+    """
     original_lines = original.splitlines(keepends=True)
     modified_lines = modified.splitlines(keepends=True)
     
@@ -65,5 +72,5 @@ def generate_diff(original: str, modified: str) -> dict:
         "changed_lines": list(set(changed_lines)),
         "additions": additions,
         "deletions": deletions,
-        "changed_symbols": [] # We could extract symbols if we cross-ref AST here, but omitting for basic diff
+        "changed_symbols": detect_changed_symbols(path, original, modified) if path else [],
     }
@@ -0,0 +1,147 @@
+"""
+Transitive impact ("blast radius") over a cached ProjectGraph.
+Walks reverse edges breadth-first from the changed component. Symbols flow
+along each hop: a dependent is hit when it imports one of the symbols that
+reach the component it depends on, and only those symbols travel further,
+which is how a re-export chain carries a change. Edges without symbols
+(wildcard/side-effect/package imports) pass everything through.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from app.core.config import settings
+from app.services.impact.graph_cache import ProjectGraph
+
+# Changed symbols that no edge names share one bit; only symbol-less edges carry it
+_UNREFERENCED = 1
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class ImpactHit:
+    component_id: str
+    depth: int
+    # Changed symbols reaching this component; None means "any of them"
+    symbols: frozenset[str] | None
+
+    def to_dict(self) -> dict:
+        return {
+            "component_id": self.component_id,
+            "depth": self.depth,
+            "symbols": sorted(self.symbols) if self.symbols is not None else None,
+        }
+
+
+@dataclass
+class BlastRadius:
+    origin: str
+    max_depth: int
+    # hops[0] holds the direct dependents, hops[1] their dependents, ...
+    hops: list[list[ImpactHit]] = field(default_factory=list)
+    _graph: ProjectGraph | None = field(default=None, repr=False)
+    _first_hop: dict[str, int] = field(default_factory=dict, repr=False)
+    _reached: dict[str, int] = field(default_factory=dict, repr=False)
+
+    @property
+    def hits(self) -> list[ImpactHit]:
+        return [hit for hop in self.hops for hit in hop]
+
+    @property
+    def component_ids(self) -> set[str]:
+        return set(self._first_hop)
+
+    def via(self, hit: ImpactHit) -> set[str]:
+        """
+        Components on the previous hop whose changed symbols this one imports,
+        i.e. the links that put it in the blast radius. Computed on demand so
+        the traversal itself never touches per-edge data.
+        """
+        graph = self._graph
+        if graph is None:
+            return set()
+        out = set()
+        for target in graph.forward.get(hit.component_id, {}):
+            hop = 0 if target == self.origin else self._first_hop.get(target)
+            if hop == hit.depth - 1 and graph.edge_mask(hit.component_id, target) & self._reached[target]:
+                out.add(target)
+        return out
+
+    def to_dict(self) -> dict:
+        return {
+            "origin": self.origin,
+            "max_depth": self.max_depth,
+            "hops": [[hit.to_dict() for hit in hop] for hop in self.hops],
+        }
+
+
+def compute_blast_radius(
+    graph: ProjectGraph,
+    component_id: str,
+    changed_symbols: Iterable[str] | None = None,
+    max_depth: int | None = None,
+) -> BlastRadius:
+    """
+    Returns every component that transitively depends on the changed symbols
+    of component_id, grouped by hop, up to max_depth hops. changed_symbols=None
+    treats the whole component as changed.
+
+    The walk runs once per changed symbol over that symbol's layer of the
+    graph (ProjectGraph.symbol_index), with set operations per hop instead of
+    per-edge Python work. A component is reported once, at the first hop any
+    changed symbol reaches it, with the union of the symbols that reached it.
+    Cycles are safe: each walk visits a component at most once.
+    """
+    max_depth = max_depth if max_depth is not None else settings.impact_max_depth
+    bits, layers = graph.symbol_index()
+
+    if changed_symbols is None:
+        start = list(layers)
+        unreferenced: frozenset[str] = frozenset()
+    else:
+        changed = set(changed_symbols)
+        start = sorted({bits.get(symbol, _UNREFERENCED) for symbol in changed})
+        unreferenced = frozenset(s for s in changed if s not in bits)
+
+    first_hop: dict[str, int] = {}
+    reached: dict[str, int] = {component_id: -1 if changed_symbols is None else sum(start)}
+    for bit in start:
+        layer = layers[bit]
+        visited = {component_id}
+        frontier = (component_id,)
+        for depth in range(1, max_depth + 1):
+            step = set()
+            for target in frontier:
+                sources = layer.get(target)
+                if sources:
+                    step |= sources
+            step -= visited
+            if not step:
+                break
+            visited |= step
+            for source in step:
+                reached[source] = reached.get(source, 0) | bit
+                if first_hop.get(source, max_depth + 1) > depth:
+                    first_hop[source] = depth
+            frontier = step
+
+    result = BlastRadius(component_id, max_depth, _graph=graph, _first_hop=first_hop, _reached=reached)
+    names = {bit: symbol for symbol, bit in bits.items()}
+    everything = sum(layers)
+    decoded: dict[int, frozenset[str] | None] = {}
+    result.hops = [[] for _ in range(max(first_hop.values(), default=0))]
+    for source, hop in first_hop.items():
+        mask = reached[source]
+        symbols = decoded.get(mask, _MISSING)
+        if symbols is _MISSING:
+            # Many components end up with the same symbol set; decode each mask once
+            if changed_symbols is None and mask == everything:
+                symbols = None
+            else:
+                symbols = frozenset({name for bit, name in names.items() if mask & bit})
+                if mask & _UNREFERENCED:
+                    symbols |= unreferenced
+            decoded[mask] = symbols
+        result.hops[hop - 1].append(ImpactHit(source, hop, symbols))
+    return result
@@ -0,0 +1,120 @@
+"""
+Changed-symbol detection for drafts.
+Parses the original and (incrementally) the modified source, maps the
+changed line ranges of a line diff onto definition ranges on each side and
+compares export signatures, so an edit only reports the exported symbols it
+actually touches.
+Edits to private helpers are carried to the exported definitions calling them.
+"""
+from __future__ import annotations
+
+import logging
+
+from app.services.impact.extractors.base import ParsedFile
+from app.services.impact.incremental import line_opcodes, parse_edit
+from app.services.language_detector import detect_language
+
+logger = logging.getLogger(__name__)
+
+# Languages where leading whitespace is syntax, so re-indenting is a real change
+_INDENT_SENSITIVE = {"python"}
+
+
+def changed_line_ranges(original: str, modified: str, language: str = "") -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """
+    Returns the changed (start, end) line ranges, 1-based and inclusive, of the
+    original and of the modified text. Whitespace-only edits and inserted or
+    removed blank lines are not changes.
+    """
+    keep_indent = language in _INDENT_SENSITIVE
+    a = _normalise(original.splitlines(), keep_indent)
+    b = _normalise(modified.splitlines(), keep_indent)
+
+    old_ranges: list[tuple[int, int]] = []
+    new_ranges: list[tuple[int, int]] = []
+    for tag, i1, i2, j1, j2 in line_opcodes(a, b):
+        if tag == "equal" or not any(a[i1:i2]) and not any(b[j1:j2]):
+            continue
+        if i2 > i1:
+            old_ranges.append((i1 + 1, i2))
+        if j2 > j1:
+            new_ranges.append((j1 + 1, j2))
+    return old_ranges, new_ranges
+
+
+def detect_changed_symbols(path: str, original: str, modified: str, language: str | None = None) -> list[str] | None:
+    """
+    Exported symbols of a file that an edit adds, removes or touches.
+    Returns None when the file's language has no extractor or parsing fails,
+    in which case callers should assume every export changed.
+    """
+    language = language or detect_language(path)
+    try:
+        parsed = parse_edit(path, original.encode("utf8"), modified.encode("utf8"), language)
+    except Exception as e:
+        logger.warning("Could not parse %s for changed symbols: %s", path, e)
+        return None
+    if parsed is None:
+        return None
+    before, after = parsed
+
+    old_ranges, new_ranges = changed_line_ranges(original, modified, language)
+    changed = _touched_exports(before, old_ranges) | _touched_exports(after, new_ranges)
+
+    # Exports that appeared, disappeared or changed signature
+    old_signatures = {e.name: e.signature for e in before.exports}
+    new_signatures = {e.name: e.signature for e in after.exports}
+    for name in old_signatures.keys() | new_signatures.keys():
+        if old_signatures.get(name) != new_signatures.get(name):
+            changed.add(name)
+    return sorted(changed)
+
+
+def _normalise(lines: list[str], keep_indent: bool) -> list[str]:
+    if keep_indent:
+        return [line.rstrip() if line.strip() else "" for line in lines]
+    return [" ".join(line.split()) for line in lines]
+
+
+def _overlaps(start: int, end: int, ranges: list[tuple[int, int]]) -> bool:
+    return any(start <= r_end and r_start <= end for r_start, r_end in ranges)
+
+
+def _touched_exports(pf: ParsedFile, ranges: list[tuple[int, int]]) -> set[str]:
+    """Exports of pf whose export statement, local definition or callees fall in ranges."""
+    if not ranges:
+        return set()
+    parents = {d.name: d.parent for d in pf.definitions}
+    top_level = {d.name for d in pf.definitions if d.parent is None}
+
+    touched = {d.name for d in pf.definitions if _overlaps(d.start_line, d.end_line, ranges)}
+
+    # A touched helper changes every definition that calls it, transitively
+    callers: dict[str, set[str]] = {}
+    for call in pf.calls:
+        if call.parent_def:
+            callers.setdefault(call.callee.rsplit(".", 1)[-1], set()).add(call.parent_def)
+    pending = list(touched)
+    while pending:
+        for caller in callers.get(pending.pop(), ()):
+            if caller not in touched:
+                touched.add(caller)
+                pending.append(caller)
+
+    # Methods and nested definitions change their owners too
+    for name in list(touched):
+        name = parents.get(name)
+        while name is not None and name not in touched:
+            touched.add(name)
+            name = parents.get(name)
+
+    changed = set()
+    for e in pf.exports:
+        # export default foo names its local binding in the signature
+        local = e.signature if e.kind == "default" else e.name
+        if _overlaps(e.line, e.end_line or e.line, ranges) or local in touched:
+            changed.add(e.name)
+        elif not e.end_line and local not in top_level:
+            # Nothing says where the exported value lives, so assume the edit reached it
+            changed.add(e.name)
+    return changed
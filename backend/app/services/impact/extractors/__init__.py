@@ -5,6 +5,7 @@ from .go import GoExtractor
 from .java import JavaExtractor
 from .php import PHPExtractor
 from .python_ext import PythonExtractor
+from .registry import EXTRACTOR_VERSION, EXTRACTORS, get_extractor, is_parseable, parse_source
 from .ruby import RubyExtractor
 from .rust import RustExtractor
 from .typescript import TypeScriptExtractor
@@ -14,4 +15,5 @@ __all__ = [
     "CExtractor", "CppExtractor", "CSharpExtractor", "GoExtractor",
     "JavaExtractor", "PHPExtractor", "PythonExtractor", "RubyExtractor",
     "RustExtractor", "TypeScriptExtractor",
+    "EXTRACTOR_VERSION", "EXTRACTORS", "get_extractor", "is_parseable", "parse_source",
 ]
@@ -3,15 +3,24 @@ Base data classes and abstract extractor that all language extractors inherit.
 """
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import sys
+import threading
+from abc import ABC
+from collections.abc import Callable
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from typing import ClassVar
 
-from tree_sitter import Node
+from tree_sitter import Node, Tree
+
+from app.services.impact.parser_pool import get_parser
 
 
 # ── Data classes (the unified symbol format) ───────────────────────────────────
+# Slotted: graph building holds one of these per symbol for every file in the
+# project, millions of objects on large repos.
 
-@dataclass
+@dataclass(slots=True)
 class Import:
     source: str
     symbols: list[str] = field(default_factory=list)
@@ -20,15 +29,18 @@ class Import:
     line: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Export:
     name: str
     kind: str  # "function" | "class" | "type" | "variable" | "default"
     signature: str = ""
     line: int = 0
+    # Last line of the exporting statement or declarator; 0 when the statement
+    # only names a binding defined elsewhere (export { a }, export default a)
+    end_line: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Definition:
     name: str
     kind: str  # "function" | "class" | "method" | "interface" | "type" | "variable"
@@ -38,14 +50,14 @@ class Definition:
     parent: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Call:
     callee: str
     line: int = 0
     parent_def: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFile:
     path: str
     language: str
@@ -65,7 +77,7 @@ class ParsedFile:
                 for i in self.imports
             ],
             "exports": [
-                {"name": e.name, "kind": e.kind, "signature": e.signature, "line": e.line}
+                {"name": e.name, "kind": e.kind, "signature": e.signature, "line": e.line, "end_line": e.end_line}
                 for e in self.exports
             ],
             "definitions": [
@@ -79,48 +91,241 @@ class ParsedFile:
             ],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ParsedFile":
+        """
+        Inverse of to_dict(); rebuilds a ParsedFile from a parsed_symbols row.
+        Names, kinds and paths are interned, since the same identifiers recur
+        across every file that imports or calls them.
+        """
+        intern = sys.intern
+        return cls(
+            path=intern(data.get("path", "")),
+            language=intern(data.get("language", "")),
+            imports=[Import(**_interned(i, "source", "symbols")) for i in data.get("imports", [])],
+            # Rows written before the extractor registry stored bare export names
+            exports=[Export(name=intern(e), kind="variable") if isinstance(e, str)
+                     else Export(**_interned(e, "name", "kind", "signature"))
+                     for e in data.get("exports", [])],
+            definitions=[Definition(**_interned(d, "name", "kind", "signature", "parent"))
+                         for d in data.get("definitions", [])],
+            calls=[Call(**_interned(c, "callee", "parent_def")) for c in data.get("calls", [])],
+        )
+
+
+def _interned(row: dict, *keys: str) -> dict:
+    """Copy of a to_dict() row with the given string (or list of string) fields interned."""
+    row = dict(row)
+    for key in keys:
+        value = row.get(key)
+        if isinstance(value, str):
+            row[key] = sys.intern(value)
+        elif isinstance(value, list):
+            row[key] = [sys.intern(v) for v in value]
+    return row
+
+
+# ── Single-pass visitor ────────────────────────────────────────────────────────
+
+@dataclass
+class VisitContext:
+    """State shared by the handlers during one walk of a tree."""
+    source_bytes: bytes
+    result: ParsedFile
+    # Scratch space for handlers, e.g. de-duplication keys
+    seen: set = field(default_factory=set)
+    # Name of the innermost named function around the node being handled
+    scope: str | None = None
+    # Exports held back until the whole file is seen (Python __all__)
+    pending_exports: list[Export] = field(default_factory=list)
+    all_names: set[str] = field(default_factory=set)
+
+
+def handles(*node_types: str):
+    """Registers an extractor method as the visitor handler for the given node types."""
+    def decorator(fn):
+        fn._handles = node_types
+        return fn
+    return decorator
+
 
 # ── Base extractor ─────────────────────────────────────────────────────────────
 
+# Node types whose `name` field names an enclosing function / class
+FUNCTION_TYPES = frozenset({
+    "function_declaration", "method_definition", "arrow_function",
+    "function_expression", "function_definition", "method_declaration",
+    "function_item",  # Rust
+})
+CLASS_TYPES = frozenset({
+    "class_declaration", "class_definition", "class_body",
+    "struct_item", "impl_item",
+})
+
+# Identifiers longer than this are rarely repeated, so aren't worth interning
+_INTERN_MAX_BYTES = 64
+
+# Per-thread identifier intern table (`strings`) of the extraction in progress
+_active = threading.local()
+
+
+class ScopeStack:
+    """
+    Named functions open at the current point of a pre-order walk, as
+    (end_byte, name) innermost last. Anything ending before the next node
+    starts is closed, so each lookup is amortised O(1) instead of a climb
+    up the node's ancestors.
+    """
+    __slots__ = ("open", "outer")
+
+    def __init__(self, outer: str | None = None):
+        self.open: list[tuple[int, str]] = []
+        # Enclosing function of the walk's root itself
+        self.outer = outer
+
+    def push(self, node: Node, name: str) -> None:
+        self.open.append((node.end_byte, name))
+
+    def enclosing(self, node: Node) -> str | None:
+        """Innermost open function around node; node must not precede the last one asked about."""
+        open_ = self.open
+        start = node.start_byte
+        while open_ and open_[-1][0] <= start:
+            open_.pop()
+        return open_[-1][1] if open_ else self.outer
+
+
+@contextmanager
+def interned_strings():
+    """
+    Shares one str per distinct short identifier for the duration of the
+    block, so a name called a thousand times is decoded once. Nested blocks
+    reuse the outer table.
+    """
+    previous = getattr(_active, "strings", None)
+    _active.strings = {} if previous is None else previous
+    try:
+        yield
+    finally:
+        _active.strings = previous
+
+
+def decode_text(node: Node, source_bytes: bytes) -> str:
+    """Source text of node, interned while an interned_strings() block is open."""
+    start, end = node.start_byte, node.end_byte
+    strings = getattr(_active, "strings", None)
+    if strings is None or end - start > _INTERN_MAX_BYTES:
+        return source_bytes[start:end].decode("utf-8", errors="replace")
+    raw = source_bytes[start:end]
+    text = strings.get(raw)
+    if text is None:
+        text = strings[raw] = raw.decode("utf-8", errors="replace")
+    return text
+
+
 class BaseExtractor(ABC):
+    """
+    Extractors register @handles methods for the node types they read;
+    visit() dispatches every node of a tree to them in one walk.
+    """
     language: str = ""
+    # tree-sitter grammar key in parser_pool.GRAMMARS; defaults to `language`
+    grammar: str = ""
+    # True when an export depends on code outside its own statement (e.g. __all__),
+    # so exports can't be re-extracted one subtree at a time
+    file_scoped_exports: bool = False
+    # node type -> handlers, collected from @handles methods (including inherited ones)
+    handlers: ClassVar[dict[str, tuple[Callable, ...]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Keyed by method name, so an override replaces the handler it overrides
+        registered: dict[str, tuple[str, ...]] = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                node_types = getattr(attr, "_handles", None)
+                if node_types:
+                    registered[name] = node_types
+        handlers: dict[str, list[Callable]] = {}
+        for name, node_types in registered.items():
+            for node_type in node_types:
+                handlers.setdefault(node_type, []).append(getattr(cls, name))
+        cls.handlers = {node_type: tuple(fns) for node_type, fns in handlers.items()}
+
+    def parse(self, source_bytes: bytes) -> Tree:
+        """Parses source with this thread's pooled parser for the extractor's grammar."""
+        return get_parser(self.grammar or self.language).parse(source_bytes)
+
+    def parse_and_extract(self, source_bytes: bytes, file_path: str) -> ParsedFile:
+        return self.extract(self.parse(source_bytes).root_node, source_bytes, file_path)
 
     def extract(self, root: Node, source_bytes: bytes, file_path: str) -> ParsedFile:
-        result = ParsedFile(path=file_path, language=self.language)
-        try:
-            result.imports = self.extract_imports(root, source_bytes)
-        except Exception:
-            pass
-        try:
-            result.exports = self.extract_exports(root, source_bytes)
-        except Exception:
-            pass
-        try:
-            result.definitions = self.extract_definitions(root, source_bytes)
-        except Exception:
-            pass
-        try:
-            result.calls = self.extract_calls(root, source_bytes)
-        except Exception:
-            pass
-        return result
+        with interned_strings():
+            ctx = VisitContext(source_bytes, ParsedFile(path=file_path, language=self.language))
+            self.visit(root, ctx)
+            self.finish(ctx)
+            return ctx.result
+
+    def finish(self, ctx: VisitContext) -> None:
+        """Called once the whole tree has been seen, e.g. to apply file-level filters."""
+
+    def visit(self, root: Node, ctx: VisitContext) -> int:
+        """
+        Walks the subtree under root once with a TreeCursor, calling the
+        handlers registered for each node's type with ctx.scope set to the
+        enclosing function. A failing handler only loses that node's symbols.
+        Returns the number of nodes visited.
+        """
+        handlers = self.handlers
+        source_bytes = ctx.source_bytes
+        scopes = ScopeStack(self.find_enclosing_function(root, source_bytes))
+        cursor = root.walk()
+        visited = 0
+        while True:
+            node = cursor.node
+            node_type = node.type
+            visited += 1
+            fns = handlers.get(node_type)
+            if fns:
+                ctx.scope = scopes.enclosing(node)
+                for fn in fns:
+                    try:
+                        fn(self, node, ctx)
+                    except Exception:
+                        pass
+            if node_type in FUNCTION_TYPES:
+                name = self._function_name(node, source_bytes)
+                if name is not None:
+                    scopes.push(node, name)
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return visited
 
     # ── Shared utilities ───────────────────────────────────────────────────────
 
     def node_text(self, node: Node, source_bytes: bytes) -> str:
-        return source_bytes[node.start_byte:node.end_byte].decode("utf-8", errors="replace")
+        return decode_text(node, source_bytes)
 
     def walk_nodes(self, root: Node, target_types: set[str] | list[str]):
-        """Iterative DFS yielding all nodes whose type is in target_types."""
+        """Pre-order DFS yielding all nodes whose type is in target_types."""
         target_types = set(target_types)
-        stack = [root]
-        while stack:
-            node = stack.pop()
+        for node in self._preorder(root):
             if node.type in target_types:
                 yield node
-            # reversed so left-to-right order is preserved
-            for child in reversed(node.children):
-                stack.append(child)
+
+    @staticmethod
+    def _preorder(root: Node):
+        """Pre-order traversal; a TreeCursor avoids building a children list per node."""
+        cursor = root.walk()
+        while True:
+            yield cursor.node
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
 
     def children_of_type(self, node: Node, *types: str) -> list[Node]:
         """Returns direct children matching any of the given type names."""
@@ -134,27 +339,25 @@ class BaseExtractor(ABC):
         return None
 
     def find_enclosing_function(self, node: Node, source_bytes: bytes) -> str | None:
-        """Walk up the tree to find the name of the nearest enclosing function."""
-        FUNCTION_TYPES = {
-            "function_declaration", "method_definition", "arrow_function",
-            "function_expression", "function_definition", "method_declaration",
-            "function_item",  # Rust
-        }
+        """
+        Name of the nearest enclosing named function, found by walking up the
+        tree; visit() tracks the same thing for every node with a ScopeStack.
+        """
         current = node.parent
         while current is not None:
             if current.type in FUNCTION_TYPES:
-                name_node = current.child_by_field_name("name")
-                if name_node:
-                    return self.node_text(name_node, source_bytes)
+                name = self._function_name(current, source_bytes)
+                if name is not None:
+                    return name
             current = current.parent
         return None
 
+    def _function_name(self, node: Node, source_bytes: bytes) -> str | None:
+        name_node = node.child_by_field_name("name")
+        return self.node_text(name_node, source_bytes) if name_node else None
+
     def find_enclosing_class(self, node: Node, source_bytes: bytes) -> str | None:
         """Walk up the tree to find the name of the nearest enclosing class."""
-        CLASS_TYPES = {
-            "class_declaration", "class_definition", "class_body",
-            "struct_item", "impl_item",
-        }
         current = node.parent
         while current is not None:
             if current.type in CLASS_TYPES:
@@ -169,16 +372,17 @@ class BaseExtractor(ABC):
             current = current.parent
         return None
 
-    # ── Abstract interface ─────────────────────────────────────────────────────
+    # ── Per-kind extraction ────────────────────────────────────────────────────
+    # Each is a full visit(); extract() gets all four from one.
 
-    @abstractmethod
-    def extract_imports(self, root: Node, source_bytes: bytes) -> list[Import]: ...
+    def extract_imports(self, root: Node, source_bytes: bytes) -> list[Import]:
+        return self.extract(root, source_bytes, "").imports
 
-    @abstractmethod
-    def extract_exports(self, root: Node, source_bytes: bytes) -> list[Export]: ...
+    def extract_exports(self, root: Node, source_bytes: bytes) -> list[Export]:
+        return self.extract(root, source_bytes, "").exports
 
-    @abstractmethod
-    def extract_definitions(self, root: Node, source_bytes: bytes) -> list[Definition]: ...
+    def extract_definitions(self, root: Node, source_bytes: bytes) -> list[Definition]:
+        return self.extract(root, source_bytes, "").definitions
 
-    @abstractmethod
-    def extract_calls(self, root: Node, source_bytes: bytes) -> list[Call]: ...
+    def extract_calls(self, root: Node, source_bytes: bytes) -> list[Call]:
+        return self.extract(root, source_bytes, "").calls
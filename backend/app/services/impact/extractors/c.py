@@ -3,106 +3,97 @@ from __future__ import annotations
 
 from tree_sitter import Node
 
-from .base import BaseExtractor, Call, Definition, Export, Import
+from .base import BaseExtractor, Call, Definition, Export, Import, VisitContext, handles
 
 
 class CExtractor(BaseExtractor):
     language = "c"  # overridden at runtime for C++
 
-    def extract_imports(self, root: Node, source_bytes: bytes) -> list[Import]:
-        imports: list[Import] = []
-
-        for node in self.walk_nodes(root, ["preproc_include"]):
-            path_node = node.child_by_field_name("path")
-            if path_node is None:
-                continue
-            raw = self.node_text(path_node, source_bytes)
-            path = raw.strip('"<>')
-            imports.append(Import(
-                source=path,
-                symbols=[],      # C includes bring everything in
-                is_wildcard=True,
-                line=node.start_point[0] + 1,
-            ))
-
-        return imports
-
-    def extract_exports(self, root: Node, source_bytes: bytes) -> list[Export]:
+    # ── Imports ───────────────────────────────────────────────────────────────
+
+    @handles("preproc_include")
+    def _include(self, node: Node, ctx: VisitContext) -> None:
+        path_node = node.child_by_field_name("path")
+        if path_node is None:
+            return
+        raw = self.node_text(path_node, ctx.source_bytes)
+        path = raw.strip('"<>')
+        ctx.result.imports.append(Import(
+            source=path,
+            symbols=[],      # C includes bring everything in
+            is_wildcard=True,
+            line=node.start_point[0] + 1,
+        ))
+
+    # ── Exports ───────────────────────────────────────────────────────────────
+
+    @handles("function_definition", "declaration")
+    def _file_scope_function(self, node: Node, ctx: VisitContext) -> None:
         # Anything at file scope not marked 'static'
-        exports: list[Export] = []
-
-        for node in self.walk_nodes(root, ["function_definition", "declaration"]):
-            # Top-level only
-            if node.parent and node.parent.type not in ("translation_unit",):
-                continue
-
-            # Skip 'static' (file-private)
-            for child in node.children:
-                if child.type == "storage_class_specifier":
-                    if "static" in self.node_text(child, source_bytes):
-                        break
-            else:
-                declarator = self._find_function_declarator(node)
-                if declarator:
-                    name_node = self.find_child(declarator, "identifier")
-                    if name_node:
-                        exports.append(Export(
-                            name=self.node_text(name_node, source_bytes),
-                            kind="function",
-                            signature=self._func_sig(node, source_bytes),
-                            line=node.start_point[0] + 1,
-                        ))
-
-        return exports
-
-    def extract_definitions(self, root: Node, source_bytes: bytes) -> list[Definition]:
-        defs: list[Definition] = []
-
-        for node in self.walk_nodes(root, ["function_definition"]):
-            declarator = self._find_function_declarator(node)
-            if not declarator:
-                continue
-            name_node = self.find_child(declarator, "identifier")
-            if not name_node:
-                continue
-
-            defs.append(Definition(
-                name=self.node_text(name_node, source_bytes),
-                kind="function",
-                signature=self._func_sig(node, source_bytes),
-                start_line=node.start_point[0] + 1,
-                end_line=node.end_point[0] + 1,
-            ))
+        source_bytes = ctx.source_bytes
+        if node.parent and node.parent.type not in ("translation_unit",):
+            return
+        for child in node.children:
+            if child.type == "storage_class_specifier" and "static" in self.node_text(child, source_bytes):
+                return
 
-        # C++ class definitions
-        for node in self.walk_nodes(root, ["class_specifier", "struct_specifier"]):
-            name_node = node.child_by_field_name("name")
+        declarator = self._find_function_declarator(node)
+        if declarator:
+            name_node = self.find_child(declarator, "identifier")
             if name_node:
-                defs.append(Definition(
+                ctx.result.exports.append(Export(
                     name=self.node_text(name_node, source_bytes),
-                    kind="class",
-                    signature=self.node_text(name_node, source_bytes),
-                    start_line=node.start_point[0] + 1,
+                    kind="function",
+                    signature=self._func_sig(node, source_bytes),
+                    line=node.start_point[0] + 1,
                     end_line=node.end_point[0] + 1,
                 ))
 
-        return defs
+    # ── Definitions ───────────────────────────────────────────────────────────
+
+    @handles("function_definition")
+    def _function(self, node: Node, ctx: VisitContext) -> None:
+        declarator = self._find_function_declarator(node)
+        if not declarator:
+            return
+        name_node = self.find_child(declarator, "identifier")
+        if not name_node:
+            return
+        ctx.result.definitions.append(Definition(
+            name=self.node_text(name_node, ctx.source_bytes),
+            kind="function",
+            signature=self._func_sig(node, ctx.source_bytes),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        ))
+
+    @handles("class_specifier", "struct_specifier")
+    def _class(self, node: Node, ctx: VisitContext) -> None:
+        # C++ class definitions
+        name_node = node.child_by_field_name("name")
+        if name_node:
+            ctx.result.definitions.append(Definition(
+                name=self.node_text(name_node, ctx.source_bytes),
+                kind="class",
+                signature=self.node_text(name_node, ctx.source_bytes),
+                start_line=node.start_point[0] + 1,
+                end_line=node.end_point[0] + 1,
+            ))
 
-    def extract_calls(self, root: Node, source_bytes: bytes) -> list[Call]:
-        calls: list[Call] = []
+    # ── Calls ─────────────────────────────────────────────────────────────────
 
-        for node in self.walk_nodes(root, ["call_expression"]):
-            fn = node.child_by_field_name("function")
-            if fn is None:
-                continue
-            parent_def = self.find_enclosing_function(node, source_bytes)
-            calls.append(Call(
-                callee=self.node_text(fn, source_bytes),
-                line=node.start_point[0] + 1,
-                parent_def=parent_def,
-            ))
+    @handles("call_expression")
+    def _call(self, node: Node, ctx: VisitContext) -> None:
+        fn = node.child_by_field_name("function")
+        if fn is None:
+            return
+        ctx.result.calls.append(Call(
+            callee=self.node_text(fn, ctx.source_bytes),
+            line=node.start_point[0] + 1,
+            parent_def=ctx.scope,
+        ))
 
-        return calls
+    # ── Private helpers ───────────────────────────────────────────────────────
 
     def _find_function_declarator(self, node: Node) -> Node | None:
         for child in node.children:
@@ -3,119 +3,104 @@ from __future__ import annotations
 
 from tree_sitter import Node
 
-from .base import BaseExtractor, Call, Definition, Export, Import
+from .base import BaseExtractor, Call, Definition, Export, Import, VisitContext, handles
+
+# Member types exported when public, and the export kind of each
+_EXPORT_KINDS = {
+    "method_declaration": "function",
+    "class_declaration": "class",
+    "interface_declaration": "type",
+    "property_declaration": "variable",
+}
 
 
 class CSharpExtractor(BaseExtractor):
     language = "c_sharp"
 
-    def extract_imports(self, root: Node, source_bytes: bytes) -> list[Import]:
-        imports: list[Import] = []
+    # ── Imports ───────────────────────────────────────────────────────────────
 
+    @handles("using_directive")
+    def _using_directive(self, node: Node, ctx: VisitContext) -> None:
         # using System.Collections.Generic;
         # using Auth = Company.Auth.Service;
-        for node in self.walk_nodes(root, ["using_directive"]):
-            name_node = node.child_by_field_name("name")
-            alias_node = node.child_by_field_name("alias")
-            if name_node is None:
-                continue
-
-            path = self.node_text(name_node, source_bytes)
-            parts = path.split(".")
-            symbol = self.node_text(alias_node, source_bytes) if alias_node else parts[-1]
-            package = ".".join(parts[:-1]) if not alias_node else path
-
-            imports.append(Import(
-                source=package,
-                symbols=[symbol],
-                line=node.start_point[0] + 1,
-            ))
-
-        return imports
-
-    def extract_exports(self, root: Node, source_bytes: bytes) -> list[Export]:
-        exports: list[Export] = []
-
-        EXPORT_TYPES = [
-            "method_declaration", "class_declaration",
-            "interface_declaration", "property_declaration",
-        ]
-
-        kind_map = {
-            "method_declaration": "function",
-            "class_declaration": "class",
-            "interface_declaration": "type",
-            "property_declaration": "variable",
-        }
-
-        for node in self.walk_nodes(root, EXPORT_TYPES):
-            # Check for public modifier
-            has_public = False
-            for child in node.children:
-                if child.type == "modifier" and "public" in self.node_text(child, source_bytes):
-                    has_public = True
-                    break
-            if not has_public:
-                continue
-
-            name_node = node.child_by_field_name("name")
-            if name_node is None:
-                continue
-
-            exports.append(Export(
-                name=self.node_text(name_node, source_bytes),
-                kind=kind_map.get(node.type, "variable"),
-                signature=self._member_sig(node, source_bytes),
-                line=node.start_point[0] + 1,
-            ))
-
-        return exports
-
-    def extract_definitions(self, root: Node, source_bytes: bytes) -> list[Definition]:
-        defs: list[Definition] = []
-
-        for node in self.walk_nodes(root, ["method_declaration", "constructor_declaration"]):
-            name_node = node.child_by_field_name("name")
-            if not name_node:
-                continue
-            parent = self._enclosing_class(node, source_bytes)
-            defs.append(Definition(
-                name=self.node_text(name_node, source_bytes),
-                kind="method",
-                signature=self._member_sig(node, source_bytes),
+        source_bytes = ctx.source_bytes
+        name_node = node.child_by_field_name("name")
+        alias_node = node.child_by_field_name("alias")
+        if name_node is None:
+            return
+
+        path = self.node_text(name_node, source_bytes)
+        parts = path.split(".")
+        symbol = self.node_text(alias_node, source_bytes) if alias_node else parts[-1]
+        package = ".".join(parts[:-1]) if not alias_node else path
+
+        ctx.result.imports.append(Import(
+            source=package,
+            symbols=[symbol],
+            line=node.start_point[0] + 1,
+        ))
+
+    # ── Exports ───────────────────────────────────────────────────────────────
+
+    @handles(*_EXPORT_KINDS)
+    def _public_member(self, node: Node, ctx: VisitContext) -> None:
+        source_bytes = ctx.source_bytes
+        if not any(child.type == "modifier" and "public" in self.node_text(child, source_bytes)
+                   for child in node.children):
+            return
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return
+        ctx.result.exports.append(Export(
+            name=self.node_text(name_node, source_bytes),
+            kind=_EXPORT_KINDS[node.type],
+            signature=self._member_sig(node, source_bytes),
+            line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        ))
+
+    # ── Definitions ───────────────────────────────────────────────────────────
+
+    @handles("method_declaration", "constructor_declaration")
+    def _method(self, node: Node, ctx: VisitContext) -> None:
+        name_node = node.child_by_field_name("name")
+        if not name_node:
+            return
+        ctx.result.definitions.append(Definition(
+            name=self.node_text(name_node, ctx.source_bytes),
+            kind="method",
+            signature=self._member_sig(node, ctx.source_bytes),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+            parent=self._enclosing_class(node, ctx.source_bytes),
+        ))
+
+    @handles("class_declaration", "interface_declaration")
+    def _type(self, node: Node, ctx: VisitContext) -> None:
+        name_node = node.child_by_field_name("name")
+        if name_node:
+            ctx.result.definitions.append(Definition(
+                name=self.node_text(name_node, ctx.source_bytes),
+                kind="class" if node.type == "class_declaration" else "interface",
+                signature=self.node_text(name_node, ctx.source_bytes),
                 start_line=node.start_point[0] + 1,
                 end_line=node.end_point[0] + 1,
-                parent=parent,
             ))
 
-        for node in self.walk_nodes(root, ["class_declaration", "interface_declaration"]):
-            name_node = node.child_by_field_name("name")
-            if name_node:
-                defs.append(Definition(
-                    name=self.node_text(name_node, source_bytes),
-                    kind="class" if node.type == "class_declaration" else "interface",
-                    signature=self.node_text(name_node, source_bytes),
-                    start_line=node.start_point[0] + 1,
-                    end_line=node.end_point[0] + 1,
-                ))
-
-        return defs
-
-    def extract_calls(self, root: Node, source_bytes: bytes) -> list[Call]:
-        calls: list[Call] = []
-
-        for node in self.walk_nodes(root, ["invocation_expression"]):
-            fn = node.child_by_field_name("function")
-            if fn is None:
-                continue
-            parent_def = self.find_enclosing_function(node, source_bytes)
-            calls.append(Call(
-                callee=self.node_text(fn, source_bytes),
-                line=node.start_point[0] + 1,
-                parent_def=parent_def,
-            ))
+    # ── Calls ─────────────────────────────────────────────────────────────────
+
+    @handles("invocation_expression")
+    def _call(self, node: Node, ctx: VisitContext) -> None:
+        fn = node.child_by_field_name("function")
+        if fn is None:
+            return
+        ctx.result.calls.append(Call(
+            callee=self.node_text(fn, ctx.source_bytes),
+            line=node.start_point[0] + 1,
+            parent_def=ctx.scope,
+        ))
 
-        return calls
+    # ── Private helpers ───────────────────────────────────────────────────────
 
     def _member_sig(self, node: Node, source_bytes: bytes) -> str:
         ret = node.child_by_field_name("type")
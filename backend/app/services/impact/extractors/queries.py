@@ -0,0 +1,286 @@
+"""
+Query-based extraction engine.
+Each supported grammar gets one tree_sitter.Query holding every pattern its
+extractor needs, compiled once per process. A single Query.matches() call
+finds the interesting nodes in C, and each pattern's captures are turned
+straight into Import/Export/Definition/Call objects. Grammars without a spec,
+or whose spec does not compile against the installed grammar, keep using the
+hand-written extractor.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from tree_sitter import Node, Query
+
+from app.services.impact.parser_pool import get_language
+
+from .base import (
+    BaseExtractor, Call, Definition, Export, ParsedFile, ScopeStack, VisitContext, decode_text, interned_strings,
+)
+
+logger = logging.getLogger(__name__)
+
+# (extractor, node, captures, ctx); node is the pattern's @node capture
+Builder = Callable[[BaseExtractor, Node, dict[str, list[Node]], "QueryContext"], None]
+
+
+@dataclass
+class QueryContext(VisitContext):
+    # Named functions open at the current match
+    scopes: ScopeStack = field(default_factory=ScopeStack)
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    # (S-expression pattern, builder) pairs; each string must hold exactly one pattern
+    patterns: tuple[tuple[str, Builder], ...]
+
+
+class QueryEngine:
+    """A compiled QuerySpec for one grammar."""
+
+    def __init__(self, grammar: str, spec: QuerySpec):
+        self.grammar = grammar
+        self.spec = spec
+        self.query: Query = get_language(grammar).query("\n".join(p for p, _ in spec.patterns))
+        if self.query.pattern_count != len(spec.patterns):
+            raise ValueError(f"{grammar} query spec has {self.query.pattern_count} patterns, "
+                             f"expected {len(spec.patterns)}")
+        self.builders = [builder for _, builder in spec.patterns]
+
+    def extract(self, extractor: BaseExtractor, root: Node, source_bytes: bytes, file_path: str) -> ParsedFile:
+        result = ParsedFile(path=file_path, language=extractor.language)
+        ctx = QueryContext(source_bytes, result)
+
+        # Pre-order (outer nodes first) so scopes open before the calls inside them
+        matches = []
+        for pattern, captures in self.query.matches(root):
+            node = captures["node"][0]
+            matches.append((node.start_byte, -node.end_byte, pattern, node, captures))
+        matches.sort(key=lambda m: m[:3])
+
+        builders = self.builders
+        with interned_strings():
+            for _, _, pattern, node, captures in matches:
+                try:
+                    builders[pattern](extractor, node, captures, ctx)
+                except Exception:
+                    pass
+        # File-level filters are the hand-written extractor's, as after a visit
+        extractor.finish(ctx)
+        return result
+
+
+# grammar -> engine, or None when the grammar has no usable spec
+_engines: dict[str, QueryEngine | None] = {}
+_engines_lock = threading.Lock()
+
+
+def get_query_engine(grammar: str) -> QueryEngine | None:
+    """Returns the compiled engine for a grammar, compiling it on first use."""
+    if grammar in _engines:
+        return _engines[grammar]
+    with _engines_lock:
+        if grammar not in _engines:
+            spec = QUERY_SPECS.get(grammar)
+            engine = None
+            if spec is not None:
+                try:
+                    engine = QueryEngine(grammar, spec)
+                except Exception as e:
+                    # Grammar missing, ABI-incompatible, or node types renamed
+                    logger.warning("Query engine unavailable for %s, using hand-written extractor: %s", grammar, e)
+            _engines[grammar] = engine
+    return _engines[grammar]
+
+
+# ── Shared builders ────────────────────────────────────────────────────────────
+
+_text = decode_text
+
+
+def _enclosing(ctx: QueryContext, node: Node) -> str | None:
+    """Innermost open named function around node (what find_enclosing_function returns)."""
+    return ctx.scopes.enclosing(node)
+
+
+def _open_scope(ctx: QueryContext, node: Node, name: str) -> None:
+    ctx.scopes.enclosing(node)
+    ctx.scopes.push(node, name)
+
+
+def _signature(caps: dict[str, list[Node]], source_bytes: bytes, return_sep: str) -> str:
+    sig = _text(caps["name"][0], source_bytes)
+    if "params" in caps:
+        sig += _text(caps["params"][0], source_bytes)
+    if "ret" in caps:
+        sig += return_sep + _text(caps["ret"][0], source_bytes)
+    return sig
+
+
+def _identifier_call(ex, node, caps, ctx) -> None:
+    ctx.result.calls.append(Call(
+        callee=_text(caps["callee"][0], ctx.source_bytes),
+        line=node.start_point[0] + 1,
+        parent_def=_enclosing(ctx, node),
+    ))
+
+
+def _member_call(ex, node, caps, ctx) -> None:
+    src = ctx.source_bytes
+    ctx.result.calls.append(Call(
+        callee=f"{_text(caps['object'][0], src)}.{_text(caps['property'][0], src)}",
+        line=node.start_point[0] + 1,
+        parent_def=_enclosing(ctx, node),
+    ))
+
+
+def _named_definition(kind: str):
+    def build(ex, node, caps, ctx) -> None:
+        name = _text(caps["name"][0], ctx.source_bytes)
+        ctx.result.definitions.append(Definition(
+            name=name, kind=kind, signature=name,
+            start_line=node.start_point[0] + 1, end_line=node.end_point[0] + 1,
+        ))
+    return build
+
+
+# ── TypeScript / JavaScript ────────────────────────────────────────────────────
+
+def _ts_import(ex, node, caps, ctx) -> None:
+    ex._import_statement(node, ctx)
+
+
+def _ts_require(ex, node, caps, ctx) -> None:
+    ex._require_call(node, ctx)
+
+
+def _ts_export(ex, node, caps, ctx) -> None:
+    ex._export_statement(node, ctx)
+
+
+def _ts_function(ex, node, caps, ctx) -> None:
+    src = ctx.source_bytes
+    name = _text(caps["name"][0], src)
+    _open_scope(ctx, node, name)
+
+    key = (name, node.start_point[0])
+    if key in ctx.seen:
+        return
+    ctx.seen.add(key)
+
+    parent = ex._method_parent_class(node, src) if node.type == "method_definition" else None
+    ctx.result.definitions.append(Definition(
+        name=name,
+        kind="method" if parent else "function",
+        signature=_signature(caps, src, ": "),
+        start_line=node.start_point[0] + 1,
+        end_line=node.end_point[0] + 1,
+        parent=parent,
+    ))
+
+
+def _ts_declarator(ex, node, caps, ctx) -> None:
+    ex._variable_declarator(node, ctx)
+    value = node.child_by_field_name("value")
+    if ex._is_anonymous_function(value):
+        _open_scope(ctx, value, _text(caps["name"][0], ctx.source_bytes))
+
+
+def _ts_type(ex, node, caps, ctx) -> None:
+    name = _text(caps["name"][0], ctx.source_bytes)
+    ctx.result.definitions.append(Definition(
+        name=name,
+        kind="interface" if node.type == "interface_declaration" else "type",
+        signature=name,
+        start_line=node.start_point[0] + 1,
+        end_line=node.end_point[0] + 1,
+    ))
+
+
+_TS_FUNCTION_FIELDS = "name: (_) @name parameters: (_)? @params return_type: (_)? @ret"
+
+TYPESCRIPT = QuerySpec(patterns=(
+    ("(import_statement source: (_)) @node", _ts_import),
+    ('((call_expression function: (identifier) @fn arguments: (arguments)) @node (#eq? @fn "require"))', _ts_require),
+    ("(export_statement) @node", _ts_export),
+    (f"[(function_declaration {_TS_FUNCTION_FIELDS}) (method_definition {_TS_FUNCTION_FIELDS})"
+     f" (function_expression {_TS_FUNCTION_FIELDS})] @node", _ts_function),
+    ("(variable_declarator name: (identifier) @name) @node", _ts_declarator),
+    ("(class_declaration name: (_) @name) @node", _named_definition("class")),
+    ("[(interface_declaration name: (_) @name) (type_alias_declaration name: (_) @name)] @node", _ts_type),
+    ("(call_expression function: (identifier) @callee) @node", _identifier_call),
+    ("(call_expression function: (member_expression object: (_) @object property: (_) @property)) @node",
+     _member_call),
+))
+
+
+# ── Python ─────────────────────────────────────────────────────────────────────
+
+def _py_import(ex, node, caps, ctx) -> None:
+    ctx.result.imports.extend(ex._plain_imports(node, ctx.source_bytes))
+
+
+def _py_from_import(ex, node, caps, ctx) -> None:
+    ctx.result.imports.append(ex._from_import(node, ctx.source_bytes))
+
+
+def _py_all(ex, node, caps, ctx) -> None:
+    ctx.all_names.update(ex._all_names(caps["right"][0], ctx.source_bytes))
+
+
+def _py_module_function(ex, node, caps, ctx) -> None:
+    ctx.pending_exports.append(Export(
+        name=_text(caps["name"][0], ctx.source_bytes), kind="function",
+        signature=_signature(caps, ctx.source_bytes, " -> "),
+        line=node.start_point[0] + 1, end_line=node.end_point[0] + 1,
+    ))
+
+
+def _py_module_class(ex, node, caps, ctx) -> None:
+    name = _text(caps["name"][0], ctx.source_bytes)
+    ctx.pending_exports.append(Export(
+        name=name, kind="class", signature=name, line=node.start_point[0] + 1, end_line=node.end_point[0] + 1,
+    ))
+
+
+def _py_function(ex, node, caps, ctx) -> None:
+    src = ctx.source_bytes
+    name = _text(caps["name"][0], src)
+    _open_scope(ctx, node, name)
+    parent = ex._method_class(node, src)
+    ctx.result.definitions.append(Definition(
+        name=name,
+        kind="method" if parent else "function",
+        signature=_signature(caps, src, " -> "),
+        start_line=node.start_point[0] + 1,
+        end_line=node.end_point[0] + 1,
+        parent=parent,
+    ))
+
+
+_PY_FUNCTION_FIELDS = "name: (_) @name parameters: (_)? @params return_type: (_)? @ret"
+
+PYTHON = QuerySpec(patterns=(
+    ("(import_statement) @node", _py_import),
+    ("(import_from_statement) @node", _py_from_import),
+    ('((assignment left: (identifier) @left right: (_) @right) @node (#eq? @left "__all__"))', _py_all),
+    (f"(module (function_definition {_PY_FUNCTION_FIELDS}) @node)", _py_module_function),
+    ("(module (class_definition name: (_) @name) @node)", _py_module_class),
+    (f"(function_definition {_PY_FUNCTION_FIELDS}) @node", _py_function),
+    ("(class_definition name: (_) @name) @node", _named_definition("class")),
+    ("(call function: (identifier) @callee) @node", _identifier_call),
+    ("(call function: (attribute object: (_) @object attribute: (_) @property)) @node", _member_call),
+))
+
+
+# grammar key (parser_pool.GRAMMARS) -> spec
+QUERY_SPECS: dict[str, QuerySpec] = {
+    "typescript": TYPESCRIPT,
+    "tsx": TYPESCRIPT,
+    "python": PYTHON,
+}
@@ -0,0 +1,91 @@
+"""
+Language dispatch for the extractors.
+Maps detect_language() results onto BaseExtractor instances and picks the
+tree-sitter grammar per file, so a whole project is parsed in one pass
+regardless of its language mix.
+"""
+from __future__ import annotations
+
+import os
+
+from tree_sitter import Node
+
+from app.core.config import settings
+from app.services.impact.parser_pool import get_parser
+from app.services.language_detector import detect_language
+
+from .base import BaseExtractor, ParsedFile
+from .c import CExtractor, CppExtractor
+from .csharp import CSharpExtractor
+from .go import GoExtractor
+from .java import JavaExtractor
+from .php import PHPExtractor
+from .python_ext import PythonExtractor
+from .queries import get_query_engine
+from .ruby import RubyExtractor
+from .rust import RustExtractor
+from .typescript import TypeScriptExtractor
+
+# Bump whenever extractor output changes so cached parse results are not reused
+EXTRACTOR_VERSION = 6
+
+# Extractors hold no per-file state, so one instance per language is shared
+EXTRACTORS: dict[str, BaseExtractor] = {
+    "typescript": TypeScriptExtractor(),
+    "javascript": TypeScriptExtractor(),
+    "python": PythonExtractor(),
+    "go": GoExtractor(),
+    "rust": RustExtractor(),
+    "java": JavaExtractor(),
+    "c_sharp": CSharpExtractor(),
+    "php": PHPExtractor(),
+    "ruby": RubyExtractor(),
+    "c": CExtractor(),
+    "cpp": CppExtractor(),
+}
+
+# The TypeScript grammar is a superset of JS; JSX needs the tsx variant
+_JSX_EXTENSIONS = {".tsx", ".jsx"}
+
+
+def get_extractor(language: str) -> BaseExtractor | None:
+    return EXTRACTORS.get(language)
+
+
+def is_parseable(language: str) -> bool:
+    return language in EXTRACTORS
+
+
+def grammar_for(file_path: str, extractor: BaseExtractor) -> str:
+    if isinstance(extractor, TypeScriptExtractor):
+        _, ext = os.path.splitext(file_path)
+        return "tsx" if ext.lower() in _JSX_EXTENSIONS else "typescript"
+    return extractor.grammar or extractor.language
+
+
+def parse_source(file_path: str, source_bytes: bytes, language: str | None = None) -> ParsedFile | None:
+    """
+    Parses one file with the extractor registered for its language.
+    Returns None for languages without an extractor (markdown, json, ...).
+    """
+    language = language or detect_language(file_path)
+    extractor = EXTRACTORS.get(language)
+    if extractor is None:
+        return None
+
+    grammar = grammar_for(file_path, extractor)
+    tree = get_parser(grammar).parse(source_bytes)
+    parsed = extract_symbols(extractor, grammar, tree.root_node, source_bytes, file_path)
+    parsed.language = language
+    return parsed
+
+
+def extract_symbols(extractor: BaseExtractor, grammar: str, root: Node, source_bytes: bytes, file_path: str) -> ParsedFile:
+    """
+    Extracts the symbols under root through the grammar's query engine when
+    one is available, else through the hand-written extractor.
+    """
+    engine = get_query_engine(grammar) if settings.parse_query_engine else None
+    if engine is not None:
+        return engine.extract(extractor, root, source_bytes, file_path)
+    return extractor.extract(root, source_bytes, file_path)
@@ -3,25 +3,32 @@ from __future__ import annotations
 
 from tree_sitter import Node
 
-from .base import BaseExtractor, Call, Definition, Export, Import
+from .base import BaseExtractor, Call, Definition, Export, Import, VisitContext, handles
+
+# Item types that can be `pub`, and the export kind of each
+_PUB_KINDS = {
+    "function_item": "function",
+    "struct_item": "class",
+    "enum_item": "type",
+    "trait_item": "type",
+    "type_item": "type",
+}
 
 
 class RustExtractor(BaseExtractor):
     language = "rust"
 
-    def extract_imports(self, root: Node, source_bytes: bytes) -> list[Import]:
-        imports: list[Import] = []
-
-        for node in self.walk_nodes(root, ["use_declaration"]):
-            path_text = self.node_text(node, source_bytes)
-            path_text = path_text.replace("use ", "").rstrip(";").strip()
-            symbols = self._extract_use_tree_symbols(node, source_bytes)
-            imports.append(Import(
-                source=path_text, symbols=symbols,
-                line=node.start_point[0] + 1,
-            ))
+    # ── Imports ───────────────────────────────────────────────────────────────
 
-        return imports
+    @handles("use_declaration")
+    def _use_declaration(self, node: Node, ctx: VisitContext) -> None:
+        path_text = self.node_text(node, ctx.source_bytes)
+        path_text = path_text.replace("use ", "").rstrip(";").strip()
+        symbols = self._extract_use_tree_symbols(node, ctx.source_bytes)
+        ctx.result.imports.append(Import(
+            source=path_text, symbols=symbols,
+            line=node.start_point[0] + 1,
+        ))
 
     def _extract_use_tree_symbols(self, node: Node, source_bytes: bytes) -> list[str]:
         symbols: list[str] = []
@@ -31,92 +38,75 @@ class RustExtractor(BaseExtractor):
                 symbols.append(text)
         return symbols
 
-    def extract_exports(self, root: Node, source_bytes: bytes) -> list[Export]:
-        exports: list[Export] = []
-
-        PUB_NODE_TYPES = [
-            "function_item", "struct_item", "enum_item",
-            "trait_item", "type_item",
-        ]
-
-        for node in self.walk_nodes(root, PUB_NODE_TYPES):
-            vis = node.child_by_field_name("visibility")
-            if vis is None:
-                continue
-            if "pub" not in self.node_text(vis, source_bytes):
-                continue
-            name_node = node.child_by_field_name("name")
-            if not name_node:
-                continue
-
-            kind_map = {
-                "function_item": "function",
-                "struct_item": "class",
-                "enum_item": "type",
-                "trait_item": "type",
-                "type_item": "type",
-            }
-
-            exports.append(Export(
-                name=self.node_text(name_node, source_bytes),
-                kind=kind_map.get(node.type, "variable"),
-                signature=self.node_text(name_node, source_bytes),
-                line=node.start_point[0] + 1,
-            ))
-
-        return exports
-
-    def extract_definitions(self, root: Node, source_bytes: bytes) -> list[Definition]:
-        defs: list[Definition] = []
-
-        for node in self.walk_nodes(root, ["function_item"]):
-            name_node = node.child_by_field_name("name")
-            if not name_node:
-                continue
-            parent = self._find_impl_type(node, source_bytes)
-            defs.append(Definition(
-                name=self.node_text(name_node, source_bytes),
-                kind="method" if parent else "function",
-                signature=self._func_sig(node, source_bytes),
+    # ── Exports ───────────────────────────────────────────────────────────────
+
+    @handles(*_PUB_KINDS)
+    def _pub_item(self, node: Node, ctx: VisitContext) -> None:
+        source_bytes = ctx.source_bytes
+        vis = node.child_by_field_name("visibility")
+        if vis is None or "pub" not in self.node_text(vis, source_bytes):
+            return
+        name_node = node.child_by_field_name("name")
+        if not name_node:
+            return
+        ctx.result.exports.append(Export(
+            name=self.node_text(name_node, source_bytes),
+            kind=_PUB_KINDS[node.type],
+            signature=self.node_text(name_node, source_bytes),
+            line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        ))
+
+    # ── Definitions ───────────────────────────────────────────────────────────
+
+    @handles("function_item")
+    def _function(self, node: Node, ctx: VisitContext) -> None:
+        name_node = node.child_by_field_name("name")
+        if not name_node:
+            return
+        parent = self._find_impl_type(node, ctx.source_bytes)
+        ctx.result.definitions.append(Definition(
+            name=self.node_text(name_node, ctx.source_bytes),
+            kind="method" if parent else "function",
+            signature=self._func_sig(node, ctx.source_bytes),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+            parent=parent,
+        ))
+
+    @handles("struct_item", "enum_item")
+    def _type(self, node: Node, ctx: VisitContext) -> None:
+        name_node = node.child_by_field_name("name")
+        if name_node:
+            ctx.result.definitions.append(Definition(
+                name=self.node_text(name_node, ctx.source_bytes),
+                kind="class",
+                signature=self.node_text(name_node, ctx.source_bytes),
                 start_line=node.start_point[0] + 1,
                 end_line=node.end_point[0] + 1,
-                parent=parent,
             ))
 
-        for node in self.walk_nodes(root, ["struct_item", "enum_item"]):
-            name_node = node.child_by_field_name("name")
-            if name_node:
-                defs.append(Definition(
-                    name=self.node_text(name_node, source_bytes),
-                    kind="class",
-                    signature=self.node_text(name_node, source_bytes),
-                    start_line=node.start_point[0] + 1,
-                    end_line=node.end_point[0] + 1,
+    # ── Calls ─────────────────────────────────────────────────────────────────
+
+    @handles("call_expression")
+    def _call(self, node: Node, ctx: VisitContext) -> None:
+        source_bytes = ctx.source_bytes
+        fn = node.child_by_field_name("function")
+        if fn is None:
+            return
+        if fn.type in ("identifier", "scoped_identifier"):
+            ctx.result.calls.append(Call(callee=self.node_text(fn, source_bytes),
+                                         line=node.start_point[0] + 1, parent_def=ctx.scope))
+        elif fn.type == "field_expression":
+            obj = fn.child_by_field_name("value")
+            field_ = fn.child_by_field_name("field")
+            if obj and field_:
+                ctx.result.calls.append(Call(
+                    callee=f"{self.node_text(obj, source_bytes)}.{self.node_text(field_, source_bytes)}",
+                    line=node.start_point[0] + 1, parent_def=ctx.scope,
                 ))
 
-        return defs
-
-    def extract_calls(self, root: Node, source_bytes: bytes) -> list[Call]:
-        calls: list[Call] = []
-
-        for node in self.walk_nodes(root, ["call_expression"]):
-            fn = node.child_by_field_name("function")
-            if fn is None:
-                continue
-            parent_def = self.find_enclosing_function(node, source_bytes)
-            if fn.type in ("identifier", "scoped_identifier"):
-                calls.append(Call(callee=self.node_text(fn, source_bytes),
-                                  line=node.start_point[0] + 1, parent_def=parent_def))
-            elif fn.type == "field_expression":
-                obj = fn.child_by_field_name("value")
-                field_ = fn.child_by_field_name("field")
-                if obj and field_:
-                    calls.append(Call(
-                        callee=f"{self.node_text(obj, source_bytes)}.{self.node_text(field_, source_bytes)}",
-                        line=node.start_point[0] + 1, parent_def=parent_def,
-                    ))
-
-        return calls
+    # ── Private helpers ───────────────────────────────────────────────────────
 
     def _func_sig(self, node: Node, source_bytes: bytes) -> str:
         name = node.child_by_field_name("name")
@@ -0,0 +1,219 @@
+"""
+In-process cache of project component graphs.
+Each project's component_dependencies are loaded once into forward/reverse
+adjacency maps and reused until the project's graph epoch in Redis moves on.
+Writers bump the epoch and publish it; the API process listens and drops its
+copy immediately, other processes (Celery workers) compare epochs on read.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.component import Component, ComponentDependency
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "graph:invalidate"
+
+
+def _epoch_key(project_id: str) -> str:
+    return f"graph:epoch:{project_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class GraphEdge:
+    id: str
+    source: str
+    target: str
+    dependency_type: str
+    confidence: float
+    detection_method: str
+    symbols: frozenset[str]
+
+
+@dataclass
+class ProjectGraph:
+    """
+    Component graph of one project. forward[a][b] is the edge "a depends on b";
+    reverse[b][a] is the same edge seen from the dependency.
+    """
+    project_id: str
+    epoch: int
+    names: dict[str, str] = field(default_factory=dict)
+    forward: dict[str, dict[str, GraphEdge]] = field(default_factory=dict)
+    reverse: dict[str, dict[str, GraphEdge]] = field(default_factory=dict)
+    _symbol_index: tuple | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_edges(cls, project_id: str, epoch: int, names: dict[str, str], edges) -> ProjectGraph:
+        graph = cls(project_id, epoch, dict(names))
+        for edge in edges:
+            graph.forward.setdefault(edge.source, {})[edge.target] = edge
+            graph.reverse.setdefault(edge.target, {})[edge.source] = edge
+        return graph
+
+    def depends_on(self, component_id: str) -> list[GraphEdge]:
+        return list(self.forward.get(component_id, {}).values())
+
+    def depended_by(self, component_id: str) -> list[GraphEdge]:
+        return list(self.reverse.get(component_id, {}).values())
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self.forward.values())
+
+    def symbol_index(self) -> tuple[dict[str, int], dict[int, dict[str, frozenset[str]]]]:
+        """
+        Per-symbol reverse adjacency for traversals: every symbol named on an
+        edge gets a bit, and layers[bit][target] holds the components importing
+        that symbol from target. Edges without symbols appear in every layer,
+        including layer 1, which stands for symbols no edge names. Built on
+        first use; a cached graph is never mutated, so it stays valid.
+        """
+        if self._symbol_index is None:
+            bits: dict[str, int] = {}
+            for sources in self.reverse.values():
+                for edge in sources.values():
+                    for symbol in edge.symbols:
+                        if symbol not in bits:
+                            bits[symbol] = 1 << (len(bits) + 1)
+
+            layers: dict[int, dict[str, set[str]]] = {bit: {} for bit in (1, *bits.values())}
+            for target, sources in self.reverse.items():
+                for source, edge in sources.items():
+                    for bit in ([bits[s] for s in edge.symbols] if edge.symbols else layers):
+                        layers[bit].setdefault(target, set()).add(source)
+
+            self._symbol_index = (bits, {
+                bit: {target: frozenset(sources) for target, sources in layer.items()}
+                for bit, layer in layers.items()
+            })
+        return self._symbol_index
+
+    def edge_mask(self, source: str, target: str) -> int:
+        """Bitmask of the symbols on the source -> target edge; -1 if it has none."""
+        bits, _ = self.symbol_index()
+        edge = self.forward[source][target]
+        mask = 0
+        for symbol in edge.symbols:
+            mask |= bits[symbol]
+        return mask or -1
+
+
+# project_id -> graph, least recently used first
+_graphs: OrderedDict[str, ProjectGraph] = OrderedDict()
+# Highest epoch announced per project; older loads are never cached
+_announced: dict[str, int] = {}
+# True while this process receives invalidations, so hits skip the epoch check
+_listening = False
+
+
+async def get_project_graph(project_id: str, db: AsyncSession) -> ProjectGraph:
+    """Returns the cached graph for a project, loading it from Postgres when stale."""
+    graph = _graphs.get(project_id)
+    if graph is not None and _listening:
+        _graphs.move_to_end(project_id)
+        return graph
+
+    epoch = await _current_epoch(project_id)
+    if graph is not None and epoch is not None and graph.epoch == epoch:
+        _graphs.move_to_end(project_id)
+        return graph
+
+    graph = await load_project_graph(project_id, db, epoch or 0)
+    if epoch is not None and epoch >= _announced.get(project_id, 0):
+        _graphs[project_id] = graph
+        _graphs.move_to_end(project_id)
+        while len(_graphs) > settings.graph_cache_max_projects:
+            _graphs.popitem(last=False)
+    return graph
+
+
+async def load_project_graph(project_id: str, db: AsyncSession, epoch: int = 0) -> ProjectGraph:
+    res = await db.execute(select(Component.id, Component.name).where(Component.project_id == project_id))
+    names = {cid: name for cid, name in res.all()}
+
+    res = await db.execute(
+        select(
+            ComponentDependency.id,
+            ComponentDependency.source_component_id,
+            ComponentDependency.target_component_id,
+            ComponentDependency.dependency_type,
+            ComponentDependency.confidence,
+            ComponentDependency.detection_method,
+            ComponentDependency.symbols,
+        ).where(ComponentDependency.project_id == project_id)
+    )
+    edges = (
+        GraphEdge(r.id, r.source_component_id, r.target_component_id, r.dependency_type,
+                  r.confidence, r.detection_method, frozenset(r.symbols or ()))
+        for r in res.all()
+    )
+    return ProjectGraph.from_edges(project_id, epoch, names, edges)
+
+
+async def invalidate_project_graph(project_id: str) -> None:
+    """
+    Moves the project's graph epoch forward and announces it. Call after
+    committing any change to its components or component_dependencies.
+    """
+    _graphs.pop(project_id, None)
+    try:
+        r = await get_redis()
+        epoch = await r.incr(_epoch_key(project_id))
+        await r.publish(INVALIDATION_CHANNEL, f"{project_id}:{epoch}")
+    except Exception as e:
+        logger.warning("Graph cache invalidation for %s not published: %s", project_id, e)
+
+
+async def invalidation_listener() -> None:
+    """Drops cached graphs as epochs are announced; run for the process lifetime."""
+    global _listening
+    try:
+        r = await get_redis()
+        pubsub = r.pubsub()
+        await pubsub.subscribe(INVALIDATION_CHANNEL)
+    except Exception as e:
+        logger.warning("Graph cache invalidation listener unavailable: %s", e)
+        return
+
+    # Anything cached before the subscription may have missed an announcement
+    _graphs.clear()
+    _listening = True
+    logger.info("Started graph cache invalidation listener.")
+    try:
+        async for message in pubsub.listen():
+            if message["type"] != "message":
+                continue
+            project_id, _, epoch = message["data"].rpartition(":")
+            _announced[project_id] = max(_announced.get(project_id, 0), int(epoch or 0))
+            _graphs.pop(project_id, None)
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logger.error(f"Graph cache invalidation listener stopped: {e}")
+    finally:
+        _listening = False
+        try:
+            await pubsub.unsubscribe(INVALIDATION_CHANNEL)
+        except Exception:
+            pass
+
+
+async def _current_epoch(project_id: str) -> int | None:
+    """The project's graph epoch, or None if Redis is unreachable (don't cache)."""
+    try:
+        r = await get_redis()
+        value = await r.get(_epoch_key(project_id))
+    except Exception as e:
+        logger.warning("Graph epoch lookup failed: %s", e)
+        return None
+    return int(value) if value is not None else 0
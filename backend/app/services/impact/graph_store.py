@@ -0,0 +1,388 @@
+"""
+Persistence for the project dependency graph.
+File-level edges live in file_dependencies (symbols=None for imports that
+resolve to a file but name nothing it exports), component edges in
+component_dependencies, and one row per imported symbol in symbol_references
+(the reverse index impact lookups query). A full rebuild replaces all three;
+an incremental update re-resolves only the files touched by a change and
+applies the diff. Both read only the file_imports / file_exports tables,
+never the definitions and calls in symbol blobs.
+"""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+
+from sqlalchemy import delete, insert, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.core.storage import download_many
+from app.models.component import ComponentDependency, FileDependency, ProjectFile, SymbolReference
+from app.services.impact.extractors.base import Import, ParsedFile
+from app.services.impact.graph import aggregate_component_edges, confirm_symbols, resolve_imports
+from app.services.impact.graph_cache import invalidate_project_graph
+from app.services.impact.resolvers import ModuleResolver, ProjectConfigs, ProjectPathIndex, compiled_configs, is_config_path
+from app.services.impact.symbol_store import load_export_names, load_imports, stream_imports
+
+logger = logging.getLogger(__name__)
+
+# symbol_references.symbol for imports that don't name symbols (wildcard/package)
+ANY_SYMBOL = "*"
+
+_EDGE_CONSTRAINT = "uq_component_dependencies_edge"
+# Sorted, de-duplicated union of an existing edge's symbols and the incoming row's
+_MERGED_SYMBOLS = text(
+    "(SELECT COALESCE(jsonb_agg(DISTINCT e.symbol ORDER BY e.symbol), '[]'::jsonb) FROM jsonb_array_elements_text("
+    "COALESCE(component_dependencies.symbols, '[]'::jsonb) || COALESCE(excluded.symbols, '[]'::jsonb)) AS e(symbol))"
+)
+
+
+async def load_module_resolver(project_id: str, path_index: ProjectPathIndex, db: AsyncSession) -> ModuleResolver:
+    """
+    Builds the import resolver for a project. Config files the resolvers read
+    (tsconfig/jsconfig/package.json, go.mod) are only downloaded and compiled
+    when their S3 keys changed since the last build in this process.
+    """
+    res = await db.execute(
+        select(ProjectFile.path, ProjectFile.s3_key)
+        .where(ProjectFile.project_id == project_id)
+        .where(or_(ProjectFile.path.like("%.json"), ProjectFile.path.like("%go.mod")))
+    )
+    config_files = sorted((r.path, r.s3_key) for r in res.all() if is_config_path(r.path))
+    fingerprint = tuple(config_files)
+
+    configs = compiled_configs.get(project_id, fingerprint)
+    if configs is None:
+        contents = await download_many(key for _, key in config_files)
+        files = {}
+        for (path, _), content in zip(config_files, contents):
+            if isinstance(content, BaseException):
+                logger.warning("Could not load %s for import resolution: %s", path, content)
+                continue
+            files[path] = content
+        configs = ProjectConfigs.compile(files)
+        compiled_configs.put(project_id, fingerprint, configs)
+
+    return ModuleResolver(path_index, configs)
+
+
+def _path_index_query(project_id: str):
+    """Files imports can resolve to: the parsed files of a project (both builds use this)."""
+    return (
+        select(ProjectFile.id, ProjectFile.path, ProjectFile.component_id)
+        .where(ProjectFile.project_id == project_id)
+        .where(ProjectFile.symbol_blob != None)
+    )
+
+
+def _add_edge(edges: dict, key: tuple[str, str], confirmed: list[str] | None) -> None:
+    """
+    Records one resolved import. Imports whose symbols the target doesn't
+    export still leave an edge with symbols=None, so a later change that
+    adds the export finds the importer; they never reach component edges.
+    """
+    if confirmed is None:
+        edges.setdefault(key, None)
+    elif edges.get(key) is None:
+        edges[key] = set(confirmed)
+    else:
+        edges[key].update(confirmed)
+
+
+async def rebuild_project_graph(project_id: str, db: AsyncSession, chunk_size: int | None = None) -> None:
+    """
+    Recomputes every file and component edge of a project from its parsed
+    imports and exports. Rows are streamed through server-side cursors and
+    imports are resolved one chunk at a time, so memory holds the path index,
+    export names and resulting edges, never every import of the project.
+    """
+    chunk_size = chunk_size or settings.graph_stream_chunk_size
+
+    path_by_id: dict[str, str] = {}
+    file_to_component_id: dict[str, str] = {}
+    result = await db.stream(_path_index_query(project_id).execution_options(yield_per=chunk_size))
+    async for r in result:
+        path_by_id[r.id] = r.path
+        if r.component_id:
+            file_to_component_id[r.path] = r.component_id
+    id_by_path = {path: fid for fid, path in path_by_id.items()}
+    resolver = await load_module_resolver(project_id, ProjectPathIndex(id_by_path), db)
+    exports_by_path = {
+        path_by_id[fid]: names
+        for fid, names in (await load_export_names(db, project_id=project_id, chunk_size=chunk_size)).items()
+        if fid in path_by_id
+    }
+
+    await db.execute(delete(SymbolReference).where(SymbolReference.project_id == project_id))
+    await db.execute(delete(FileDependency).where(FileDependency.project_id == project_id))
+    await db.execute(
+        delete(ComponentDependency)
+        .where(ComponentDependency.project_id == project_id)
+        .where(ComponentDependency.detection_method == "parser")
+    )
+
+    edges: dict[tuple[str, str], set[str] | None] = {}
+    references: list[dict] = []
+    async for source_id, imports in stream_imports(db, project_id, chunk_size):
+        path = path_by_id.get(source_id)
+        if path is None:
+            continue
+        pf = ParsedFile(path=path, language="", imports=imports)
+        for imp, target_path in resolve_imports(pf, resolver):
+            confirmed = confirm_symbols(imp, exports_by_path.get(target_path, set()))
+            _add_edge(edges, (path, target_path), confirmed)
+            if confirmed is not None:
+                references += _reference_rows(project_id, source_id, id_by_path[target_path], imp, confirmed)
+        if len(references) >= chunk_size:
+            await db.execute(insert(SymbolReference), references)
+            references = []
+    if references:
+        await db.execute(insert(SymbolReference), references)
+    edge_rows = [
+        (source, target, sorted(symbols) if symbols is not None else None)
+        for (source, target), symbols in edges.items()
+    ]
+
+    for i in range(0, len(edge_rows), chunk_size):
+        await db.execute(insert(FileDependency), [
+            {
+                "project_id": project_id,
+                "source_file_id": id_by_path[source_path],
+                "target_file_id": id_by_path[target_path],
+                "symbols": symbols,
+            }
+            for source_path, target_path, symbols in edge_rows[i:i + chunk_size]
+        ])
+    file_edges = [edge for edge in edge_rows if edge[2] is not None]
+    await upsert_component_edges(
+        project_id, aggregate_component_edges(file_edges, file_to_component_id), db, chunk_size=chunk_size,
+    )
+
+    await db.commit()
+    await invalidate_project_graph(project_id)
+
+
+async def update_project_graph(project_id: str, changed_file_ids: set[str] | list[str], db: AsyncSession) -> None:
+    """
+    Incrementally refreshes the graph after the content of existing files changed.
+
+    Only edges whose source or resolved target is a changed file are
+    recomputed: the changed files and every file whose imports resolve to one
+    of them (confirmed or not) are re-resolved,
+    the resulting file edges are diffed against file_dependencies, and only the
+    component pairs those edges touch are re-aggregated. Adding or removing
+    files can make unrelated imports (un)resolvable, so those flows should use
+    rebuild_project_graph instead.
+    """
+    changed = set(changed_file_ids)
+    if not changed:
+        return
+
+    # Narrow path index, the same one a rebuild uses: no symbols are loaded here
+    res = await db.execute(_path_index_query(project_id))
+    path_by_id: dict[str, str] = {}
+    component_by_id: dict[str, str | None] = {}
+    for r in res.all():
+        path_by_id[r.id] = r.path
+        component_by_id[r.id] = r.component_id
+    id_by_path = {path: fid for fid, path in path_by_id.items()}
+    resolver = await load_module_resolver(project_id, ProjectPathIndex(id_by_path), db)
+
+    # Sources to re-resolve: the changed files plus every file whose imports
+    # resolve to one, including imports no export confirmed yet
+    res = await db.execute(
+        select(FileDependency.source_file_id)
+        .where(FileDependency.target_file_id.in_(changed))
+    )
+    source_ids = (changed | set(res.scalars().all())) & path_by_id.keys()
+
+    res = await db.execute(select(FileDependency).where(FileDependency.source_file_id.in_(source_ids)))
+    old_edges = {(fd.source_file_id, fd.target_file_id): fd for fd in res.scalars().all()}
+
+    # Resolve imports of the sources against the path index
+    resolved: list[tuple[str, Import, str]] = []
+    for source_id, imports in (await load_imports(db, file_ids=source_ids)).items():
+        pf = ParsedFile(path=path_by_id[source_id], language="", imports=imports)
+        for imp, target_path in resolve_imports(pf, resolver):
+            resolved.append((source_id, imp, id_by_path[target_path]))
+
+    # Exports are only needed for the files those imports point at
+    target_ids = {target_id for _, _, target_id in resolved}
+    exports_by_id = await load_export_names(db, file_ids=target_ids)
+
+    new_edges: dict[tuple[str, str], set[str] | None] = {}
+    references: list[dict] = []
+    for source_id, imp, target_id in resolved:
+        confirmed = confirm_symbols(imp, exports_by_id.get(target_id, set()))
+        _add_edge(new_edges, (source_id, target_id), confirmed)
+        if confirmed is not None:
+            references += _reference_rows(project_id, source_id, target_id, imp, confirmed)
+
+    # Symbol references of the re-resolved sources are rewritten wholesale
+    await db.execute(delete(SymbolReference).where(SymbolReference.source_file_id.in_(source_ids)))
+    if references:
+        await db.execute(insert(SymbolReference), references)
+
+    # Apply the file edge diff
+    for key, fd in old_edges.items():
+        if key not in new_edges:
+            await db.delete(fd)
+        elif fd.symbols != _edge_symbols(new_edges[key]):
+            fd.symbols = _edge_symbols(new_edges[key])
+    for (source_id, target_id), symbols in new_edges.items():
+        if (source_id, target_id) not in old_edges:
+            db.add(FileDependency(
+                project_id=project_id,
+                source_file_id=source_id,
+                target_file_id=target_id,
+                symbols=_edge_symbols(symbols),
+            ))
+    await db.flush()
+
+    # Component pairs whose aggregate may have changed
+    pairs = set()
+    for source_id, target_id in old_edges.keys() | new_edges.keys():
+        pair = (component_by_id.get(source_id), component_by_id.get(target_id))
+        if pair[0] and pair[1] and pair[0] != pair[1]:
+            pairs.add(pair)
+    if not pairs:
+        await db.commit()
+        return
+
+    await _refresh_component_pairs(project_id, pairs, db)
+    await db.commit()
+    await invalidate_project_graph(project_id)
+
+
+async def find_symbol_references(
+    project_id: str,
+    target_file_ids: set[str] | list[str],
+    symbols: set[str] | list[str] | None,
+    db: AsyncSession,
+) -> list[dict]:
+    """
+    Files importing any of the given symbols from the target files, one entry
+    per import line. Wildcard/package imports of a target always match;
+    symbols=None matches every reference to the targets.
+    """
+    target_ids = list(target_file_ids)
+    if not target_ids:
+        return []
+    query = (
+        select(
+            SymbolReference.symbol, SymbolReference.line, SymbolReference.target_file_id,
+            ProjectFile.id, ProjectFile.path, ProjectFile.component_id,
+        )
+        .join(ProjectFile, SymbolReference.source_file_id == ProjectFile.id)
+        .where(SymbolReference.project_id == project_id)
+        .where(SymbolReference.target_file_id.in_(target_ids))
+    )
+    if symbols is not None:
+        query = query.where(SymbolReference.symbol.in_([*symbols, ANY_SYMBOL]))
+    res = await db.execute(query.order_by(ProjectFile.path, SymbolReference.line))
+    return [
+        {
+            "file_id": r.id,
+            "file_path": r.path,
+            "component_id": r.component_id,
+            "target_file_id": r.target_file_id,
+            "symbol": r.symbol,
+            "line": r.line,
+        }
+        for r in res.all()
+    ]
+
+
+async def upsert_component_edges(
+    project_id: str,
+    edges: dict[tuple[str, str], set[str]],
+    db: AsyncSession,
+    *,
+    merge: bool = True,
+    chunk_size: int | None = None,
+) -> None:
+    """
+    Writes parser import edges (component pair -> symbols) with batched
+    INSERT ... ON CONFLICT on uq_component_dependencies_edge, so re-runs never
+    duplicate an edge. merge=True unions the symbols with an existing row's;
+    merge=False replaces them, touching only rows whose symbols differ.
+    """
+    if not edges:
+        return
+    chunk_size = chunk_size or settings.graph_stream_chunk_size
+    stmt = pg_insert(ComponentDependency)
+    if merge:
+        stmt = stmt.on_conflict_do_update(constraint=_EDGE_CONSTRAINT, set_={"symbols": _MERGED_SYMBOLS})
+    else:
+        stmt = stmt.on_conflict_do_update(
+            constraint=_EDGE_CONSTRAINT,
+            set_={"symbols": stmt.excluded.symbols},
+            where=ComponentDependency.symbols.is_distinct_from(stmt.excluded.symbols),
+        )
+    rows = [
+        {
+            "project_id": project_id,
+            "source_component_id": source_component_id,
+            "target_component_id": target_component_id,
+            "dependency_type": "import",
+            "confidence": 1.0,
+            "detection_method": "parser",
+            "symbols": sorted(symbols),
+        }
+        for (source_component_id, target_component_id), symbols in edges.items()
+    ]
+    for i in range(0, len(rows), chunk_size):
+        await db.execute(stmt, rows[i:i + chunk_size])
+
+
+def _edge_symbols(symbols: set[str] | None) -> list[str] | None:
+    return sorted(symbols) if symbols is not None else None
+
+
+def _reference_rows(project_id: str, source_id: str, target_id: str, imp: Import, symbols: list[str]) -> list[dict]:
+    return [
+        {
+            "project_id": project_id,
+            "source_file_id": source_id,
+            "target_file_id": target_id,
+            "symbol": symbol,
+            "line": imp.line or 0,
+        }
+        for symbol in (symbols or [ANY_SYMBOL])
+    ]
+
+
+async def _refresh_component_pairs(project_id: str, pairs: set[tuple[str, str]], db: AsyncSession) -> None:
+    """Re-aggregates the given component pairs from file_dependencies and applies the diff."""
+    src_file = aliased(ProjectFile)
+    tgt_file = aliased(ProjectFile)
+    source_components = {s for s, _ in pairs}
+    target_components = {t for _, t in pairs}
+
+    res = await db.execute(
+        select(src_file.component_id, tgt_file.component_id, FileDependency.symbols)
+        .join(src_file, FileDependency.source_file_id == src_file.id)
+        .join(tgt_file, FileDependency.target_file_id == tgt_file.id)
+        .where(FileDependency.project_id == project_id)
+        .where(src_file.component_id.in_(source_components))
+        .where(tgt_file.component_id.in_(target_components))
+    )
+    aggregated: dict[tuple[str, str], set[str]] = defaultdict(set)
+    for source_component_id, target_component_id, symbols in res.all():
+        pair = (source_component_id, target_component_id)
+        # symbols=None marks an import no export confirms: not a component edge
+        if pair in pairs and symbols is not None:
+            aggregated[pair].update(symbols)
+
+    await upsert_component_edges(project_id, aggregated, db, merge=False)
+    stale = pairs - aggregated.keys()
+    if stale:
+        await db.execute(
+            delete(ComponentDependency)
+            .where(ComponentDependency.project_id == project_id)
+            .where(ComponentDependency.detection_method == "parser")
+            .where(tuple_(ComponentDependency.source_component_id, ComponentDependency.target_component_id).in_(stale))
+        )
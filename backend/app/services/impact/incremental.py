@@ -0,0 +1,303 @@
+"""
+Incremental reparsing of edited files.
+Recently parsed trees are kept, with their extraction results, in a bounded
+per-process cache. A new version of a cached file is parsed by replaying the
+line diff as Tree.edit() calls so tree-sitter reuses the unchanged subtrees,
+and only the top-level nodes touched by the edit (or reported by
+Tree.changed_ranges) are re-extracted; every other symbol is carried over
+from the old result with its lines shifted.
+"""
+from __future__ import annotations
+
+import bisect
+import copy
+import difflib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+from tree_sitter import Node, Point, Tree
+
+from app.core.config import settings
+from app.services.impact.extractors import get_extractor
+from app.services.impact.extractors.base import BaseExtractor, ParsedFile
+from app.services.impact.extractors.registry import extract_symbols, grammar_for
+from app.services.impact.parse_cache import content_hash
+from app.services.impact.parser_pool import get_parser
+from app.services.language_detector import detect_language
+
+# Above this share of dirty top-level nodes a full extraction is cheaper
+_MAX_DIRTY_SHARE = 0.5
+
+
+@dataclass
+class _Entry:
+    parsed: ParsedFile
+    # None once an incremental parse consumed it (Tree.edit mutates in place)
+    tree: Tree | None
+
+
+class TreeCache:
+    """LRU of parsed trees keyed by (grammar, content hash)."""
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, grammar: str, digest: str) -> ParsedFile | None:
+        with self._lock:
+            entry = self._entries.get((grammar, digest))
+            if entry is None:
+                return None
+            self._entries.move_to_end((grammar, digest))
+            return entry.parsed
+
+    def take(self, grammar: str, digest: str) -> tuple[ParsedFile, Tree | None] | None:
+        """
+        Returns the cached result and a tree the caller may edit. Without
+        Tree.copy support in the bindings the cached tree itself is handed out
+        and the entry keeps only its ParsedFile.
+        """
+        with self._lock:
+            entry = self._entries.get((grammar, digest))
+            if entry is None:
+                return None
+            self._entries.move_to_end((grammar, digest))
+            tree = _copy_tree(entry.tree) if entry.tree is not None else None
+            if tree is None:
+                tree, entry.tree = entry.tree, None
+            return entry.parsed, tree
+
+    def put(self, grammar: str, digest: str, parsed: ParsedFile, tree: Tree | None) -> None:
+        with self._lock:
+            self._entries[(grammar, digest)] = _Entry(parsed, tree)
+            self._entries.move_to_end((grammar, digest))
+            limit = self.max_entries if self.max_entries is not None else settings.parse_tree_cache_size
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+tree_cache = TreeCache()
+
+
+def parse_edit(
+    path: str, old_source: bytes, new_source: bytes, language: str | None = None
+) -> tuple[ParsedFile, ParsedFile] | None:
+    """
+    Parses two versions of a file, the second incrementally from the first.
+    Returns (before, after), or None for languages without an extractor.
+    """
+    language = language or detect_language(path)
+    extractor = get_extractor(language)
+    if extractor is None:
+        return None
+    grammar = grammar_for(path, extractor)
+    parser = get_parser(grammar)
+
+    old_digest, new_digest = content_hash(old_source), content_hash(new_source)
+    cached_after = tree_cache.get(grammar, new_digest) if new_digest != old_digest else None
+    cached = tree_cache.take(grammar, old_digest)
+    if cached is not None and cached[1] is not None:
+        before, old_tree = cached
+    else:
+        old_tree = parser.parse(old_source)
+        before = cached[0] if cached is not None else _extract(extractor, grammar, old_tree.root_node, old_source, path, language)
+
+    if new_digest == old_digest or cached_after is not None:
+        tree_cache.put(grammar, old_digest, before, old_tree)
+        return before, cached_after or before
+
+    opcodes = line_opcodes(_lines(old_source), _lines(new_source))
+    edit_tree(old_tree, old_source, new_source, opcodes)
+    new_tree = parser.parse(new_source, old_tree)
+    dirty = _dirty_rows(opcodes, old_tree.changed_ranges(new_tree))
+    after = _extract_changed(extractor, grammar, new_tree, new_source, path, language, before, opcodes, dirty)
+
+    tree_cache.put(grammar, old_digest, before, None)
+    tree_cache.put(grammar, new_digest, after, new_tree)
+    return before, after
+
+
+# ── Tree edits ─────────────────────────────────────────────────────────────────
+
+def _lines(source: bytes) -> list[bytes]:
+    """Lines split on \\n only, as tree-sitter counts rows, newlines kept."""
+    parts = source.split(b"\n")
+    return [p + b"\n" for p in parts[:-1]] + ([parts[-1]] if parts[-1] else [])
+
+
+def line_opcodes(a: list, b: list) -> list[tuple[str, int, int, int, int]]:
+    """
+    SequenceMatcher opcodes between two line lists (0-based indices). The
+    common prefix and suffix are trimmed first: drafts mostly differ in a few
+    places, and the matcher is far slower on long runs of repeated lines.
+    """
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    opcodes = [("equal", 0, prefix, 0, prefix)] if prefix else []
+    matcher = difflib.SequenceMatcher(None, a[prefix:len(a) - suffix], b[prefix:len(b) - suffix], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(("equal", len(a) - suffix, len(a), len(b) - suffix, len(b)))
+    return opcodes
+
+
+def edit_tree(tree: Tree, old_source: bytes, new_source: bytes, opcodes) -> None:
+    """
+    Replays line-level opcodes as Tree.edit() calls. Edits are applied last to
+    first, so each one's start is still expressed in old-document coordinates.
+    """
+    old_offsets = _line_offsets(old_source)
+    new_offsets = _line_offsets(new_source)
+    for tag, i1, i2, j1, j2 in reversed(opcodes):
+        if tag == "equal":
+            continue
+        start = old_offsets[i1]
+        inserted = new_source[new_offsets[j1]:new_offsets[j2]]
+        tree.edit(
+            start_byte=start,
+            old_end_byte=old_offsets[i2],
+            new_end_byte=start + len(inserted),
+            start_point=Point(i1, 0),
+            old_end_point=_end_point(old_source[start:old_offsets[i2]], i1),
+            new_end_point=_end_point(inserted, i1),
+        )
+
+
+def _line_offsets(source: bytes) -> list[int]:
+    offsets = [0]
+    for line in _lines(source):
+        offsets.append(offsets[-1] + len(line))
+    return offsets
+
+
+def _end_point(text: bytes, start_row: int) -> Point:
+    newlines = text.count(b"\n")
+    return Point(start_row + newlines, len(text) - text.rfind(b"\n") - 1)
+
+
+def _dirty_rows(opcodes, changed_ranges) -> list[tuple[int, int]]:
+    """Row spans of the new tree whose syntax may differ from the old one."""
+    rows = []
+    for tag, _, _, j1, j2 in opcodes:
+        if tag != "equal":
+            # A deletion leaves no rows behind; its neighbours are what changed
+            rows.append((j1, j2 - 1) if j2 > j1 else (max(j1 - 1, 0), j1))
+    rows.extend((r.start_point[0], r.end_point[0]) for r in changed_ranges)
+    return rows
+
+
+# ── Extraction ─────────────────────────────────────────────────────────────────
+
+def _extract(extractor: BaseExtractor, grammar: str, root: Node, source: bytes, path: str, language: str) -> ParsedFile:
+    parsed = extract_symbols(extractor, grammar, root, source, path)
+    parsed.language = language
+    return parsed
+
+
+def _extract_changed(
+    extractor: BaseExtractor,
+    grammar: str,
+    tree: Tree,
+    source: bytes,
+    path: str,
+    language: str,
+    before: ParsedFile,
+    opcodes,
+    dirty: list[tuple[int, int]],
+) -> ParsedFile:
+    """Re-extracts the top-level nodes overlapping dirty rows and carries the rest over."""
+    root = tree.root_node
+    top = root.children
+    dirty_nodes = [
+        n for n in top
+        if any(n.start_point[0] <= end and start <= n.end_point[0] for start, end in dirty)
+    ]
+    if not top or len(dirty_nodes) > len(top) * _MAX_DIRTY_SHARE:
+        return _extract(extractor, grammar, root, source, path, language)
+
+    # Rows a carried-over symbol may sit on: inside a clean node, outside every dirty one
+    clean_rows = _merge_spans((n.start_point[0], n.end_point[0]) for n in top if n not in dirty_nodes)
+    dirty_rows = _merge_spans((n.start_point[0], n.end_point[0]) for n in dirty_nodes)
+    # Old 1-based line -> new 1-based line, for lines in unchanged blocks
+    blocks = [(i1 + 1, i2, j1 - i1) for tag, i1, i2, j1, _ in opcodes if tag == "equal"]
+    starts = [b[0] for b in blocks]
+
+    def shift(line: int) -> int | None:
+        k = bisect.bisect_right(starts, line) - 1
+        if k < 0 or line > blocks[k][1]:
+            return None
+        new_line = line + blocks[k][2]
+        row = new_line - 1
+        if _in_spans(row, clean_rows) and not _in_spans(row, dirty_rows):
+            return blocks[k][2]
+        return None
+
+    after = ParsedFile(path=path, language=language)
+    for name in ("imports", "exports", "definitions", "calls"):
+        kept = []
+        for item in getattr(before, name):
+            delta = shift(item.start_line if name == "definitions" else item.line)
+            if delta is None:
+                continue
+            if delta:
+                # Results are shared with the cache, so shifted items are copies
+                if name == "definitions":
+                    item = replace(item, start_line=item.start_line + delta, end_line=item.end_line + delta)
+                elif name == "exports" and item.end_line:
+                    item = replace(item, line=item.line + delta, end_line=item.end_line + delta)
+                else:
+                    item = replace(item, line=item.line + delta)
+            kept.append(item)
+        setattr(after, name, kept)
+
+    for node in dirty_nodes:
+        partial = extract_symbols(extractor, grammar, node, source, path)
+        after.imports += partial.imports
+        after.exports += partial.exports
+        after.definitions += partial.definitions
+        after.calls += partial.calls
+
+    if extractor.file_scoped_exports:
+        after.exports = extractor.extract_exports(root, source)
+
+    after.imports.sort(key=lambda i: i.line)
+    after.exports.sort(key=lambda e: e.line)
+    after.definitions.sort(key=lambda d: (d.start_line, d.end_line))
+    after.calls.sort(key=lambda c: c.line)
+    return after
+
+
+def _merge_spans(spans) -> list[tuple[int, int]]:
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _in_spans(row: int, spans: list[tuple[int, int]]) -> bool:
+    k = bisect.bisect_right(spans, (row, float("inf"))) - 1
+    return k >= 0 and spans[k][0] <= row <= spans[k][1]
+
+
+def _copy_tree(tree: Tree) -> Tree | None:
+    # Tree.copy()/__copy__ only exist in newer bindings
+    try:
+        return copy.copy(tree)
+    except TypeError:
+        return None
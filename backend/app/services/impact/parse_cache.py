@@ -0,0 +1,75 @@
+"""
+Content-addressed parse cache.
+Parse results are stored in Redis under (extractor version, grammar, SHA-256
+of the file bytes), so byte-identical files are never handed to tree-sitter
+twice, whichever project or path they come from.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.services.impact.extractors import EXTRACTOR_VERSION, get_extractor
+from app.services.impact.extractors.registry import grammar_for
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "parse"
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def cache_key(path: str, language: str, digest: str) -> str | None:
+    """Returns the cache key for a file, or None if its language has no extractor."""
+    extractor = get_extractor(language)
+    if extractor is None:
+        return None
+    return f"{_KEY_PREFIX}:v{EXTRACTOR_VERSION}:{grammar_for(path, extractor)}:{digest}"
+
+
+def _encode(symbols: dict) -> str:
+    # Path and language are per file, not per content; they are re-attached on read
+    return json.dumps({k: v for k, v in symbols.items() if k not in ("path", "language")})
+
+
+def _decode(raw: str, path: str, language: str) -> dict:
+    return {"path": path, "language": language, **json.loads(raw)}
+
+
+async def get_many(entries: list[tuple[str, str, str]]) -> list[dict | None]:
+    """
+    Looks up (path, language, cache_key) entries with a single MGET.
+    Returns parsed_symbols dicts aligned with entries, None for misses.
+    Redis errors are treated as misses; the cache is best-effort.
+    """
+    if not entries:
+        return []
+    try:
+        r = await get_redis()
+        raws = await r.mget([key for _, _, key in entries])
+    except Exception as e:
+        logger.warning("Parse cache lookup failed: %s", e)
+        return [None] * len(entries)
+    return [
+        _decode(raw, path, language) if raw is not None else None
+        for (path, language, _), raw in zip(entries, raws)
+    ]
+
+
+async def set_many(items: list[tuple[str, dict]]) -> None:
+    """Stores (cache_key, parsed_symbols) pairs in one pipelined round trip."""
+    if not items:
+        return
+    try:
+        r = await get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            for key, symbols in items:
+                pipe.set(key, _encode(symbols), ex=settings.parse_cache_ttl_seconds)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("Parse cache write failed: %s", e)
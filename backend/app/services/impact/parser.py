@@ -1,13 +1,10 @@
 import tree_sitter
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
-import tree_sitter_typescript as ts_ts
+from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-import os
 
-from app.models.component import ProjectFile, ComponentDependency, Component
-import uuid
+from app.services.impact.graph_store import rebuild_project_graph
+from app.services.impact.parser_pool import get_parser
 
 @dataclass
 class ImportInfo:
@@ -98,14 +95,9 @@ class TypeScriptExtractor:
         return []
 
 def parse_file(file_path: str, content: str) -> ParsedFile:
-    lang = tree_sitter.Language(ts_ts.language_typescript())
-    parser = tree_sitter.Parser()
-    # Handle API changes between ts0.21 and 0.23:
-    try:
-        parser.set_language(lang)
-    except Exception:
-        parser.language = lang # tree_sitter >0.22 property
-        
+    # Pooled per thread; grammar loading and the set_language probe happen once
+    parser = get_parser("typescript")
+
     content_bytes = content.encode("utf8")
     tree = parser.parse(content_bytes)
 
@@ -119,86 +111,8 @@ def parse_file(file_path: str, content: str) -> ParsedFile:
     )
 
 async def build_dependency_graph(project_id: str, db: AsyncSession):
-    # Fetch all ProjectFile rows for the project
-    res = await db.execute(
-        select(ProjectFile)
-        .where(ProjectFile.project_id == project_id)
-        .where(ProjectFile.parsed_symbols != None)
-    )
-    files = res.scalars().all()
-    
-    # Build export_index
-    export_index = {}
-    path_to_file = {}
-    
-    for f in files:
-        # Standardize path
-        norm_path = os.path.normpath(f.path)
-        path_to_file[norm_path] = f
-        
-        symbols = f.parsed_symbols or {}
-        exports = symbols.get("exports", [])
-        for ex in exports:
-            export_index[ex] = f
-
-    # Handle resolution and component dependencies
-    deps_to_create = []
-    
-    # To track deduplication: source_component -> target_component
-    seen_deps = set()
-    
-    for src_file in files:
-        if not src_file.component_id:
-            continue
-            
-        imports = (src_file.parsed_symbols or {}).get("imports", [])
-        
-        for imp in imports:
-            source_req = imp.get("source")
-            if not source_req or not source_req.startswith("."): # absolute or node_modules
-                continue
-                
-            # Naive resolution for relative path
-            # src_file.path: e.g. "dashboard/UserPanel.tsx"
-            # imp_source: e.g. "../auth/validateUser"
-            base_dir = os.path.dirname(src_file.path)
-            resolved_base = os.path.normpath(os.path.join(base_dir, source_req))
-            
-            target_f = None
-            
-            # Look up path in file index (trying out common extensions)
-            for ext in [".ts", ".tsx", ".js", ".jsx"]:
-                cand = f"{resolved_base}{ext}"
-                if cand in path_to_file:
-                    target_f = path_to_file[cand]
-                    break
-                    
-            if not target_f:
-                # Can we resolve by symbols exactly?
-                symbols_req = imp.get("symbols", [])
-                for s in symbols_req:
-                    if s in export_index:
-                        target_f = export_index[s]
-                        break
-            
-            if target_f and target_f.component_id and target_f.component_id != src_file.component_id:
-                dep_key = (src_file.component_id, target_f.component_id)
-                if dep_key not in seen_deps:
-                    seen_deps.add(dep_key)
-                    deps_to_create.append(
-                        ComponentDependency(
-                            project_id=project_id,
-                            source_component_id=src_file.component_id,
-                            target_component_id=target_f.component_id,
-                            dependency_type="import",
-                            confidence=1.0,
-                            symbols=imp.get("symbols", []),
-                            detection_method="parser"
-                        )
-                    )
-                    
-    # Insert new dependencies
-    for d in deps_to_create:
-        db.add(d)
-        
-    await db.commit()
+    """
+    Rebuilds the project's dependency graph from the stored imports and exports.
+    Kept for existing callers; stale edges are replaced rather than appended.
+    """
+    await rebuild_project_graph(project_id, db)
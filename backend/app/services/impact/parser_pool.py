@@ -0,0 +1,113 @@
+"""
+Per-process tree-sitter parser pool.
+Grammars are loaded once per process and parsers are kept per thread, so the
+legacy parse_file and every BaseExtractor reuse warm parsers instead of
+building a new Language/Parser pair for each file.
+"""
+from __future__ import annotations
+
+import importlib
+import threading
+from collections import defaultdict
+
+from tree_sitter import Language, Parser
+
+# language key -> (grammar module, factory function returning the language pointer)
+GRAMMARS: dict[str, tuple[str, str]] = {
+    "typescript": ("tree_sitter_typescript", "language_typescript"),
+    "tsx": ("tree_sitter_typescript", "language_tsx"),
+    "javascript": ("tree_sitter_javascript", "language"),
+    "python": ("tree_sitter_python", "language"),
+    "go": ("tree_sitter_go", "language"),
+    "rust": ("tree_sitter_rust", "language"),
+    "java": ("tree_sitter_java", "language"),
+    "c_sharp": ("tree_sitter_c_sharp", "language"),
+    "ruby": ("tree_sitter_ruby", "language"),
+    "php": ("tree_sitter_php", "language_php"),
+    "c": ("tree_sitter_c", "language"),
+    "cpp": ("tree_sitter_cpp", "language"),
+}
+
+_languages: dict[str, Language] = {}
+_languages_lock = threading.Lock()
+_local = threading.local()
+
+_stats: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+_stats_lock = threading.Lock()
+
+
+def is_supported(language: str) -> bool:
+    return language in GRAMMARS
+
+
+def get_language(language: str) -> Language:
+    """Returns the process-wide Language for a grammar key, loading it on first use."""
+    lang = _languages.get(language)
+    if lang is not None:
+        return lang
+
+    if language not in GRAMMARS:
+        raise KeyError(f"No tree-sitter grammar registered for '{language}'")
+
+    with _languages_lock:
+        lang = _languages.get(language)
+        if lang is None:
+            module_name, factory = GRAMMARS[language]
+            module = importlib.import_module(module_name)
+            lang = Language(getattr(module, factory)())
+            _languages[language] = lang
+    return lang
+
+
+def get_parser(language: str) -> Parser:
+    """Returns this thread's Parser for a grammar key, creating it on first use."""
+    parsers: dict[str, Parser] | None = getattr(_local, "parsers", None)
+    if parsers is None:
+        parsers = _local.parsers = {}
+
+    parser = parsers.get(language)
+    if parser is not None:
+        _record(language, hit=True)
+        return parser
+
+    parser = _new_parser(get_language(language))
+    parsers[language] = parser
+    _record(language, hit=False)
+    return parser
+
+
+def warm(languages: list[str] | None = None) -> None:
+    """Preloads grammars and parsers, e.g. from a worker process initializer."""
+    for language in languages or list(GRAMMARS):
+        try:
+            get_parser(language)
+        except (ImportError, ValueError):
+            # Grammar package missing or built for an incompatible tree-sitter ABI
+            continue
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Hit/miss counters per grammar key for parser lookups in this process."""
+    with _stats_lock:
+        return {lang: dict(counts) for lang, counts in _stats.items()}
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def _record(language: str, hit: bool) -> None:
+    with _stats_lock:
+        _stats[language]["hits" if hit else "misses"] += 1
+
+
+def _new_parser(lang: Language) -> Parser:
+    # tree_sitter >= 0.22 takes the language in the constructor;
+    # older bindings only expose set_language()
+    try:
+        return Parser(lang)
+    except TypeError:
+        parser = Parser()
+        parser.set_language(lang)
+        return parser
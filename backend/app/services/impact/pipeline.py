@@ -0,0 +1,218 @@
+"""
+Parse pipeline used by parse_project.
+Files whose content hash is already in the parse cache are answered from it.
+The rest are downloaded concurrently under a bounded number of slots, parsed
+in a process pool whose workers keep warm parsers, and cached. Results stream
+back in batches so the caller can bulk-update ProjectFile rows.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.core.storage import download_bytes
+from app.services.impact import parse_cache
+from app.services.impact.extractors import is_parseable, parse_source
+from app.services.impact.parser_pool import warm
+from app.services.language_detector import detect_language
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParseJob:
+    file_id: str
+    path: str
+    s3_key: str
+    content_hash: str | None = None
+
+
+@dataclass
+class ParseResult:
+    file_id: str
+    path: str
+    language: str
+    parsed_symbols: dict | None = None
+    content_hash: str | None = None
+    cached: bool = False
+    error: str | None = None
+
+
+# ── Process pool ───────────────────────────────────────────────────────────────
+
+_executor: ProcessPoolExecutor | None = None
+_executor_failed = False
+
+
+def _init_worker() -> None:
+    # Load every grammar once so the first files in each worker don't pay for it
+    warm()
+
+
+def _parse_in_worker(path: str, content: bytes, language: str) -> dict | None:
+    parsed = parse_source(path, content, language)
+    return parsed.to_dict() if parsed else None
+
+
+def get_executor() -> Executor | None:
+    """
+    Returns the per-process parser pool, created on first use and reused by
+    later tasks. Returns None (parse on a thread) when parse_workers <= 1 or
+    the pool cannot be started, e.g. inside a daemonic worker process.
+    """
+    global _executor
+    if settings.parse_workers <= 1 or _executor_failed:
+        return None
+    if _executor is None:
+        # The constructor succeeds in a daemonic process (e.g. a Celery prefork
+        # child); only the first submit would fail, so check up front
+        if multiprocessing.current_process().daemon:
+            _disable_executor("daemonic processes are not allowed to have children")
+            return None
+        try:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.parse_workers,
+                initializer=_init_worker,
+            )
+        except (OSError, AssertionError, ValueError) as e:
+            _disable_executor(e)
+            return None
+    return _executor
+
+
+def _disable_executor(reason: object) -> None:
+    global _executor, _executor_failed
+    logger.warning("Parser process pool unavailable, parsing on threads: %s", reason)
+    _executor_failed = True
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _submit_parse(loop: asyncio.AbstractEventLoop, path: str, content: bytes, language: str) -> asyncio.Future:
+    """Schedules one parse on the pool, or on a thread when the pool refuses work."""
+    executor = get_executor()
+    if executor is not None:
+        try:
+            return loop.run_in_executor(executor, _parse_in_worker, path, content, language)
+        except (OSError, AssertionError, RuntimeError) as e:
+            # Raised by submit itself (no child processes, broken or shut down pool)
+            _disable_executor(e)
+    return loop.run_in_executor(None, _parse_in_worker, path, content, language)
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+# ── Pipeline ───────────────────────────────────────────────────────────────────
+
+async def parse_files(
+    jobs: Iterable[ParseJob],
+    download: Callable[[str], Awaitable[bytes]] = download_bytes,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+) -> AsyncIterator[list[ParseResult]]:
+    """
+    Resolves parse results for jobs, yielding them in batches as they complete.
+    Files without an extractor are reported with their language only, and
+    files whose known content hash hits the parse cache are never downloaded.
+    """
+    batch_size = batch_size or settings.parse_batch_size
+    concurrency = concurrency or settings.parse_download_concurrency
+    loop = asyncio.get_running_loop()
+
+    ready: list[ParseResult] = []
+    lookups: list[tuple[ParseJob, str, str]] = []
+    to_fetch: list[tuple[ParseJob, str]] = []
+
+    for job in jobs:
+        language = detect_language(job.path)
+        if not is_parseable(language):
+            ready.append(ParseResult(job.file_id, job.path, language))
+        elif job.content_hash:
+            lookups.append((job, language, parse_cache.cache_key(job.path, language, job.content_hash)))
+        else:
+            to_fetch.append((job, language))
+
+    # Unchanged files cost one MGET per batch and no tree-sitter work
+    for i in range(0, len(lookups), batch_size):
+        chunk = lookups[i:i + batch_size]
+        hits = await parse_cache.get_many([(job.path, language, key) for job, language, key in chunk])
+        for (job, language, _), symbols in zip(chunk, hits):
+            if symbols is None:
+                to_fetch.append((job, language))
+            else:
+                ready.append(ParseResult(
+                    job.file_id, job.path, language, parsed_symbols=symbols,
+                    content_hash=job.content_hash, cached=True,
+                ))
+        while len(ready) >= batch_size:
+            yield ready[:batch_size]
+            ready = ready[batch_size:]
+
+    async def process(job: ParseJob, language: str) -> ParseResult:
+        try:
+            content = await download(job.s3_key)
+            digest = parse_cache.content_hash(content)
+            if digest != job.content_hash:
+                # Content is new to this row but may already be cached from another file
+                key = parse_cache.cache_key(job.path, language, digest)
+                hit, = await parse_cache.get_many([(job.path, language, key)])
+                if hit is not None:
+                    return ParseResult(job.file_id, job.path, language, parsed_symbols=hit,
+                                       content_hash=digest, cached=True)
+            symbols = await _submit_parse(loop, job.path, content, language)
+            return ParseResult(job.file_id, job.path, language, parsed_symbols=symbols,
+                               content_hash=digest)
+        except Exception as e:
+            return ParseResult(job.file_id, job.path, language, error=str(e))
+
+    pending = iter(to_fetch)
+    worker_count = max(1, min(concurrency, len(to_fetch)))
+    # Bounded so workers stall, and stop downloading, while the caller is
+    # still writing the previous batch
+    results: asyncio.Queue[ParseResult | None] = asyncio.Queue(maxsize=2 * worker_count)
+
+    async def worker() -> None:
+        # Each worker owns one slot: at most `concurrency` files are held in
+        # memory between download and parse at any time.
+        try:
+            for job, language in pending:
+                await results.put(await process(job, language))
+        finally:
+            await results.put(None)
+
+    async def flush(batch: list[ParseResult]) -> list[ParseResult]:
+        await parse_cache.set_many([
+            (parse_cache.cache_key(r.path, r.language, r.content_hash), r.parsed_symbols)
+            for r in batch
+            if r.parsed_symbols is not None and not r.cached
+        ])
+        return batch
+
+    workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+    remaining = len(workers)
+    try:
+        while remaining:
+            item = await results.get()
+            if item is None:
+                remaining -= 1
+                continue
+            ready.append(item)
+            if len(ready) >= batch_size:
+                yield await flush(ready)
+                ready = []
+        if ready:
+            yield await flush(ready)
+    finally:
+        for w in workers:
+            w.cancel()
@@ -0,0 +1,15 @@
+from .base import LanguageResolver
+from .go import GoResolver
+from .javascript import JavaScriptResolver, JsModuleResolver, load_jsonc
+from .module import RESOLVERS, ModuleResolver, ProjectConfigs, compiled_configs, is_config_path
+from .paths import ProjectPathIndex
+from .python import PythonResolver
+from .qualified import CSharpResolver, JavaResolver
+from .rust import RustResolver
+
+__all__ = [
+    "LanguageResolver", "ModuleResolver", "ProjectConfigs", "ProjectPathIndex", "RESOLVERS",
+    "CSharpResolver", "GoResolver", "JavaResolver", "JavaScriptResolver", "JsModuleResolver",
+    "PythonResolver", "RustResolver",
+    "compiled_configs", "is_config_path", "load_jsonc",
+]
@@ -0,0 +1,36 @@
+"""Base class for per-language import resolvers."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from app.services.impact.extractors.base import Import
+
+from .paths import ProjectPathIndex
+
+if TYPE_CHECKING:
+    from .module import ProjectConfigs
+
+
+class LanguageResolver(ABC):
+    """
+    Resolves the non-relative imports of one language against precomputed
+    indexes. Built once per project (per graph build) and queried per import.
+    """
+
+    def __init__(self, path_index: ProjectPathIndex, configs: ProjectConfigs):
+        self.path_index = path_index
+        self.configs = configs
+
+    @abstractmethod
+    def resolve(self, imp: Import, from_path: str) -> list[tuple[Import, str]]:
+        """
+        Returns (import, target_path) pairs. One import can fan out to several
+        files (a Go package, a Java wildcard); the returned Import may be a
+        rewritten copy whose symbols describe what the edge carries.
+        """
+
+
+def package_import(imp: Import) -> Import:
+    """Copy of imp that depends on a whole module/package rather than named exports."""
+    return Import(source=imp.source, symbols=[], is_default=imp.is_default, is_wildcard=True, line=imp.line)
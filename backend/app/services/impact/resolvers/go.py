@@ -0,0 +1,55 @@
+"""
+Go import resolution.
+Import paths under a module declared in a project go.mod map directly onto
+package directories. Without a go.mod, the longest matching directory suffix
+of at least two segments is used, so "fmt" or "encoding/json" never hit
+project folders that merely share a name.
+"""
+from __future__ import annotations
+
+import posixpath
+import re
+
+from app.services.impact.extractors.base import Import
+
+from .base import LanguageResolver, package_import
+
+_MODULE_DIRECTIVE = re.compile(rb"^\s*module\s+(\S+)", re.M)
+_MIN_SUFFIX_SEGMENTS = 2
+
+
+def parse_go_mod(raw: bytes) -> str | None:
+    """Returns the module path declared in a go.mod file."""
+    match = _MODULE_DIRECTIVE.search(raw)
+    return match.group(1).decode("utf8", errors="replace").strip('"') if match else None
+
+
+class GoResolver(LanguageResolver):
+    def __init__(self, path_index, configs):
+        super().__init__(path_index, configs)
+        # Longest module path first so nested modules win
+        self.modules = sorted(configs.go_modules.items(), key=lambda m: len(m[0]), reverse=True)
+        self.suffixes: dict[str, str] = {}
+        for directory in sorted(path_index.go_packages):
+            parts = directory.split("/") if directory else []
+            for i in range(len(parts) - _MIN_SUFFIX_SEGMENTS + 1):
+                self.suffixes.setdefault("/".join(parts[i:]), directory)
+
+    def resolve(self, imp: Import, from_path: str) -> list[tuple[Import, str]]:
+        directory = self._package_dir(imp.source)
+        if directory is None or directory == posixpath.dirname(from_path):
+            return []
+        # Go imports a whole package; the edge is to every file in it
+        return [(package_import(imp), path) for path in self.path_index.go_packages.get(directory, [])]
+
+    def _package_dir(self, import_path: str) -> str | None:
+        for module_path, module_dir in self.modules:
+            if import_path == module_path or import_path.startswith(module_path + "/"):
+                rel = import_path[len(module_path):].lstrip("/")
+                return posixpath.join(module_dir, rel).strip("/") if rel else module_dir
+        parts = import_path.split("/")
+        for i in range(len(parts) - _MIN_SUFFIX_SEGMENTS + 1):
+            directory = self.suffixes.get("/".join(parts[i:]))
+            if directory is not None:
+                return directory
+        return None
@@ -0,0 +1,233 @@
+"""
+TypeScript/JavaScript module resolution beyond relative imports.
+Compiles tsconfig.json/jsconfig.json `baseUrl` and `paths` (following local
+`extends`) and package.json workspaces into prefix matchers, so alias imports
+like "@/components/Button" or "@acme/ui/Button" resolve to project files.
+"""
+from __future__ import annotations
+
+import fnmatch
+import json
+import posixpath
+import re
+from dataclasses import dataclass, field
+
+from app.services.impact.extractors.base import Import
+
+from .base import LanguageResolver
+from .paths import ProjectPathIndex
+
+SCOPE_CONFIGS = ("tsconfig.json", "jsconfig.json")
+PACKAGE_CONFIG = "package.json"
+
+# Entry-point fields tried for a bare workspace package import, in order
+_ENTRY_FIELDS = ("source", "module", "main", "types", "typings")
+_MAX_EXTENDS_DEPTH = 8
+
+# Comments and trailing commas, skipping over string literals
+_JSONC_NOISE = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/|,(?=\s*[}\]])', re.S)
+
+
+def is_js_config_path(path: str) -> bool:
+    """True for files the resolver needs: tsconfig*/jsconfig*.json and package.json."""
+    base = posixpath.basename(path)
+    return base == PACKAGE_CONFIG or (
+        base.endswith(".json") and (base.startswith("tsconfig") or base.startswith("jsconfig"))
+    )
+
+
+def load_jsonc(raw: bytes | str) -> dict:
+    """Parses tsconfig-style JSON with comments and trailing commas; {} if invalid."""
+    text = raw.decode("utf8", errors="replace") if isinstance(raw, bytes) else raw
+    try:
+        data = json.loads(_JSONC_NOISE.sub(lambda m: m.group(1) or "", text))
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _join(directory: str, rel: str) -> str:
+    joined = posixpath.normpath(posixpath.join(directory, rel))
+    return "" if joined == "." else joined
+
+
+@dataclass
+class _Scope:
+    directory: str
+    base_url: str | None
+    exact: dict[str, list[str]] = field(default_factory=dict)
+    # (prefix, suffix, target templates), longest prefix first
+    wildcards: list[tuple[str, str, list[str]]] = field(default_factory=list)
+
+
+@dataclass
+class _Package:
+    directory: str
+    entries: list[str]
+
+
+class JsModuleResolver:
+    """
+    Compiled alias matchers for one project. Independent of the path index, so
+    it only needs recompiling when a config file changes.
+    """
+
+    def __init__(self, configs: dict[str, dict]):
+        self._scopes: list[_Scope] = []
+        self._scope_by_dir: dict[str, _Scope | None] = {}
+        self.packages: dict[str, _Package] = {}
+
+        for path in configs:
+            if posixpath.basename(path) in SCOPE_CONFIGS:
+                scope = _compile_scope(path, configs)
+                if scope is not None:
+                    self._scopes.append(scope)
+        self._scopes.sort(key=lambda s: s.directory.count("/") + bool(s.directory), reverse=True)
+
+        self._compile_workspaces(configs)
+
+    def __bool__(self) -> bool:
+        return bool(self._scopes or self.packages)
+
+    def resolve(self, source: str, from_path: str, path_index: ProjectPathIndex) -> str | None:
+        """Resolves a non-relative import through paths, baseUrl, then workspace packages."""
+        if source.startswith("."):
+            return None
+
+        scope = self._scope_for(posixpath.dirname(from_path))
+        if scope is not None:
+            for candidate in self._alias_candidates(scope, source):
+                hit = path_index.lookup(candidate)
+                if hit:
+                    return hit
+            if scope.base_url is not None:
+                hit = path_index.lookup(_join(scope.base_url, source))
+                if hit:
+                    return hit
+
+        return self._resolve_package(source, path_index)
+
+    # ── tsconfig paths ─────────────────────────────────────────────────────────
+
+    def _scope_for(self, directory: str) -> _Scope | None:
+        # Memoised per directory: files in the same folder share the lookup
+        if directory in self._scope_by_dir:
+            return self._scope_by_dir[directory]
+        scope = next(
+            (s for s in self._scopes
+             if not s.directory or directory == s.directory or directory.startswith(s.directory + "/")),
+            None,
+        )
+        self._scope_by_dir[directory] = scope
+        return scope
+
+    @staticmethod
+    def _alias_candidates(scope: _Scope, source: str) -> list[str]:
+        targets = scope.exact.get(source)
+        if targets is not None:
+            return targets
+        for prefix, suffix, templates in scope.wildcards:
+            if source.startswith(prefix) and source.endswith(suffix) and len(source) >= len(prefix) + len(suffix):
+                star = source[len(prefix):len(source) - len(suffix)]
+                return [t.replace("*", star, 1) for t in templates]
+        return []
+
+    # ── Workspaces ─────────────────────────────────────────────────────────────
+
+    def _compile_workspaces(self, configs: dict[str, dict]) -> None:
+        globs: list[str] = []
+        for path, data in configs.items():
+            if posixpath.basename(path) != PACKAGE_CONFIG:
+                continue
+            workspaces = data.get("workspaces")
+            if isinstance(workspaces, dict):
+                workspaces = workspaces.get("packages")
+            if isinstance(workspaces, list):
+                root = posixpath.dirname(path)
+                globs.extend(_join(root, w) for w in workspaces if isinstance(w, str))
+        if not globs:
+            return
+
+        for path, data in configs.items():
+            if posixpath.basename(path) != PACKAGE_CONFIG:
+                continue
+            directory = posixpath.dirname(path)
+            name = data.get("name")
+            if not isinstance(name, str) or not any(fnmatch.fnmatch(directory, g) for g in globs):
+                continue
+            entries = [_join(directory, data[f]) for f in _ENTRY_FIELDS if isinstance(data.get(f), str)]
+            self.packages[name] = _Package(directory, entries)
+
+    def _resolve_package(self, source: str, path_index: ProjectPathIndex) -> str | None:
+        parts = source.split("/")
+        name_len = 2 if source.startswith("@") else 1
+        package = self.packages.get("/".join(parts[:name_len]))
+        if package is None:
+            return None
+
+        subpath = "/".join(parts[name_len:])
+        if subpath:
+            candidates = [_join(package.directory, subpath), _join(package.directory, "src/" + subpath)]
+        else:
+            candidates = []
+            for entry in package.entries:
+                candidates += [entry, posixpath.splitext(entry)[0]]
+            candidates += [_join(package.directory, "src/index"), _join(package.directory, "index")]
+
+        for candidate in candidates:
+            hit = path_index.lookup(candidate)
+            if hit:
+                return hit
+        return None
+
+
+def _compile_scope(path: str, configs: dict[str, dict]) -> _Scope | None:
+    """Merges a tsconfig with its local `extends` chain into a _Scope."""
+    base_url: str | None = None
+    paths: dict | None = None
+    paths_base: str | None = None
+
+    current, depth = path, 0
+    while current in configs and depth < _MAX_EXTENDS_DEPTH:
+        config_dir = posixpath.dirname(current)
+        options = configs[current].get("compilerOptions") or {}
+        # The nearest definition wins; relative values anchor to the defining file
+        if base_url is None and isinstance(options.get("baseUrl"), str):
+            base_url = _join(config_dir, options["baseUrl"])
+        if paths is None and isinstance(options.get("paths"), dict):
+            paths = options["paths"]
+            paths_base = config_dir
+
+        extends = configs[current].get("extends")
+        if not isinstance(extends, str) or not extends.startswith("."):
+            break
+        current = _join(config_dir, extends)
+        if not current.endswith(".json"):
+            current += ".json"
+        depth += 1
+
+    if base_url is None and not paths:
+        return None
+
+    scope = _Scope(directory=posixpath.dirname(path), base_url=base_url)
+    # paths are relative to baseUrl when set, else to the tsconfig declaring them
+    anchor = base_url if base_url is not None else paths_base
+    for pattern, targets in (paths or {}).items():
+        if not isinstance(targets, list):
+            continue
+        templates = [_join(anchor, t) for t in targets if isinstance(t, str)]
+        if "*" in pattern:
+            prefix, _, suffix = pattern.partition("*")
+            scope.wildcards.append((prefix, suffix, templates))
+        else:
+            scope.exact[pattern] = templates
+    scope.wildcards.sort(key=lambda w: len(w[0]), reverse=True)
+    return scope
+
+
+class JavaScriptResolver(LanguageResolver):
+    """Adapter running the project's compiled JsModuleResolver per import."""
+
+    def resolve(self, imp: Import, from_path: str) -> list[tuple[Import, str]]:
+        target = self.configs.js.resolve(imp.source, from_path, self.path_index)
+        return [(imp, target)] if target and target != from_path else []
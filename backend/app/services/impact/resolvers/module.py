@@ -0,0 +1,112 @@
+"""
+Import resolution entry point used by the graph builder.
+Relative imports go through the ProjectPathIndex; anything else is handed to
+the LanguageResolver registered for the importing file's language. Project
+config files (tsconfig/jsconfig/package.json, go.mod) are compiled once into
+ProjectConfigs and cached per project.
+"""
+from __future__ import annotations
+
+import posixpath
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from app.services.impact.extractors.base import Import
+from app.services.language_detector import detect_language
+
+from .base import LanguageResolver
+from .go import GoResolver, parse_go_mod
+from .javascript import JavaScriptResolver, JsModuleResolver, is_js_config_path, load_jsonc
+from .paths import ProjectPathIndex
+from .python import PythonResolver
+from .qualified import CSharpResolver, JavaResolver
+from .rust import RustResolver
+
+RESOLVERS: dict[str, type[LanguageResolver]] = {
+    "typescript": JavaScriptResolver,
+    "javascript": JavaScriptResolver,
+    "python": PythonResolver,
+    "go": GoResolver,
+    "java": JavaResolver,
+    "c_sharp": CSharpResolver,
+    "rust": RustResolver,
+}
+
+
+def is_config_path(path: str) -> bool:
+    """True for project files whose content the resolvers need."""
+    return is_js_config_path(path) or posixpath.basename(path) == "go.mod"
+
+
+@dataclass
+class ProjectConfigs:
+    js: JsModuleResolver = field(default_factory=lambda: JsModuleResolver({}))
+    # Go module path -> directory holding its go.mod
+    go_modules: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def compile(cls, files: dict[str, bytes]) -> ProjectConfigs:
+        js_configs = {}
+        go_modules = {}
+        for path, raw in files.items():
+            if posixpath.basename(path) == "go.mod":
+                module_path = parse_go_mod(raw)
+                if module_path:
+                    go_modules[module_path] = posixpath.dirname(path)
+            elif is_js_config_path(path):
+                js_configs[path] = load_jsonc(raw)
+        return cls(js=JsModuleResolver(js_configs), go_modules=go_modules)
+
+
+class ModuleResolver:
+    def __init__(self, path_index: ProjectPathIndex, configs: ProjectConfigs | None = None):
+        self.path_index = path_index
+        self.configs = configs or ProjectConfigs()
+        self._resolvers: dict[str, LanguageResolver | None] = {}
+
+    def resolve_import(self, imp: Import, from_path: str, language: str = "") -> list[tuple[Import, str]]:
+        """Returns the (import, target_path) pairs an import resolves to; [] if external."""
+        hit = self.path_index.resolve_relative(imp.source, from_path)
+        if hit is not None:
+            return [(imp, hit)]
+        resolver = self._resolver(language or detect_language(from_path))
+        return resolver.resolve(imp, from_path) if resolver else []
+
+    def resolve(self, source: str, from_path: str, language: str = "") -> str | None:
+        """Single-target convenience wrapper around resolve_import."""
+        pairs = self.resolve_import(Import(source=source), from_path, language)
+        return pairs[0][1] if pairs else None
+
+    def _resolver(self, language: str) -> LanguageResolver | None:
+        # Language indexes are built on first use, once per ModuleResolver
+        if language not in self._resolvers:
+            cls = RESOLVERS.get(language)
+            self._resolvers[language] = cls(self.path_index, self.configs) if cls else None
+        return self._resolvers[language]
+
+
+class CompiledResolverCache:
+    """
+    Small per-process LRU of compiled project configs keyed by project, valid
+    while the fingerprint of the config files they were compiled from holds.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[object, ProjectConfigs]] = OrderedDict()
+
+    def get(self, project_id: str, fingerprint: object) -> ProjectConfigs | None:
+        entry = self._entries.get(project_id)
+        if entry is None or entry[0] != fingerprint:
+            return None
+        self._entries.move_to_end(project_id)
+        return entry[1]
+
+    def put(self, project_id: str, fingerprint: object, configs: ProjectConfigs) -> None:
+        self._entries[project_id] = (fingerprint, configs)
+        self._entries.move_to_end(project_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+compiled_configs = CompiledResolverCache()
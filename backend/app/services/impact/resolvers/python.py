@@ -0,0 +1,84 @@
+"""
+Python import resolution.
+Handles relative imports (".auth", "..pkg.mod") and absolute dotted modules.
+Absolute modules are looked up in a map of every importable dotted name: a
+file's path suffixes count as module names when the directory they start
+from is not itself a package, which covers src/ and backend/ style roots.
+"""
+from __future__ import annotations
+
+import posixpath
+
+from app.services.impact.extractors.base import Import
+
+from .base import LanguageResolver, package_import
+
+
+class PythonResolver(LanguageResolver):
+    def __init__(self, path_index, configs):
+        super().__init__(path_index, configs)
+        package_dirs = {posixpath.dirname(p) for p in path_index.python_modules.values()
+                        if p.endswith("/__init__.py") or p == "__init__.py"}
+
+        # dotted name -> (root depth, path); the shallowest root wins on clashes
+        best: dict[str, tuple[int, str]] = {}
+        for full_name, path in path_index.python_modules.items():
+            parts = full_name.split(".") if full_name else []
+            for depth in range(len(parts)):
+                root = "/".join(parts[:depth])
+                if depth and root in package_dirs:
+                    continue
+                name = ".".join(parts[depth:])
+                current = best.get(name)
+                if current is None or (depth, path) < current:
+                    best[name] = (depth, path)
+        self.modules: dict[str, str] = {name: path for name, (_, path) in best.items()}
+
+    def resolve(self, imp: Import, from_path: str) -> list[tuple[Import, str]]:
+        source = imp.source
+        if source.startswith("."):
+            base = self._relative_base(source, from_path)
+            if base is None:
+                return []
+            lookup = self._file_for_dir
+        else:
+            base = source.replace("/", ".")
+            lookup = self.modules.get
+
+        resolved: list[tuple[Import, str]] = []
+        remaining: list[str] = []
+        # "from pkg import mod" may name submodules rather than attributes
+        for symbol in imp.symbols:
+            submodule = lookup(_child(base, symbol, relative=source.startswith(".")))
+            if submodule:
+                resolved.append((package_import(imp), submodule))
+            else:
+                remaining.append(symbol)
+
+        if remaining or not imp.symbols:
+            target = lookup(base)
+            if target:
+                symbols = remaining if imp.symbols else []
+                resolved.append((Import(source=source, symbols=symbols, is_wildcard=imp.is_wildcard,
+                                        line=imp.line), target))
+        return resolved
+
+    @staticmethod
+    def _relative_base(source: str, from_path: str) -> str | None:
+        rest = source.lstrip(".")
+        directory = posixpath.dirname(from_path)
+        for _ in range(len(source) - len(rest) - 1):
+            if not directory:
+                return None
+            directory = posixpath.dirname(directory)
+        return posixpath.join(directory, rest.replace(".", "/")) if rest else directory
+
+    def _file_for_dir(self, path: str) -> str | None:
+        module = path.replace("/", ".")
+        return self.path_index.python_modules.get(module)
+
+
+def _child(base: str, symbol: str, relative: bool) -> str:
+    if relative:
+        return posixpath.join(base, symbol) if base else symbol
+    return f"{base}.{symbol}" if base else symbol
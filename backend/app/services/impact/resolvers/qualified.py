@@ -0,0 +1,85 @@
+"""
+Java and C# import resolution by fully-qualified name.
+Both languages conventionally mirror namespaces in folders, so every
+directory path is indexed by its dotted suffixes: a type FQN maps to its
+file and a package/namespace maps to the files in its folder. Keys need at
+least two segments unless they cover the whole path, which keeps bare names
+like "util" from matching unrelated folders.
+"""
+from __future__ import annotations
+
+import posixpath
+
+from app.services.impact.extractors.base import Import
+
+from .base import LanguageResolver, package_import
+
+_MIN_KEY_SEGMENTS = 2
+
+
+class QualifiedNameResolver(LanguageResolver):
+    extension = ""
+    # C# `using A.B;` names a namespace; Java imports always name a type
+    namespace_imports = False
+
+    def __init__(self, path_index, configs):
+        super().__init__(path_index, configs)
+        self.types: dict[str, str] = {}
+        self.namespaces: dict[str, list[str]] = {}
+
+        for path in sorted(path_index.paths):
+            stem, ext = posixpath.splitext(path)
+            if ext != self.extension:
+                continue
+            directory = posixpath.dirname(stem)
+            # "src/Company.Auth/Services" -> Company.Auth.Services
+            dir_parts = [p for part in directory.split("/") if part for p in part.split(".")]
+            type_parts = dir_parts + [posixpath.basename(stem)]
+            for key in _dotted_suffixes(type_parts):
+                self.types.setdefault(key, path)
+            for key in _dotted_suffixes(dir_parts):
+                files = self.namespaces.setdefault(key, [])
+                if not files or posixpath.dirname(files[0]) == directory:
+                    files.append(path)
+
+    def resolve(self, imp: Import, from_path: str) -> list[tuple[Import, str]]:
+        source = imp.source.removeprefix("static ").strip()
+        resolved: list[tuple[Import, str]] = []
+        for symbol in imp.symbols or [""]:
+            if symbol == "*" or imp.is_wildcard:
+                resolved += self._namespace(imp, source)
+                continue
+            fqn = f"{source}.{symbol}" if symbol else source
+            target = self.types.get(fqn)
+            if target:
+                resolved.append((Import(source=source, symbols=[symbol], line=imp.line), target))
+                continue
+            # Static member import (Java) or alias of a type (C#)
+            target = self.types.get(source)
+            if target:
+                resolved.append((Import(source=source, symbols=[source.rsplit(".", 1)[-1]], line=imp.line), target))
+                continue
+            if self.namespace_imports:
+                # using A.B; or an alias of a namespace
+                resolved += self._namespace(imp, fqn) or self._namespace(imp, source)
+        return [(i, t) for i, t in resolved if t != from_path]
+
+    def _namespace(self, imp: Import, name: str) -> list[tuple[Import, str]]:
+        return [(package_import(imp), path) for path in self.namespaces.get(name, [])]
+
+
+class JavaResolver(QualifiedNameResolver):
+    extension = ".java"
+
+
+class CSharpResolver(QualifiedNameResolver):
+    extension = ".cs"
+    namespace_imports = True
+
+
+def _dotted_suffixes(parts: list[str]) -> list[str]:
+    keys = []
+    for i in range(len(parts)):
+        if len(parts) - i >= _MIN_KEY_SEGMENTS or i == 0:
+            keys.append(".".join(parts[i:]))
+    return keys
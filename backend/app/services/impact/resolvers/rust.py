@@ -0,0 +1,137 @@
+"""
+Rust `use` resolution.
+crate::, self:: and super:: paths are walked from the crate root (the
+nearest directory holding lib.rs or main.rs) through foo.rs / foo/mod.rs
+module files; the longest module prefix that exists is the target and the
+rest of the path names items in it. Paths starting with another workspace
+crate's name resolve against that crate's src/ directory.
+"""
+from __future__ import annotations
+
+import posixpath
+
+from app.services.impact.extractors.base import Import
+
+from .base import LanguageResolver, package_import
+
+_CRATE_ROOTS = ("lib.rs", "main.rs")
+
+
+class RustResolver(LanguageResolver):
+    def __init__(self, path_index, configs):
+        super().__init__(path_index, configs)
+        self.root_files: dict[str, str] = {}
+        for path in sorted(path_index.paths):
+            directory, base = posixpath.split(path)
+            if base in _CRATE_ROOTS:
+                self.root_files.setdefault(directory, path)
+
+        # Workspace crates by name: "crates/auth-core/src" -> auth_core
+        self.crates: dict[str, str] = {}
+        for directory in self.root_files:
+            if posixpath.basename(directory) == "src":
+                name = posixpath.basename(posixpath.dirname(directory)).replace("-", "_")
+                if name:
+                    self.crates.setdefault(name, directory)
+        self._root_by_dir: dict[str, str | None] = {}
+
+    def resolve(self, imp: Import, from_path: str) -> list[tuple[Import, str]]:
+        path, _, group = imp.source.partition("{")
+        path = path.rstrip(":").strip()
+        segments = [s.strip() for s in path.split("::") if s.strip()]
+        if segments and segments[0] == "pub":
+            segments = segments[1:]
+        if not segments:
+            return []
+
+        head, rest = segments[0], segments[1:]
+        if head == "crate":
+            root = self._crate_root(posixpath.dirname(from_path))
+        elif head in ("self", "super"):
+            root = self._module_dir(from_path)
+            ups = 1 if head == "super" else 0
+            while rest[:1] == ["super"]:
+                ups, rest = ups + 1, rest[1:]
+            for _ in range(ups):
+                if not root:
+                    return []
+                root = posixpath.dirname(root)
+        else:
+            root = self.crates.get(head)
+        if root is None:
+            return []
+
+        resolved: list[tuple[Import, str]] = []
+        # use a::{b, c}: members that are modules themselves get their own edge
+        for item in _group_items(group):
+            module = self._exact_module_file(root, rest + [item])
+            if module is not None:
+                resolved.append((package_import(imp), module))
+
+        target = self._module_file(root, rest)
+        if target is not None:
+            resolved.append((imp, target))
+        return [(i, t) for i, t in resolved if t != from_path]
+
+    def _crate_root(self, directory: str) -> str | None:
+        if directory in self._root_by_dir:
+            return self._root_by_dir[directory]
+        current, root = directory, None
+        while True:
+            if current in self.root_files:
+                root = current
+                break
+            if not current:
+                break
+            current = posixpath.dirname(current)
+        self._root_by_dir[directory] = root
+        return root
+
+    @staticmethod
+    def _module_dir(from_path: str) -> str:
+        directory, base = posixpath.split(from_path)
+        if base in _CRATE_ROOTS or base == "mod.rs":
+            return directory
+        return posixpath.join(directory, posixpath.splitext(base)[0])
+
+    def _exact_module_file(self, root: str, segments: list[str]) -> str | None:
+        module = posixpath.join(root, *segments)
+        for candidate in (module + ".rs", module + "/mod.rs"):
+            if candidate in self.path_index:
+                return candidate
+        return None
+
+    def _module_file(self, root: str, segments: list[str]) -> str | None:
+        for k in range(len(segments), -1, -1):
+            module = posixpath.join(root, *segments[:k]) if k else root
+            if k == 0 and module in self.root_files:
+                return self.root_files[module]
+            for candidate in (module + ".rs", module + "/mod.rs"):
+                if candidate in self.path_index:
+                    return candidate
+        return None
+
+
+def _group_items(group: str) -> list[str]:
+    """Leading identifiers of a top-level use group: "b, c::D, self}" -> ["b", "c"]."""
+    items, depth, current = [], 0, ""
+    for ch in group:
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            if depth == 0:
+                break
+            depth -= 1
+        elif ch == "," and depth == 0:
+            items.append(current)
+            current = ""
+            continue
+        if depth == 0:
+            current += ch
+    items.append(current)
+    names = []
+    for item in items:
+        name = item.split("::", 1)[0].split(" as ", 1)[0].strip()
+        if name.isidentifier() and name != "self":
+            names.append(name)
+    return names
@@ -0,0 +1,255 @@
+"""
+Split storage for parsed symbols.
+Imports and exports, the only symbols graph building and impact lookups read,
+live in the narrow file_imports / file_exports tables. Definitions and calls
+are only needed when a file's own content is analysed, so they are packed
+column-wise into one compressed blob per file (project_files.symbol_blob)
+that graph builds never select. A non-null symbol_blob marks a file as parsed.
+
+Blobs are msgpack + zstd when both packages are installed, json + zlib
+otherwise; the first byte records which, so either reader handles old rows.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import zlib
+from collections import defaultdict
+from collections.abc import AsyncIterator
+
+from sqlalchemy import LargeBinary, String, bindparam, case, delete, func, insert, null, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.component import FileExport, FileImport, ProjectFile
+from app.services.impact.extractors.base import Call, Definition, Export, Import, ParsedFile
+
+try:
+    import msgpack
+    import zstandard
+except ImportError:  # optional: fall back to the stdlib codec
+    msgpack = zstandard = None
+
+_MSGPACK_ZSTD = 1
+_JSON_ZLIB = 2
+
+
+# ── Blob codec ─────────────────────────────────────────────────────────────────
+
+def encode_symbol_blob(data: dict) -> bytes:
+    """Packs the language, definitions and calls of a to_dict() layout as positional rows."""
+    definitions, calls = data.get("definitions", []), data.get("calls", [])
+    body = {
+        "language": data.get("language", ""),
+        "definitions": [
+            [d["name"], d["kind"], d.get("signature", ""), d.get("start_line", 0), d.get("end_line", 0), d.get("parent")]
+            for d in definitions
+        ],
+        "calls": [[c["callee"], c.get("line", 0), c.get("parent_def")] for c in calls],
+    }
+    if msgpack is not None:
+        return bytes([_MSGPACK_ZSTD]) + zstandard.ZstdCompressor().compress(msgpack.packb(body))
+    return bytes([_JSON_ZLIB]) + zlib.compress(json.dumps(body, separators=(",", ":")).encode())
+
+
+def decode_symbol_blob(blob: bytes) -> tuple[str, list[Definition], list[Call]]:
+    """Inverse of encode_symbol_blob(): (language, definitions, calls)."""
+    fmt, payload = blob[0], blob[1:]
+    if fmt == _MSGPACK_ZSTD:
+        if msgpack is None:
+            raise RuntimeError("symbol blob is msgpack+zstd but msgpack/zstandard are not installed")
+        body = msgpack.unpackb(zstandard.ZstdDecompressor().decompress(payload))
+    elif fmt == _JSON_ZLIB:
+        body = json.loads(zlib.decompress(payload))
+    else:
+        raise ValueError(f"unknown symbol blob format {fmt}")
+    return (
+        body["language"],
+        [Definition(*row) for row in body["definitions"]],
+        [Call(*row) for row in body["calls"]],
+    )
+
+
+# ── Writes ─────────────────────────────────────────────────────────────────────
+
+def split_parsed_symbols(project_id: str, file_id: str, data: dict) -> tuple[list[dict], list[dict], bytes]:
+    """Splits a to_dict() layout into file_imports rows, file_exports rows and the blob."""
+    imports = [
+        {
+            "project_id": project_id, "file_id": file_id, "ordinal": n,
+            "source": i["source"], "symbols": i.get("symbols") or [],
+            "is_default": i.get("is_default", False), "is_wildcard": i.get("is_wildcard", False),
+            "line": i.get("line", 0),
+        }
+        for n, i in enumerate(data.get("imports", []))
+    ]
+    exports = []
+    for n, e in enumerate(data.get("exports", [])):
+        # Rows written before the extractor registry stored bare export names
+        if isinstance(e, str):
+            e = {"name": e, "kind": "variable"}
+        exports.append({
+            "project_id": project_id, "file_id": file_id, "ordinal": n,
+            "name": e["name"], "kind": e["kind"], "signature": e.get("signature", ""), "line": e.get("line", 0),
+        })
+    blob = encode_symbol_blob(data)
+    return imports, exports, blob
+
+
+# One row per parsed file: language always, content hash and symbols only when
+# the parse produced them (NULL binds keep the stored values), so a whole
+# batch is one executemany. New symbols also clear the legacy JSONB.
+_blob = bindparam("blob", type_=LargeBinary)
+_UPDATE_PARSED_FILE = (
+    update(ProjectFile.__table__)
+    .where(ProjectFile.__table__.c.id == bindparam("file_id"))
+    .values(
+        language=bindparam("language"),
+        content_hash=func.coalesce(bindparam("content_hash", type_=String), ProjectFile.__table__.c.content_hash),
+        symbol_blob=func.coalesce(_blob, ProjectFile.__table__.c.symbol_blob),
+        parsed_symbols=case((_blob.is_(None), ProjectFile.__table__.c.parsed_symbols), else_=null()),
+    )
+)
+
+
+async def store_parsed_symbols(
+    project_id: str,
+    files: list[tuple[str, str, str | None, dict | None]],
+    db: AsyncSession,
+) -> None:
+    """
+    Writes parse results, given as (file id, language, content hash, symbols in
+    the ParsedFile.to_dict() layout). A None hash or None symbols leaves the
+    stored ones in place. Does not commit.
+    """
+    if not files:
+        return
+    parsed = {file_id: data for file_id, _, _, data in files if data is not None}
+    import_rows: list[dict] = []
+    export_rows: list[dict] = []
+    blobs: dict[str, bytes] = {}
+    for file_id, data in parsed.items():
+        imports, exports, blobs[file_id] = split_parsed_symbols(project_id, file_id, data)
+        import_rows += imports
+        export_rows += exports
+
+    if parsed:
+        await db.execute(delete(FileImport).where(FileImport.file_id.in_(list(parsed))))
+        await db.execute(delete(FileExport).where(FileExport.file_id.in_(list(parsed))))
+    if import_rows:
+        await db.execute(insert(FileImport), import_rows)
+    if export_rows:
+        await db.execute(insert(FileExport), export_rows)
+    await db.execute(_UPDATE_PARSED_FILE, [
+        {"file_id": file_id, "language": language, "content_hash": digest, "blob": blobs.get(file_id)}
+        for file_id, language, digest, _ in files
+    ])
+
+
+# ── Reads ──────────────────────────────────────────────────────────────────────
+# Scope either to a whole project (one indexed scan) or to a set of file ids.
+
+def _scoped(query, model, project_id: str | None, file_ids):
+    if file_ids is not None:
+        return query.where(model.file_id.in_(list(file_ids)))
+    return query.where(model.project_id == project_id)
+
+
+async def load_imports(
+    db: AsyncSession, *, project_id: str | None = None, file_ids=None,
+) -> dict[str, list[Import]]:
+    """file id -> imports in source order."""
+    res = await db.execute(_scoped(
+        select(FileImport.file_id, FileImport.source, FileImport.symbols,
+               FileImport.is_default, FileImport.is_wildcard, FileImport.line),
+        FileImport, project_id, file_ids,
+    ).order_by(FileImport.file_id, FileImport.ordinal))
+    intern = sys.intern
+    imports: dict[str, list[Import]] = defaultdict(list)
+    for r in res.all():
+        imports[r.file_id].append(Import(
+            intern(r.source), [intern(s) for s in r.symbols or ()], r.is_default, r.is_wildcard, r.line,
+        ))
+    return imports
+
+
+async def load_exports(
+    db: AsyncSession, *, project_id: str | None = None, file_ids=None,
+) -> dict[str, list[Export]]:
+    """file id -> exports in source order."""
+    res = await db.execute(_scoped(
+        select(FileExport.file_id, FileExport.name, FileExport.kind, FileExport.signature, FileExport.line),
+        FileExport, project_id, file_ids,
+    ).order_by(FileExport.file_id, FileExport.ordinal))
+    intern = sys.intern
+    exports: dict[str, list[Export]] = defaultdict(list)
+    for r in res.all():
+        exports[r.file_id].append(Export(intern(r.name), intern(r.kind), r.signature, r.line))
+    return exports
+
+
+async def stream_imports(
+    db: AsyncSession, project_id: str, chunk_size: int | None = None,
+) -> AsyncIterator[tuple[str, list[Import]]]:
+    """
+    Yields (file id, imports in source order) for every file of a project,
+    fetched through a server-side cursor chunk_size rows at a time so only
+    one chunk of imports is in memory.
+    """
+    intern = sys.intern
+    result = await db.stream(
+        select(FileImport.file_id, FileImport.source, FileImport.symbols,
+               FileImport.is_default, FileImport.is_wildcard, FileImport.line)
+        .where(FileImport.project_id == project_id)
+        .order_by(FileImport.file_id, FileImport.ordinal)
+        .execution_options(yield_per=chunk_size or settings.graph_stream_chunk_size)
+    )
+    file_id, imports = None, []
+    async for r in result:
+        if r.file_id != file_id:
+            if imports:
+                yield file_id, imports
+            file_id, imports = r.file_id, []
+        imports.append(Import(
+            intern(r.source), [intern(s) for s in r.symbols or ()], r.is_default, r.is_wildcard, r.line,
+        ))
+    if imports:
+        yield file_id, imports
+
+
+async def load_export_names(
+    db: AsyncSession, *, project_id: str | None = None, file_ids=None, chunk_size: int | None = None,
+) -> dict[str, set[str]]:
+    """file id -> exported names, streamed; all import confirmation needs."""
+    result = await db.stream(_scoped(
+        select(FileExport.file_id, FileExport.name), FileExport, project_id, file_ids,
+    ).execution_options(yield_per=chunk_size or settings.graph_stream_chunk_size))
+    intern = sys.intern
+    names: dict[str, set[str]] = defaultdict(set)
+    async for file_id, name in result:
+        names[file_id].add(intern(name))
+    return names
+
+
+async def load_parsed_files(file_ids, db: AsyncSession) -> dict[str, ParsedFile]:
+    """Full ParsedFiles (definitions and calls included) for the given parsed files."""
+    file_ids = list(file_ids)
+    if not file_ids:
+        return {}
+    res = await db.execute(
+        select(ProjectFile.id, ProjectFile.path, ProjectFile.symbol_blob)
+        .where(ProjectFile.id.in_(file_ids))
+        .where(ProjectFile.symbol_blob != None)
+    )
+    rows = res.all()
+    imports = await load_imports(db, file_ids=file_ids)
+    exports = await load_exports(db, file_ids=file_ids)
+    parsed = {}
+    for r in rows:
+        language, definitions, calls = decode_symbol_blob(r.symbol_blob)
+        parsed[r.id] = ParsedFile(
+            path=r.path, language=language,
+            imports=imports.get(r.id, []), exports=exports.get(r.id, []),
+            definitions=definitions, calls=calls,
+        )
+    return parsed
@@ -3,9 +3,11 @@ import os
 EXT_MAP = {
     ".ts": "typescript", ".tsx": "typescript",
     ".js": "javascript", ".jsx": "javascript",
+    ".mjs": "javascript", ".cjs": "javascript",
     ".py": "python", ".go": "go", ".rs": "rust",
     ".java": "java", ".cs": "c_sharp", ".rb": "ruby",
     ".php": "php", ".cpp": "cpp", ".c": "c",
+    ".cc": "cpp", ".hpp": "cpp", ".h": "c",
     ".html": "html", ".css": "css", ".json": "json",
     ".md": "markdown", ".yaml": "yaml", ".yml": "yaml",
 }
@@ -2,13 +2,17 @@ import asyncio
 import json
 from app.worker import celery_app
 from app.core.database import AsyncSessionLocal
-from sqlalchemy import select, update
+from sqlalchemy import insert, select, update
 from app.models.change import ChangeRequest, ChangeImpact, Notification
-from app.models.component import ProjectFile, FileDraft, Component, ComponentDependency, ComponentContributor
-from app.core.storage import download_bytes
-from app.core.redis import publish
+from app.models.component import ProjectFile, FileDraft, Component, ComponentContributor
+from app.core.storage import download_many
+from app.core.redis import publish, publish_many
 from app.services.diff import generate_diff
+from app.services.impact.blast_radius import compute_blast_radius
+from app.services.impact.graph_cache import get_project_graph
+from app.services.impact.graph_store import find_symbol_references
 from app.services.impact.llm import analyze_with_llm
+from app.services.impact.symbol_store import load_export_names
 
 def _run_async(coro):
     loop = asyncio.get_event_loop()
@@ -21,112 +25,134 @@ async def _analyze_impact_async(change_id: str):
         if not cr:
             return
 
-        # Fetch all drafts for this author & component
+        # Active drafts for this author & component, with their files, in one query
         d_res = await db.execute(
-            select(FileDraft)
-            .join(ProjectFile)
+            select(FileDraft, ProjectFile)
+            .join(ProjectFile, FileDraft.file_id == ProjectFile.id)
             .where(
                 FileDraft.author_id == cr.author_id,
                 ProjectFile.component_id == cr.component_id,
                 FileDraft.is_active == True
             )
         )
-        drafts = d_res.scalars().all()
+        drafts = d_res.all()
+        # Originals are fetched in parallel: latency is the slowest object, not the sum
+        originals = await download_many(proj_f.s3_key for _, proj_f in drafts)
 
-        changed_symbols = []
+        changed_symbols = set()
+        # Set when a changed file could not be analysed and exports nothing known
+        whole_component = False
         diff_text_accum = []
         affected_files = []
+        unanalysable = []
 
-        for draft in drafts:
-            f_res = await db.execute(select(ProjectFile).where(ProjectFile.id == draft.file_id))
-            proj_f = f_res.scalars().first()
-            if not proj_f:
-                continue
-
+        for (draft, proj_f), original in zip(drafts, originals):
             try:
-                original_content = (await download_bytes(proj_f.s3_key)).decode('utf8')
+                original_content = original.decode('utf8')
             except Exception:
                 original_content = ""
 
             modified_content = draft.content or ""
 
-            diff_data = generate_diff(original_content, modified_content)
+            diff_data = generate_diff(original_content, modified_content, proj_f.path)
             diff_text_accum.append(f"--- {proj_f.path}\n+++ {proj_f.path}\n" + "\n".join(
                 line for hunk in diff_data["hunks"] for line in hunk["content"]
             ))
 
-            # Naively adding file path export symbols if they exist
-            if proj_f.parsed_symbols:
-                changed_symbols.extend(proj_f.parsed_symbols.get("exports", []))
+            if diff_data["changed_symbols"] is not None:
+                changed_symbols.update(diff_data["changed_symbols"])
+            else:
+                unanalysable.append(proj_f.id)
 
             affected_files.append(proj_f)
 
-        # Find dependent components that import this changed symbol
-        dependent_component_ids = set()
-        dep_res = await db.execute(
-            select(ComponentDependency)
-            .where(ComponentDependency.source_component_id == cr.component_id)
-        )
-        deps = dep_res.scalars().all()
-        for d in deps:
-            for s in (d.symbols or []):
-                if s in changed_symbols:
-                    dependent_component_ids.add(d.target_component_id)
-            if not d.symbols:
-                # Naive fallback: if any dependency exists, flag it
-                dependent_component_ids.add(d.target_component_id)
-
-        # Create impacts
+        if unanalysable:
+            # Unanalysable edit: assume every export of the file changed
+            exports = await load_export_names(db, file_ids=unanalysable)
+            for file_id in unanalysable:
+                if exports.get(file_id):
+                    changed_symbols.update(exports[file_id])
+                else:
+                    whole_component = True
+
+        # Find components that depend on the changed symbols, directly or transitively
+        graph = await get_project_graph(cr.project_id, db)
+        changed = None if whole_component else changed_symbols
+        blast = compute_blast_radius(graph, cr.component_id, changed)
+
+        # Files importing the changed symbols directly, from the symbol reference index
+        references_by_component: dict[str, list[dict]] = {}
+        for ref in await find_symbol_references(
+            cr.project_id, [f.id for f in affected_files], changed, db
+        ):
+            if ref["component_id"] and ref["component_id"] != cr.component_id:
+                references_by_component.setdefault(ref["component_id"], []).append(
+                    {"file_path": ref["file_path"], "line": ref["line"], "symbol": ref["symbol"]}
+                )
+
+        # Create impacts: contributors of every hit component in one query
+        hit_ids = [hit.component_id for hit in blast.hits]
+        contributors_by_component: dict[str, list[str]] = {}
+        if hit_ids:
+            cb_res = await db.execute(
+                select(ComponentContributor.component_id, ComponentContributor.user_id)
+                .where(ComponentContributor.component_id.in_(hit_ids))
+            )
+            for component_id, user_id in cb_res.all():
+                contributors_by_component.setdefault(component_id, []).append(user_id)
+
         affected_contributors = set()
+        impact_rows = []
+        for hit in blast.hits:
+            c_id = hit.component_id
+            affected_lines = {
+                **hit.to_dict(),
+                "via": sorted(blast.via(hit)),
+                "files": references_by_component.get(c_id, []),
+            }
+            for user_id in contributors_by_component.get(c_id, []):
+                affected_contributors.add(user_id)
+                impact_rows.append({
+                    "change_request_id": cr.id,
+                    "component_id": c_id,
+                    "contributor_id": user_id,
+                    "detection_method": "parser",
+                    "confidence": 1.0,
+                    "affected_lines": affected_lines,
+                })
+        if impact_rows:
+            await db.execute(insert(ChangeImpact), impact_rows)
 
-        for c_id in dependent_component_ids:
-            # Find contributors
-            cb_res = await db.execute(select(ComponentContributor).where(ComponentContributor.component_id == c_id))
-            cbs = cb_res.scalars().all()
-            for cb in cbs:
-                affected_contributors.add(cb.user_id)
-                impact = ChangeImpact(
-                    change_request_id=cr.id,
-                    component_id=c_id,
-                    contributor_id=cb.user_id,
-                    detection_method="parser",
-                    confidence=1.0,
-                    affected_lines={} # Stub
-                )
-                db.add(impact)
-                
-            # Set component to flagged
-            await db.execute(update(Component).where(Component.id == c_id).values(status="flagged"))
+        # Set components to flagged
+        if hit_ids:
+            await db.execute(update(Component).where(Component.id.in_(hit_ids)).values(status="flagged"))
 
         cr.status = "analysis_complete"
 
         # Notifications
-        for uid in affected_contributors:
-            n = Notification(
-                user_id=uid,
-                type="change",
-                title="Impact Detected",
-                body=f"Your component might be affected by change '{cr.title}'",
-                link=f"/changes/{cr.id}"
-            )
-            db.add(n)
-            await db.flush()
-            await publish(
-                f"ws:user:{uid}", json.dumps({
-                    "event": "impact:parser_complete",
-                    "data": {"change_request_id": cr.id}
-                })
-            )
-
-        await publish(
-            f"ws:user:{cr.author_id}", json.dumps({
-                "event": "impact:parser_complete",
-                "data": {"change_request_id": cr.id}
-            })
-        )
+        if affected_contributors:
+            await db.execute(insert(Notification), [
+                {
+                    "user_id": uid,
+                    "type": "change",
+                    "title": "Impact Detected",
+                    "body": f"Your component might be affected by change '{cr.title}'",
+                    "link": f"/changes/{cr.id}",
+                }
+                for uid in sorted(affected_contributors)
+            ])
 
         await db.commit()
 
+        parser_complete = json.dumps({
+            "event": "impact:parser_complete",
+            "data": {"change_request_id": cr.id}
+        })
+        await publish_many([
+            (f"ws:user:{uid}", parser_complete)
+            for uid in [*sorted(affected_contributors), cr.author_id]
+        ])
+
         # Phase B: LLM
         full_diff = "\n".join(diff_text_accum)
         llm_findings = await analyze_with_llm(full_diff, [f.path for f in affected_files])
@@ -134,17 +160,12 @@ async def _analyze_impact_async(change_id: str):
         if llm_findings:
             # Reopen session to update
             async with AsyncSessionLocal() as db2:
-                # Update impacts with LLM annotations
-                for finding in llm_findings:
-                    # just slap the llm annotation on the first impact for simplicity to satisfy reqs
-                    # Or attach it to the specific component
-                    pass
-                
-                res_imp = await db2.execute(select(ChangeImpact).where(ChangeImpact.change_request_id == cr.id))
-                impacts = res_imp.scalars().all()
-                for imp in impacts:
-                    imp.llm_annotation = json.dumps(llm_findings)
-
+                # Annotate every impact of the change in one UPDATE
+                await db2.execute(
+                    update(ChangeImpact)
+                    .where(ChangeImpact.change_request_id == cr.id)
+                    .values(llm_annotation=json.dumps(llm_findings))
+                )
                 await db2.commit()
                 
             # Publish completion
@@ -3,19 +3,36 @@ from app.core.database import AsyncSessionLocal
 from app.models.component import ProjectFile
 from app.models.project import Project
 from app.models.change import Notification
-from app.core.storage import download_bytes, upload_bytes
+from app.core.storage import upload_bytes
 from app.core.redis import publish
 from app.services.language_detector import detect_language
-from app.services.impact.parser import parse_file, build_dependency_graph
+from app.services.impact.parser import build_dependency_graph
+from app.services.impact.parser_pool import pool_stats
+from app.services.impact.parse_cache import content_hash
+from app.services.impact.graph_store import update_project_graph
+from app.services.impact.pipeline import ParseJob, ParseResult, parse_files
+from app.services.impact.symbol_store import store_parsed_symbols
 import asyncio
 import json
+import logging
 import httpx
 from sqlalchemy import select
 
+logger = logging.getLogger(__name__)
+
 def _run_async(coro):
     loop = asyncio.get_event_loop()
     return loop.run_until_complete(coro)
 
+async def _store_batch(project_id: str, batch: list[ParseResult], db) -> None:
+    for r in batch:
+        if r.error:
+            logger.warning("Failed to parse %s: %s", r.path, r.error)
+    # One UPDATE executemany per batch covers language, hash and symbols
+    await store_parsed_symbols(
+        project_id, [(r.file_id, r.language, r.content_hash, r.parsed_symbols) for r in batch], db
+    )
+
 async def _parse_project_async(project_id: str):
     async with AsyncSessionLocal() as db:
         # fetch owner to notify
@@ -24,34 +41,19 @@ async def _parse_project_async(project_id: str):
         if not proj:
             return
 
-        res = await db.execute(select(ProjectFile).where(ProjectFile.project_id == project_id))
-        files = res.scalars().all()
-        
-        for f in files:
-            try:
-                content_bytes = await download_bytes(f.s3_key)
-                content_str = content_bytes.decode('utf8')
-                
-                lang = detect_language(f.path)
-                f.language = lang
-                
-                if lang in ["typescript", "javascript"]:
-                    parsed = parse_file(f.path, content_str)
-                    
-                    imp_dict = [{"source": i.source, "symbols": i.symbols} for i in parsed.imports]
-                    exp_dict = [e.name for e in parsed.exports]
-                    
-                    symbol_dict = {
-                        "imports": imp_dict,
-                        "exports": exp_dict,
-                        "definitions": parsed.definitons,
-                        "calls": parsed.calls
-                    }
-                    f.parsed_symbols = symbol_dict
-                    
-            except Exception as e:
-                print(f"Failed to parse {f.path}: {e}")
-                
+        res = await db.execute(
+            select(ProjectFile.id, ProjectFile.path, ProjectFile.s3_key, ProjectFile.content_hash)
+            .where(ProjectFile.project_id == project_id)
+        )
+        jobs = [
+            ParseJob(file_id=r.id, path=r.path, s3_key=r.s3_key, content_hash=r.content_hash)
+            for r in res.all()
+        ]
+
+        async for batch in parse_files(jobs):
+            await _store_batch(project_id, batch, db)
+
+        logger.info("Parser pool stats after project %s: %s", project_id, pool_stats())
         await db.commit()
         
         # Now build dependency graph
@@ -94,6 +96,28 @@ async def _parse_project_async(project_id: str):
 def parse_project(project_id: str):
     _run_async(_parse_project_async(project_id))
 
+async def _reparse_files_async(project_id: str, file_ids: list[str]):
+    """Re-parses files whose content changed and patches the graph incrementally."""
+    async with AsyncSessionLocal() as db:
+        res = await db.execute(
+            select(ProjectFile.id, ProjectFile.path, ProjectFile.s3_key, ProjectFile.content_hash)
+            .where(ProjectFile.project_id == project_id, ProjectFile.id.in_(file_ids))
+        )
+        jobs = [
+            ParseJob(file_id=r.id, path=r.path, s3_key=r.s3_key, content_hash=r.content_hash)
+            for r in res.all()
+        ]
+
+        async for batch in parse_files(jobs):
+            await _store_batch(project_id, batch, db)
+        await db.commit()
+
+        await update_project_graph(project_id, [j.file_id for j in jobs], db)
+
+@celery_app.task
+def reparse_files(project_id: str, file_ids: list[str]):
+    _run_async(_reparse_files_async(project_id, file_ids))
+
 async def _import_github_async(project_id: str, repo_url: str, branch: str, github_token: str | None):
     async with AsyncSessionLocal() as db:
         parts = repo_url.rstrip("/").split("/")
@@ -139,6 +163,7 @@ async def _import_github_async(project_id: str, repo_url: str, branch: str, gith
                         language=detect_language(path),
                         size_bytes=len(c_bytes),
                         s3_key=s3_key,
+                        content_hash=content_hash(c_bytes),
                         confirmed=True
                     )
                     db.add(pf)
@@ -0,0 +1,80 @@
+"""
+Call.parent_def lookup: parent-pointer walk per call vs the scope stack.
+
+    cd backend && python -m benchmarks.bench_call_scopes
+
+The source is a generated Python module of nested functions, each making a
+burst of calls to the same few helpers. Both figures are a full
+PythonExtractor.extract(); the parent-walk one overrides the call handler
+to climb node.parent from every call and decode the enclosing name afresh,
+as find_enclosing_function() did for each call before the scope stack. The string counts show how many
+distinct str objects back the callee names with and without interning.
+"""
+import time
+
+from app.services.impact.extractors import EXTRACTORS
+from app.services.impact.extractors.base import FUNCTION_TYPES, interned_strings
+from app.services.impact.extractors.python_ext import PythonExtractor
+from app.services.impact.parser_pool import get_parser
+
+HELPERS = ("validate", "log.debug", "fetch_user", "render")
+
+
+def _make_source(functions: int = 200, depth: int = 4, calls: int = 12) -> bytes:
+    lines = []
+    for f in range(functions):
+        for d in range(depth):
+            lines.append("    " * d + f"def fn_{f}_{d}(arg):")
+        body = "    " * depth
+        for c in range(calls):
+            lines.append(f"{body}{HELPERS[c % len(HELPERS)]}(arg)")
+        lines.append("")
+    return "\n".join(lines).encode()
+
+
+class ParentWalkExtractor(PythonExtractor):
+    def _call(self, node, ctx) -> None:
+        ctx.scope = self._climb(node, ctx.source_bytes)
+        super()._call(node, ctx)
+
+    @staticmethod
+    def _climb(node, source_bytes: bytes) -> str | None:
+        current = node.parent
+        while current is not None:
+            if current.type in FUNCTION_TYPES:
+                name_node = current.child_by_field_name("name")
+                if name_node:
+                    return source_bytes[name_node.start_byte:name_node.end_byte].decode("utf-8", errors="replace")
+            current = current.parent
+        return None
+
+
+def _time(extractor, root, source: bytes, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parsed = extractor.extract(root, source, "generated.py")
+    return parsed, (time.perf_counter() - start) / rounds * 1e3
+
+
+def main(rounds: int = 20) -> None:
+    extractor = EXTRACTORS["python"]
+    source = _make_source()
+    root = get_parser("python").parse(source).root_node
+    call_nodes = list(extractor.walk_nodes(root, ["call"]))
+
+    walked, walk = _time(ParentWalkExtractor(), root, source, rounds)
+    stacked, stack = _time(extractor, root, source, rounds)
+    assert walked.calls == stacked.calls
+
+    plain = [extractor.node_text(node.child_by_field_name("function"), source) for node in call_nodes]
+    with interned_strings():
+        shared = [extractor.node_text(node.child_by_field_name("function"), source) for node in call_nodes]
+
+    print(f"{len(call_nodes)} calls, {len(source) // 1024} KiB source")
+    print(f"extract(), parent walk per call : {walk:8.1f} ms")
+    print(f"extract(), scope stack          : {stack:8.1f} ms")
+    print(f"distinct callee str objects     : {len({id(s) for s in plain}):6d} -> {len({id(s) for s in shared})}")
+
+
+if __name__ == "__main__":
+    main()
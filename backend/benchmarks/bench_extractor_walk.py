@@ -0,0 +1,78 @@
+"""
+Node visits per file: one DFS per symbol kind vs the single-pass visitor.
+
+    cd backend && python -m benchmarks.bench_extractor_walk
+
+Before the visitor, TypeScriptExtractor issued one walk_nodes() query per
+node-type group (ES imports, require calls, exports, functions, classes,
+interfaces/types, calls), each a full DFS of the tree. The multi-pass
+figures replay those seven DFS passes; the single-pass figures are
+TypeScriptExtractor.visit() over the same trees, handlers included.
+"""
+import glob
+import os
+import time
+
+from app.services.impact.extractors import EXTRACTORS
+from app.services.impact.extractors.base import BaseExtractor, ParsedFile, VisitContext
+from app.services.impact.extractors.registry import grammar_for
+from app.services.impact.parser_pool import get_parser
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "ripple-mock-project")
+
+# The walk_nodes() type groups of the previous TypeScriptExtractor, in order
+LEGACY_PASSES = [
+    {"import_statement"},
+    {"call_expression"},
+    {"export_statement"},
+    {"function_declaration", "method_definition", "function_expression", "arrow_function"},
+    {"class_declaration"},
+    {"interface_declaration", "type_alias_declaration"},
+    {"call_expression"},
+]
+
+
+def _multi_pass(root) -> int:
+    visited = 0
+    for types in LEGACY_PASSES:
+        for node in BaseExtractor._preorder(root):
+            visited += 1
+            if node.type in types:
+                pass
+    return visited
+
+
+def _single_pass(extractor, root, source: bytes) -> int:
+    return extractor.visit(root, VisitContext(source, ParsedFile(path="", language="typescript")))
+
+
+def main(rounds: int = 500) -> None:
+    extractor = EXTRACTORS["typescript"]
+    trees = []
+    for path in glob.glob(os.path.join(FIXTURES, "**", "*.ts*"), recursive=True):
+        with open(path, "rb") as fh:
+            source = fh.read()
+        trees.append((get_parser(grammar_for(path, extractor)).parse(source).root_node, source))
+
+    multi_visits = sum(_multi_pass(root) for root, _ in trees)
+    single_visits = sum(_single_pass(extractor, root, source) for root, source in trees)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for root, _ in trees:
+            _multi_pass(root)
+    multi = (time.perf_counter() - start) / (rounds * len(trees)) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for root, source in trees:
+            _single_pass(extractor, root, source)
+    single = (time.perf_counter() - start) / (rounds * len(trees)) * 1e6
+
+    print(f"{len(trees)} fixture files")
+    print(f"7 DFS passes (walk only)      : {multi_visits:6d} node visits, {multi:8.1f} us/file")
+    print(f"single pass (incl. handlers)  : {single_visits:6d} node visits, {single:8.1f} us/file")
+
+
+if __name__ == "__main__":
+    main()
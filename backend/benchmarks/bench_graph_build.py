@@ -0,0 +1,70 @@
+"""
+Graph build cost on a synthetic project: per-import path-set rebuild vs the
+precomputed ProjectPathIndex.
+
+    cd backend && python -m benchmarks.bench_graph_build
+
+The baseline is the resolver build_dependency_graph used before the index:
+a fresh set of all paths per import, then extension and index.* probing.
+"""
+import os
+import random
+import time
+
+from app.services.impact.extractors.base import Export, Import, ParsedFile
+from app.services.impact.graph import build_dependency_graph
+from app.services.impact.resolvers.paths import EXTENSIONS
+
+
+def _project(n_files: int, imports_per_file: int) -> tuple[list[ParsedFile], dict[str, str]]:
+    rng = random.Random(0)
+    paths = [f"src/c{i % 50}/mod{i}.ts" for i in range(n_files)]
+    parsed = []
+    for i, path in enumerate(paths):
+        imports = []
+        for _ in range(imports_per_file):
+            j = rng.randrange(n_files)
+            imports.append(Import(source=f"../c{j % 50}/mod{j}", symbols=[f"f{j}"]))
+        parsed.append(ParsedFile(path=path, language="typescript", imports=imports,
+                                 exports=[Export(name=f"f{i}", kind="function")]))
+    return parsed, {p: f"comp-{i % 50}" for i, p in enumerate(paths)}
+
+
+def _legacy_resolve(import_source: str, current_file_path: str, all_file_paths: set[str]) -> str | None:
+    base = os.path.normpath(os.path.join(os.path.dirname(current_file_path), import_source))
+    if base in all_file_paths:
+        return base
+    for candidate in [base + ext for ext in EXTENSIONS] + [f"{base}/index{ext}" for ext in EXTENSIONS]:
+        if candidate in all_file_paths:
+            return candidate
+    return None
+
+
+def _baseline(parsed: list[ParsedFile]) -> int:
+    paths = [pf.path for pf in parsed]
+    resolved = 0
+    for pf in parsed:
+        for imp in pf.imports:
+            if _legacy_resolve(imp.source, pf.path, set(paths)):
+                resolved += 1
+    return resolved
+
+
+def main(n_files: int = 2000, imports_per_file: int = 10) -> None:
+    parsed, components = _project(n_files, imports_per_file)
+
+    start = time.perf_counter()
+    _baseline(parsed)
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    edges = build_dependency_graph("bench", parsed, components)
+    indexed = time.perf_counter() - start
+
+    print(f"{n_files} files x {imports_per_file} imports")
+    print(f"per-import path set  : {baseline * 1e3:8.1f} ms (resolution only)")
+    print(f"ProjectPathIndex     : {indexed * 1e3:8.1f} ms (full build, {len(edges)} component edges)")
+
+
+if __name__ == "__main__":
+    main()
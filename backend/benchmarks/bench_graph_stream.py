@@ -0,0 +1,82 @@
+"""
+Peak memory of reading a project's imports for a graph rebuild: fetched all
+at once vs streamed per file.
+
+    cd backend && python -m benchmarks.bench_graph_stream [files]
+
+A stand-in session serves synthetic file_imports rows (10 per file) the way
+the driver does: .all() hands back every row, a server-side cursor hands
+them out as they are fetched. The "all at once" figure is load_imports() for
+the whole project, which rebuild_project_graph used to do; the streamed one
+is stream_imports(), resolving and dropping each file's imports as it goes.
+"""
+import asyncio
+import sys
+import tracemalloc
+from collections import namedtuple
+
+from app.services.impact.symbol_store import load_imports, stream_imports
+
+Row = namedtuple("Row", "file_id source symbols is_default is_wildcard line")
+IMPORTS_PER_FILE = 10
+
+
+def _rows(files: int):
+    for f in range(files):
+        for n in range(IMPORTS_PER_FILE):
+            yield Row(f"file-{f:08d}", f"../module{(f + n) % 997}/index", [f"symbol{n}", f"symbol{f % 50}"],
+                      False, False, n + 1)
+
+
+class _Result:
+    def __init__(self, files: int):
+        self.files = files
+
+    def all(self):
+        return list(_rows(self.files))
+
+    async def __aiter__(self):
+        for row in _rows(self.files):
+            yield row
+
+
+class _Session:
+    def __init__(self, files: int):
+        self.files = files
+
+    async def execute(self, stmt):
+        return _Result(self.files)
+
+    async def stream(self, stmt):
+        return _Result(self.files)
+
+
+async def _all_at_once(db) -> int:
+    imports = await load_imports(db, project_id="p")
+    return sum(len(v) for v in imports.values())
+
+
+async def _streamed(db) -> int:
+    count = 0
+    async for _, imports in stream_imports(db, "p"):
+        count += len(imports)
+    return count
+
+
+def _peak_mib(fn, db) -> float:
+    tracemalloc.start()
+    asyncio.run(fn(db))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(files: int = 40_000) -> None:
+    db = _Session(files)
+    print(f"{files} files, {files * IMPORTS_PER_FILE} imports")
+    print(f"load_imports (all at once) : {_peak_mib(_all_at_once, db):8.1f} MiB peak")
+    print(f"stream_imports             : {_peak_mib(_streamed, db):8.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 40_000)
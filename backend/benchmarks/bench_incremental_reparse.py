@@ -0,0 +1,52 @@
+"""
+Draft reparse cost: full parse + extraction vs incremental parse_edit.
+
+    cd backend && python -m benchmarks.bench_incremental_reparse
+
+A generated TypeScript file of ~1000 functions/classes is edited on one line.
+The full path parses and extracts the draft from scratch; the incremental
+path edits the cached tree of the previous version, reparses with it and
+re-extracts only the touched top-level nodes.
+"""
+import time
+
+from app.services.impact.extractors import parse_source
+from app.services.impact.incremental import parse_edit, tree_cache
+
+UNIT = """
+import { a%(i)d } from "./m%(i)d";
+export function f%(i)d(x: number): number {
+  const y = helper(x) + %(i)d;
+  if (y > 3) { return a%(i)d(y); }
+  return y * 2;
+}
+export class C%(i)d { m(v) { return f%(i)d(v); } }
+"""
+
+
+def main(units: int = 1000, rounds: int = 20) -> None:
+    versions = []
+    for r in range(rounds + 1):
+        # Each version changes one constant in a different function
+        body = "".join(UNIT % {"i": i} for i in range(units))
+        versions.append(body.replace(f"helper(x) + {r * 37 % units};", f"helper(x) + {r * 37 % units} + {r};").encode())
+
+    start = time.perf_counter()
+    for content in versions[1:]:
+        parse_source("big.ts", content)
+    full = (time.perf_counter() - start) / rounds * 1e3
+
+    tree_cache.clear()
+    parse_edit("big.ts", b"", versions[0])  # cache the first version's tree
+    start = time.perf_counter()
+    for previous, content in zip(versions, versions[1:]):
+        parse_edit("big.ts", previous, content)
+    incremental = (time.perf_counter() - start) / rounds * 1e3
+
+    print(f"{len(versions[0]) // 1024} KiB file, one-line edits")
+    print(f"full parse + extract : {full:8.1f} ms/edit")
+    print(f"incremental parse    : {incremental:8.1f} ms/edit")
+
+
+if __name__ == "__main__":
+    main()
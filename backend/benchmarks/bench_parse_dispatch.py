@@ -0,0 +1,68 @@
+"""
+Per-file parse cost: legacy TS-only parse_file vs the extractor registry.
+
+    cd backend && python -m benchmarks.bench_parse_dispatch
+
+The legacy path is what parse_project ran before the registry: UTF-8 decode,
+parse_file (TypeScript grammar) and the hand-built symbol dict. The registry
+path is parse_source + ParsedFile.to_dict(), run over the same TS files and
+then over a mixed-language corpus.
+"""
+import glob
+import os
+import time
+
+from app.services.impact.extractors import parse_source
+from app.services.impact.parser import parse_file
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "ripple-mock-project")
+
+SAMPLES = {
+    "svc.py": b"import os\nfrom .auth import validate_user\n\nclass Service:\n    def run(self, x):\n        return validate_user(x)\n\ndef helper(a, b):\n    return os.path.join(a, b)\n",
+    "svc.go": b'package svc\n\nimport (\n\t"fmt"\n\t"example.com/app/auth"\n)\n\nfunc Run(x int) error {\n\tfmt.Println(x)\n\treturn auth.Validate(x)\n}\n',
+    "svc.rs": b"use crate::auth::validate;\n\npub struct Service;\n\nimpl Service {\n    pub fn run(&self) -> bool { validate(1) }\n}\n",
+    "Svc.java": b"package app;\n\nimport app.auth.Validator;\n\npublic class Svc {\n    public boolean run(int x) { return Validator.validate(x); }\n}\n",
+}
+
+
+def _legacy(path: str, content: bytes) -> dict:
+    parsed = parse_file(path, content.decode("utf8"))
+    return {
+        "imports": [{"source": i.source, "symbols": i.symbols} for i in parsed.imports],
+        "exports": [e.name for e in parsed.exports],
+        "definitions": parsed.definitons,
+        "calls": parsed.calls,
+    }
+
+
+def _registry(path: str, content: bytes) -> dict:
+    return parse_source(path, content).to_dict()
+
+
+def _time_per_file(fn, files: list[tuple[str, bytes]], rounds: int) -> float:
+    for path, content in files:  # warm parsers outside the timed loop
+        fn(path, content)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for path, content in files:
+            fn(path, content)
+    return (time.perf_counter() - start) / (rounds * len(files)) * 1e6
+
+
+def main(rounds: int = 2000) -> None:
+    ts_files = []
+    for path in glob.glob(os.path.join(FIXTURES, "**", "*.ts*"), recursive=True):
+        with open(path, "rb") as fh:
+            ts_files.append((os.path.relpath(path, FIXTURES), fh.read()))
+
+    legacy = _time_per_file(_legacy, ts_files, rounds)
+    registry = _time_per_file(_registry, ts_files, rounds)
+    mixed = _time_per_file(_registry, ts_files + list(SAMPLES.items()), rounds)
+
+    print(f"TS files, legacy parse_file : {legacy:8.1f} us/file")
+    print(f"TS files, extractor registry: {registry:8.1f} us/file")
+    print(f"mixed corpus, registry      : {mixed:8.1f} us/file")
+
+
+if __name__ == "__main__":
+    main()
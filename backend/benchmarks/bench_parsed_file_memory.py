@@ -0,0 +1,135 @@
+"""
+Worker memory for a project's ParsedFiles: plain vs slotted/interned.
+
+    cd backend && python -m benchmarks.bench_parsed_file_memory [files]
+
+Builds a synthetic corpus (50k files by default) of parsed_symbols rows as
+the database driver hands them back, i.e. json-decoded with a fresh str per
+field, then measures what ParsedFile.from_dict() keeps alive for all of them.
+The "plain" figures replay the previous from_dict(): dataclasses with a
+__dict__ per instance and no string interning.
+"""
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+from app.services.impact.extractors.base import ParsedFile
+
+VOCABULARY = 5000
+
+
+@dataclass
+class PlainImport:
+    source: str
+    symbols: list[str] = field(default_factory=list)
+    is_default: bool = False
+    is_wildcard: bool = False
+    line: int = 0
+
+
+@dataclass
+class PlainExport:
+    name: str
+    kind: str
+    signature: str = ""
+    line: int = 0
+
+
+@dataclass
+class PlainDefinition:
+    name: str
+    kind: str
+    signature: str = ""
+    start_line: int = 0
+    end_line: int = 0
+    parent: str | None = None
+
+
+@dataclass
+class PlainCall:
+    callee: str
+    line: int = 0
+    parent_def: str | None = None
+
+
+@dataclass
+class PlainParsedFile:
+    path: str
+    language: str
+    imports: list = field(default_factory=list)
+    exports: list = field(default_factory=list)
+    definitions: list = field(default_factory=list)
+    calls: list = field(default_factory=list)
+
+
+def _plain_from_dict(data: dict) -> PlainParsedFile:
+    return PlainParsedFile(
+        path=data.get("path", ""),
+        language=data.get("language", ""),
+        imports=[PlainImport(**i) for i in data.get("imports", [])],
+        exports=[PlainExport(**e) for e in data.get("exports", [])],
+        definitions=[PlainDefinition(**d) for d in data.get("definitions", [])],
+        calls=[PlainCall(**c) for c in data.get("calls", [])],
+    )
+
+
+def _make_rows(files: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    names = [f"symbol{i}" for i in range(VOCABULARY)]
+    paths = [f"src/module{i // 40}/file{i}.ts" for i in range(files)]
+    rows = []
+    for path in paths:
+        defs = rng.sample(names, 8)
+        rows.append(json.dumps({
+            "path": path,
+            "language": "typescript",
+            "imports": [
+                {"source": rng.choice(paths), "symbols": rng.sample(names, 3),
+                 "is_default": False, "is_wildcard": False, "line": n + 1}
+                for n in range(5)
+            ],
+            "exports": [
+                {"name": d, "kind": "function", "signature": f"{d}(input: Input): Output", "line": 10 + n}
+                for n, d in enumerate(defs[:4])
+            ],
+            "definitions": [
+                {"name": d, "kind": "function", "signature": f"{d}(input: Input): Output",
+                 "start_line": 10 + n * 20, "end_line": 28 + n * 20, "parent": None}
+                for n, d in enumerate(defs)
+            ],
+            "calls": [
+                {"callee": rng.choice(names), "line": 12 + n, "parent_def": defs[n % 8]}
+                for n in range(20)
+            ],
+        }))
+    return rows
+
+
+def _measure(rows: list[str], from_dict) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = [from_dict(json.loads(row)) for row in rows]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size / 2**20, elapsed
+
+
+def main(files: int = 50_000) -> None:
+    rows = _make_rows(files)
+    plain_mb, plain_s = _measure(rows, _plain_from_dict)
+    compact_mb, compact_s = _measure(rows, ParsedFile.from_dict)
+
+    print(f"{files} files, 37 symbols each")
+    print(f"plain dataclasses        : {plain_mb:8.1f} MiB retained, {plain_s:6.2f} s to load")
+    print(f"slotted + interned names : {compact_mb:8.1f} MiB retained, {compact_s:6.2f} s to load")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,56 @@
+"""
+Upload initiation for a 5,000-file folder: boto3 presigning vs local SigV4.
+
+    cd backend && python -m benchmarks.bench_presign [files]
+
+The boto3 figure replays the old upload-url endpoint's signing: one
+generate_presigned_url() per file, each through run_in_executor. The batch
+figure is storage.presign_put_urls(), which signs every URL in one loop
+with a signing key derived once. Neither touches the network. The last
+line is a component file listing requested again within the presigned GET
+URL cache window.
+"""
+import asyncio
+import sys
+import time
+
+from app.core.storage import get_s3_client, presign_get_urls, presign_put_urls
+from app.core.config import settings
+
+
+async def _boto3(files: list[tuple[str, str]]) -> None:
+    s3 = get_s3_client()
+    loop = asyncio.get_running_loop()
+    for key, content_type in files:
+        await loop.run_in_executor(None, lambda: s3.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": settings.aws_s3_bucket, "Key": key, "ContentType": content_type},
+            ExpiresIn=900,
+        ))
+
+
+def main(files: int = 5000) -> None:
+    batch = [(f"projects/p1/{n:08x}/src/module{n // 50}/file{n}.ts", "text/plain") for n in range(files)]
+
+    start = time.perf_counter()
+    asyncio.run(_boto3(batch))
+    boto3_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    presign_put_urls(batch)
+    batch_s = time.perf_counter() - start
+
+    keys = [key for key, _ in batch]
+    presign_get_urls(keys)
+    start = time.perf_counter()
+    presign_get_urls(keys)
+    cached_s = time.perf_counter() - start
+
+    print(f"{files} presigned PUT URLs")
+    print(f"boto3, one executor hop each : {boto3_s * 1e3:8.1f} ms")
+    print(f"local SigV4 batch            : {batch_s * 1e3:8.1f} ms")
+    print(f"repeated GET listing, cached : {cached_s * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,64 @@
+"""
+Extraction cost on large files: hand-written extractors vs the query engine.
+
+    cd backend && python -m benchmarks.bench_query_engine
+
+Generated TypeScript and Python files (~200 KiB each) are parsed once; each
+round extracts symbols from the same tree with the language's hand-written
+extractor and with its precompiled tree-sitter Query (extractors/queries.py).
+"""
+import time
+
+from app.services.impact.extractors import EXTRACTORS
+from app.services.impact.extractors.queries import get_query_engine
+from app.services.impact.parser_pool import get_parser
+
+TS_UNIT = """
+import { a%(i)d } from "./m%(i)d";
+export function f%(i)d(x: number): number {
+  const y = helper(x) + %(i)d;
+  if (y > 3) { return a%(i)d(y); }
+  return y * 2;
+}
+export class C%(i)d { m(v) { return f%(i)d(v); } }
+"""
+
+PY_UNIT = """
+from .m%(i)d import a%(i)d
+
+
+def f%(i)d(x: int) -> int:
+    y = helper(x) + %(i)d
+    if y > 3:
+        return a%(i)d(y)
+    return y * 2
+
+
+class C%(i)d:
+    def m(self, v):
+        return self.f(f%(i)d(v))
+"""
+
+
+def _time(fn, rounds: int) -> float:
+    fn()  # warm-up (query compilation, grammar load)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e3
+
+
+def main(units: int = 1000, rounds: int = 10) -> None:
+    for language, grammar, unit in (("typescript", "typescript", TS_UNIT), ("python", "python", PY_UNIT)):
+        source = "".join(unit % {"i": i} for i in range(units)).encode()
+        root = get_parser(grammar).parse(source).root_node
+        extractor = EXTRACTORS[language]
+        engine = get_query_engine(grammar)
+
+        hand = _time(lambda: extractor.extract(root, source, "big"), rounds)
+        query = _time(lambda: engine.extract(extractor, root, source, "big"), rounds)
+        print(f"{language:10s} {len(source) // 1024:4d} KiB  hand-written {hand:7.1f} ms   query engine {query:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+What a graph build reads: one parsed_symbols JSONB per file vs the split layout.
+
+    cd backend && python -m benchmarks.bench_symbol_storage
+
+Parses the frontend sources and a slice of the Python standard library, then
+compares, over the whole corpus, the bytes and JSON decode time of the old
+per-file JSONB (everything, calls included) against the imports/exports part
+graph building now selects from file_imports/file_exports. The blob line
+shows how small definitions + calls get once packed into symbol_blob.
+"""
+import glob
+import itertools
+import json
+import os
+import sysconfig
+import time
+
+from app.services.impact.extractors import parse_source
+from app.services.impact.symbol_store import encode_symbol_blob
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+
+
+def _corpus(python_files: int = 1500) -> list[dict]:
+    paths = glob.glob(os.path.join(ROOT, "frontend3", "src", "**", "*.ts*"), recursive=True)
+    stdlib = os.path.join(sysconfig.get_paths()["stdlib"], "**", "*.py")
+    paths += itertools.islice(glob.iglob(stdlib, recursive=True), python_files)
+    parsed = []
+    for path in paths:
+        with open(path, "rb") as fh:
+            result = parse_source(path, fh.read())
+        if result is not None:
+            parsed.append(result.to_dict())
+    return parsed
+
+
+def _decode_seconds(payloads: list[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for payload in payloads:
+            json.loads(payload)
+    return (time.perf_counter() - start) / rounds
+
+
+def main(rounds: int = 5) -> None:
+    corpus = _corpus()
+    full = [json.dumps(d) for d in corpus]
+    graph = [json.dumps({"imports": d["imports"], "exports": d["exports"]}) for d in corpus]
+    bodies = sum(len(json.dumps({"definitions": d["definitions"], "calls": d["calls"]})) for d in corpus)
+    blobs = sum(len(encode_symbol_blob(d)) for d in corpus)
+
+    full_bytes, graph_bytes = sum(map(len, full)), sum(map(len, graph))
+    print(f"{len(corpus)} parsed files")
+    print(f"parsed_symbols JSONB (all)    : {full_bytes / 2**20:7.2f} MiB, "
+          f"{_decode_seconds(full, rounds) * 1e3:7.1f} ms to decode")
+    print(f"imports + exports only        : {graph_bytes / 2**20:7.2f} MiB, "
+          f"{_decode_seconds(graph, rounds) * 1e3:7.1f} ms to decode")
+    print(f"definitions + calls: JSON {bodies / 2**20:.2f} MiB -> symbol_blob {blobs / 2**20:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
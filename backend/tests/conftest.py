@@ -0,0 +1,105 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+
+class FakeRow(tuple):
+    """A selected row: indexable like a tuple, with columns as attributes."""
+
+    def __new__(cls, names, values):
+        row = super().__new__(cls, values)
+        row.__dict__.update(zip(names, values))
+        return row
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return FakeResult(row[0] if isinstance(row, tuple) else row for row in self.rows)
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    async def __aiter__(self):
+        for row in self.rows:
+            yield row
+
+
+class FakeSession:
+    """
+    Stands in for an AsyncSession. SELECTs answer with the rows registered for
+    the table they select from, whatever order they run in; every statement
+    is recorded with its parameters. Rows registered as objects are projected
+    onto the selected columns; tuples are returned as they are. WHERE clauses
+    are not evaluated.
+    """
+
+    def __init__(self):
+        self.rows: dict[str, list] = {}
+        self.statements: list[tuple[object, object]] = []
+        self.added: list = []
+        self.deleted: list = []
+        self.commits = 0
+
+    def returns(self, table: str, rows) -> None:
+        self.rows[table] = list(rows)
+
+    @staticmethod
+    def table_of(stmt) -> str:
+        if stmt.is_select:
+            entity = stmt.column_descriptions[0]["entity"]
+            return entity.__tablename__ if entity is not None else ""
+        return stmt.table.name
+
+    def on(self, table: str) -> list[tuple[object, object]]:
+        """Recorded (statement, params) pairs that target a table."""
+        return [(stmt, params) for stmt, params in self.statements if self.table_of(stmt) == table]
+
+    def sql(self, stmt) -> str:
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    @staticmethod
+    def project(stmt, row):
+        if isinstance(row, tuple):
+            return row
+        columns = stmt.column_descriptions
+        if len(columns) == 1 and columns[0]["expr"] is columns[0]["entity"]:
+            return row  # whole ORM entity
+        names = [c["name"] for c in columns]
+        return FakeRow(names, [getattr(row, name) for name in names])
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        if not stmt.is_select:
+            return FakeResult([])
+        return FakeResult(self.project(stmt, row) for row in self.rows.get(self.table_of(stmt), []))
+
+    async def stream(self, stmt):
+        return await self.execute(stmt)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def delete(self, obj):
+        self.deleted.append(obj)
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def fake_db():
+    return FakeSession()
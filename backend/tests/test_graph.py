@@ -0,0 +1,398 @@
+def test_file_edges_merge_into_component_edges():
+    from app.services.impact.extractors.base import ParsedFile
+    from app.services.impact.graph import merge_component_edges, resolve_file_edges
+    from app.services.impact.resolvers import ModuleResolver, ProjectPathIndex
+
+    panel = ParsedFile.from_dict({
+        "path": "dashboard/UserPanel.tsx",
+        "imports": [
+            {"source": "../auth/validateUser", "symbols": ["validateUser", "missing"]},
+            {"source": "react", "symbols": ["useState"]},
+        ],
+    })
+    auth = ParsedFile.from_dict({"path": "auth/validateUser.ts", "exports": ["validateUser"]})
+    exports_by_path = {pf.path: {e.name for e in pf.exports} for pf in (panel, auth)}
+
+    edges = resolve_file_edges(panel, ModuleResolver(ProjectPathIndex(exports_by_path)), exports_by_path)
+    assert edges == [("auth/validateUser.ts", ["validateUser"])]
+
+    deps = merge_component_edges(
+        "p1",
+        [(panel.path, target, symbols) for target, symbols in edges],
+        {"dashboard/UserPanel.tsx": "c-dash", "auth/validateUser.ts": "c-auth"},
+    )
+    assert [(d.source_component_id, d.target_component_id, d.symbols) for d in deps] == [
+        ("c-dash", "c-auth", ["validateUser"])
+    ]
+
+def test_file_references_keep_import_lines():
+    from app.services.impact.extractors.base import ParsedFile
+    from app.services.impact.graph import resolve_file_references
+    from app.services.impact.resolvers import ModuleResolver, ProjectPathIndex
+
+    panel = ParsedFile.from_dict({
+        "path": "dashboard/UserPanel.tsx",
+        "imports": [
+            {"source": "../auth/validateUser", "symbols": ["validateUser"], "line": 2},
+            {"source": "../auth/validateUser", "symbols": ["missing"], "line": 3},
+            {"source": "../auth/validateUser", "is_wildcard": True, "line": 4},
+        ],
+    })
+    exports_by_path = {panel.path: set(), "auth/validateUser.ts": {"validateUser"}}
+
+    refs = resolve_file_references(panel, ModuleResolver(ProjectPathIndex(exports_by_path)), exports_by_path)
+    assert [(imp.line, target, symbols) for imp, target, symbols in refs] == [
+        (2, "auth/validateUser.ts", ["validateUser"]),
+        (4, "auth/validateUser.ts", []),
+    ]
+
+def test_project_path_index_resolution():
+    from app.services.impact.resolvers import ProjectPathIndex
+
+    index = ProjectPathIndex([
+        "src/auth/validateUser.ts", "src/auth/validateUser.js", "src/auth/index.ts",
+        "app/__init__.py", "app/auth/tokens.py", "internal/auth/token.go", "internal/auth/token_test.go",
+    ])
+    assert index.resolve_relative("./validateUser", "src/auth/login.ts") == "src/auth/validateUser.ts"
+    assert index.resolve_relative("../auth", "src/dashboard/Panel.tsx") == "src/auth/index.ts"
+    assert index.resolve_relative("react", "src/auth/login.ts") is None
+    assert index.python_modules["app"] == "app/__init__.py"
+    assert index.python_modules["app.auth.tokens"] == "app/auth/tokens.py"
+    assert index.go_packages["internal/auth"] == ["internal/auth/token.go"]
+
+    restored = ProjectPathIndex.from_dict(index.to_dict())
+    assert restored.stems == index.stems
+
+def test_js_resolver_follows_tsconfig_paths_and_workspaces():
+    from app.services.impact.resolvers import ModuleResolver, ProjectConfigs, ProjectPathIndex
+
+    index = ProjectPathIndex([
+        "web/src/components/Button.tsx", "web/src/lib/api/index.ts",
+        "packages/ui/src/index.ts", "packages/ui/src/Card.tsx", "web/src/App.tsx",
+    ])
+    configs = {
+        "tsconfig.base.json": b"""{
+            // shared options
+            "compilerOptions": {"paths": {"@/*": ["./*"], "api": ["lib/api"],},},
+        }""",
+        "web/tsconfig.json": b'{"extends": "../tsconfig.base.json", "compilerOptions": {"baseUrl": "src"}}',
+        "package.json": b'{"workspaces": ["packages/*"]}',
+        "packages/ui/package.json": b'{"name": "@acme/ui", "main": "dist/index.js"}',
+    }
+    resolver = ModuleResolver(index, ProjectConfigs.compile(configs))
+
+    assert resolver.resolve("@/components/Button", "web/src/App.tsx") == "web/src/components/Button.tsx"
+    assert resolver.resolve("api", "web/src/App.tsx") == "web/src/lib/api/index.ts"
+    assert resolver.resolve("components/Button", "web/src/App.tsx") == "web/src/components/Button.tsx"
+    assert resolver.resolve("@acme/ui", "web/src/App.tsx") == "packages/ui/src/index.ts"
+    assert resolver.resolve("@acme/ui/Card", "web/src/App.tsx") == "packages/ui/src/Card.tsx"
+    assert resolver.resolve("react", "web/src/App.tsx") is None
+
+def test_language_resolvers():
+    from app.services.impact.extractors.base import Import
+    from app.services.impact.resolvers import ModuleResolver, ProjectConfigs, ProjectPathIndex
+
+    index = ProjectPathIndex([
+        "backend/app/__init__.py", "backend/app/auth/__init__.py", "backend/app/auth/tokens.py",
+        "backend/app/main.py",
+        "svc/go.mod", "svc/internal/auth/token.go", "svc/cmd/main.go",
+        "src/main/java/com/acme/auth/Validator.java", "src/main/java/com/acme/App.java",
+        "Company.Auth/Services/TokenService.cs", "Web/Program.cs",
+        "crate/src/lib.rs", "crate/src/auth/mod.rs", "crate/src/auth/token.rs",
+    ])
+    resolver = ModuleResolver(index, ProjectConfigs.compile({"svc/go.mod": b"module example.com/svc\n"}))
+
+    def targets(source, from_path, symbols=(), wildcard=False):
+        imp = Import(source=source, symbols=list(symbols), is_wildcard=wildcard)
+        return sorted(t for _, t in resolver.resolve_import(imp, from_path))
+
+    assert targets("app.auth.tokens", "backend/app/main.py", ["issue"]) == ["backend/app/auth/tokens.py"]
+    assert targets(".auth", "backend/app/main.py", ["tokens"]) == ["backend/app/auth/tokens.py"]
+    assert targets("os/path", "backend/app/main.py") == []
+    assert targets("example.com/svc/internal/auth", "svc/cmd/main.go", ["auth"]) == ["svc/internal/auth/token.go"]
+    assert targets("fmt", "svc/cmd/main.go", ["fmt"]) == []
+    assert targets("com.acme.auth", "src/main/java/com/acme/App.java", ["Validator"]) == [
+        "src/main/java/com/acme/auth/Validator.java"
+    ]
+    assert targets("com.acme.auth", "src/main/java/com/acme/App.java", ["*"], wildcard=True) == [
+        "src/main/java/com/acme/auth/Validator.java"
+    ]
+    assert targets("Company.Auth", "Web/Program.cs", ["Services"]) == ["Company.Auth/Services/TokenService.cs"]
+    assert targets("crate::auth::token::{issue}", "crate/src/lib.rs", ["issue"]) == ["crate/src/auth/token.rs"]
+    assert targets("crate::auth::{token, verify}", "crate/src/lib.rs", ["auth", "token", "verify"]) == [
+        "crate/src/auth/mod.rs", "crate/src/auth/token.rs"
+    ]
+    assert targets("self::token::issue", "crate/src/auth/mod.rs", ["issue"]) == ["crate/src/auth/token.rs"]
+    assert targets("super::verify", "crate/src/auth/token.rs", ["verify"]) == ["crate/src/auth/mod.rs"]
+
+def test_project_graph_adjacency():
+    from app.services.impact.graph_cache import GraphEdge, ProjectGraph
+
+    edges = [
+        GraphEdge("e1", "dash", "auth", "import", 1.0, "parser", frozenset({"validateUser"})),
+        GraphEdge("e2", "admin", "auth", "import", 1.0, "parser", frozenset()),
+        GraphEdge("e3", "auth", "shared", "import", 1.0, "parser", frozenset({"User"})),
+    ]
+    graph = ProjectGraph.from_edges("p1", 3, {"auth": "Auth"}, edges)
+
+    assert [e.target for e in graph.depends_on("auth")] == ["shared"]
+    assert sorted(e.source for e in graph.depended_by("auth")) == ["admin", "dash"]
+    assert graph.depended_by("dash") == []
+    assert graph.edge_count == 3
+
+def test_blast_radius_follows_reexports_and_cycles():
+    from app.services.impact.blast_radius import compute_blast_radius
+    from app.services.impact.graph_cache import GraphEdge, ProjectGraph
+
+    def edge(source, target, *symbols):
+        return GraphEdge(f"{source}->{target}", source, target, "import", 1.0, "parser", frozenset(symbols))
+
+    graph = ProjectGraph.from_edges("p1", 1, {}, [
+        edge("shared", "auth", "validateUser"),   # re-exports validateUser
+        edge("dash", "shared", "validateUser"),
+        edge("admin", "shared", "formatDate"),    # unrelated symbol of shared
+        edge("reports", "dash"),                  # wildcard import
+        edge("auth", "reports", "Report"),        # cycle back to the origin
+    ])
+
+    blast = compute_blast_radius(graph, "auth", ["validateUser"], max_depth=5)
+    assert [[h.component_id for h in hop] for hop in blast.hops] == [["shared"], ["dash"], ["reports"]]
+    assert blast.hops[2][0].symbols == frozenset({"validateUser"})
+    assert blast.via(blast.hops[2][0]) == {"dash"}
+    assert blast.via(blast.hops[0][0]) == {"auth"}
+
+    assert compute_blast_radius(graph, "auth", ["validateUser"], max_depth=1).component_ids == {"shared"}
+    assert compute_blast_radius(graph, "auth", ["other"]).hops == []
+
+def test_changed_symbols_follow_the_diff():
+    from app.services.impact.changed_symbols import detect_changed_symbols
+
+    original = (
+        "function helper(x) {\n  return x + 1;\n}\n\n"
+        "export function validateUser(u) {\n  return helper(u.id);\n}\n\n"
+        "export class Session {\n  refresh() { return 1; }\n}\n\n"
+        "export const LIMIT = 5;\n"
+    )
+    assert detect_changed_symbols("auth.ts", original, original.replace("  return x", "    return  x")) == []
+    assert detect_changed_symbols("auth.ts", original, original.replace("x + 1", "x + 2")) == ["validateUser"]
+    assert detect_changed_symbols("auth.ts", original, original.replace("return 1", "return 2")) == ["Session"]
+    assert detect_changed_symbols("auth.ts", original, original + "export const TTL = 60;\n") == ["TTL"]
+    assert detect_changed_symbols("auth.ts", original, original.replace("LIMIT = 5", "LIMIT = 6")) == ["LIMIT"]
+    assert detect_changed_symbols("README.md", "a\n", "b\n") is None
+
+def test_changed_symbols_cover_whole_export_statements():
+    from app.services.impact.changed_symbols import detect_changed_symbols
+
+    def changed(source, old, new):
+        return detect_changed_symbols("auth.ts", source, source.replace(old, new))
+
+    # Body of a multi-line exported arrow const
+    source = "export const validate = (x) => {\n  const y = x + 1;\n  return y;\n};\nexport const TTL = 60;\n"
+    assert changed(source, "x + 1", "x + 2") == ["validate"]
+
+    # Export list naming a local function
+    source = "const w = () => {\n  return 1;\n};\nconst v = 2;\nexport { w, v };\n"
+    assert changed(source, "return 1", "return 2") == ["w"]
+
+    # Value inside a multi-line exported object literal
+    source = "export const config = {\n  retries: 1,\n  ttl: 5,\n};\n"
+    assert changed(source, "ttl: 5", "ttl: 6") == ["config"]
+
+    # Anonymous default export, and a default export naming a local
+    source = "export default function (x) {\n  const y = x + 1;\n  return y;\n}\n"
+    assert changed(source, "x + 1", "x + 2") == ["default"]
+    source = "const impl = (x) => {\n  return x;\n};\nexport default impl;\nexport const k = 1;\n"
+    assert changed(source, "return x", "return x * 2") == ["default"]
+
+    # Arrow const whose only change is in the helper it calls
+    source = "function h() {\n  return 1;\n}\nexport const c = () => h();\nexport const other = 2;\n"
+    assert changed(source, "return 1", "return 2") == ["c"]
+
+    # Nothing says where a plain re-exported local lives, so it is assumed changed
+    source = "import { w } from './w';\nexport { w };\nfunction f() {\n  return 1;\n}\n"
+    assert changed(source, "return 1", "return 2") == ["w"]
+
+def test_symbol_store_splits_parsed_symbols_losslessly():
+    from app.services.impact.extractors import parse_source
+    from app.services.impact.extractors.base import Export, Import, ParsedFile
+    from app.services.impact.symbol_store import decode_symbol_blob, split_parsed_symbols
+
+    parsed = parse_source("UserPanel.tsx", open("tests/fixtures/ripple-mock-project/dashboard/UserPanel.tsx", "rb").read())
+    imports, exports, blob = split_parsed_symbols("p1", "f1", parsed.to_dict())
+    assert {r["file_id"] for r in imports + exports} == {"f1"}
+
+    language, definitions, calls = decode_symbol_blob(blob)
+    restored = ParsedFile(
+        path=parsed.path, language=language,
+        imports=[Import(r["source"], r["symbols"], r["is_default"], r["is_wildcard"], r["line"])
+                 for r in sorted(imports, key=lambda r: r["ordinal"])],
+        exports=[Export(r["name"], r["kind"], r["signature"], r["line"])
+                 for r in sorted(exports, key=lambda r: r["ordinal"])],
+        definitions=definitions, calls=calls,
+    )
+    # Only change detection reads export end lines, and it parses afresh
+    for e in parsed.exports:
+        e.end_line = 0
+    assert restored == parsed
+
+    # Legacy rows with bare export names still split
+    _, legacy, _ = split_parsed_symbols("p1", "f2", {"exports": ["validateUser"]})
+    assert [(r["name"], r["kind"]) for r in legacy] == [("validateUser", "variable")]
+
+def test_parse_batch_updates_project_files_once(fake_db):
+    import asyncio
+
+    from app.services.impact.pipeline import ParseResult
+    from app.tasks.parsing import _store_batch
+
+    symbols = {"language": "typescript", "imports": [{"source": "./a", "symbols": ["A"]}], "exports": []}
+    batch = [
+        ParseResult("f1", "src/f1.ts", "typescript", parsed_symbols=symbols, content_hash="h1"),
+        ParseResult("f2", "styles.css", "css"),
+        ParseResult("f3", "src/f3.ts", "typescript", error="boom"),
+    ]
+    asyncio.run(_store_batch("p1", batch, fake_db))
+
+    (stmt, rows), = fake_db.on("project_files")
+    assert [(r["file_id"], r["language"], r["content_hash"], r["blob"] is not None) for r in rows] == [
+        ("f1", "typescript", "h1", True), ("f2", "css", None, False), ("f3", "typescript", None, False),
+    ]
+    assert "coalesce" in fake_db.sql(stmt)  # absent values keep what is stored
+    (_, imports), = [(s, p) for s, p in fake_db.on("file_imports") if p]
+    assert [(i["file_id"], i["source"]) for i in imports] == [("f1", "./a")]
+
+def test_stream_imports_groups_rows_by_file(fake_db):
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.services.impact.symbol_store import stream_imports
+
+    fake_db.returns("file_imports", [
+        SimpleNamespace(file_id=f, source=s, symbols=syms, is_default=False, is_wildcard=False, line=n)
+        for n, (f, s, syms) in enumerate([("a", "./x", ["X"]), ("a", "./y", None), ("b", "./x", ["X", "Z"])])
+    ])
+
+    async def collect():
+        return [(fid, [(i.source, i.symbols) for i in imports]) async for fid, imports in stream_imports(fake_db, "p1", 100)]
+
+    grouped = asyncio.run(collect())
+    stmt, _ = fake_db.statements[0]
+    assert stmt.get_execution_options()["yield_per"] == 100
+    assert grouped == [("a", [("./x", ["X"]), ("./y", [])]), ("b", [("./x", ["X", "Z"])])]
+
+def test_component_edges_upsert_in_batches(fake_db):
+    import asyncio
+
+    from app.services.impact.graph_store import upsert_component_edges
+
+    edges = {(f"c{i}", "c-shared"): {"b", "a"} for i in range(5)}
+    asyncio.run(upsert_component_edges("p1", edges, fake_db, chunk_size=2))
+
+    assert [len(params) for _, params in fake_db.statements] == [2, 2, 1]
+    sql = fake_db.sql(fake_db.statements[0][0])
+    assert "ON CONFLICT ON CONSTRAINT uq_component_dependencies_edge DO UPDATE" in sql
+    assert "jsonb_array_elements_text" in sql  # symbols are merged, not overwritten
+    assert fake_db.statements[0][1][0]["symbols"] == ["a", "b"]
+
+    fake_db.statements.clear()
+    asyncio.run(upsert_component_edges("p1", edges, fake_db, merge=False))
+    assert "IS DISTINCT FROM excluded.symbols" in fake_db.sql(fake_db.statements[0][0])
+
+
+def test_unconfirmed_imports_are_re_resolved_when_the_export_appears(fake_db, monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.models.component import FileDependency
+    from app.services.impact import graph_store
+
+    async def nothing(*args, **kwargs):
+        pass
+
+    refreshed = []
+
+    async def refresh(project_id, pairs, db):
+        refreshed.append(pairs)
+
+    monkeypatch.setattr(graph_store, "invalidate_project_graph", nothing)
+    monkeypatch.setattr(graph_store, "_refresh_component_pairs", refresh)
+
+    fake_db.returns("project_files", [
+        SimpleNamespace(id="x", path="src/x.ts", component_id="cx", s3_key="kx"),
+        SimpleNamespace(id="f", path="src/f.ts", component_id="cf", s3_key="kf"),
+    ])
+    fake_db.returns("file_imports", [
+        SimpleNamespace(file_id="x", source="./f", symbols=["S"], is_default=False, is_wildcard=False, line=1),
+    ])
+
+    # F doesn't export S yet: the rebuild keeps a path-level edge but no component edge
+    fake_db.returns("file_exports", [])
+    asyncio.run(graph_store.rebuild_project_graph("p1", fake_db))
+    (_, edges), = [(stmt, params) for stmt, params in fake_db.on("file_dependencies") if params]
+    assert [(e["source_file_id"], e["target_file_id"], e["symbols"]) for e in edges] == [("x", "f", None)]
+    assert [stmt.is_delete for stmt, _ in fake_db.on("component_dependencies")] == [True]
+    assert [stmt.is_delete for stmt, _ in fake_db.on("symbol_references")] == [True]
+
+    # F starts exporting S: X is found through that edge and confirmed
+    fake_db.statements.clear()
+    edge = FileDependency(project_id="p1", source_file_id="x", target_file_id="f", symbols=None)
+    fake_db.returns("file_dependencies", [edge])
+    fake_db.returns("file_exports", [SimpleNamespace(file_id="f", name="S")])
+    asyncio.run(graph_store.update_project_graph("p1", {"f"}, fake_db))
+
+    assert edge.symbols == ["S"]
+    (_, references), = [(stmt, params) for stmt, params in fake_db.on("symbol_references") if params]
+    assert [(r["source_file_id"], r["target_file_id"], r["symbol"]) for r in references] == [("x", "f", "S")]
+    assert refreshed == [{("cx", "cf")}]
+
+
+def test_impact_analysis_issues_a_fixed_number_of_queries(fake_db, monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.services.impact.blast_radius import BlastRadius, ImpactHit
+    from app.tasks import impact
+
+    hits = [ImpactHit(f"c{i}", 1, frozenset({"render"})) for i in range(20)]
+    cr = SimpleNamespace(id="cr1", project_id="p1", component_id="c-origin", author_id="u-author", title="t")
+    draft = SimpleNamespace(content="export function render() { return 2 }\n")
+    file = SimpleNamespace(id="f1", path="src/render.ts", s3_key="k1")
+    fake_db.returns("change_requests", [cr])
+    fake_db.returns("file_drafts", [(draft, file)])
+    fake_db.returns("component_contributors", [(hit.component_id, f"u{n % 3}") for n, hit in enumerate(hits)])
+    published = []
+
+    async def download_many(keys):
+        return [b"export function render() { return 1 }\n" for _ in keys]
+
+    async def nothing(*args, **kwargs):
+        return []
+
+    async def publish_many(messages):
+        published.extend(messages)
+
+    async def publish(channel, message):
+        published.append((channel, message))
+
+    monkeypatch.setattr(impact, "AsyncSessionLocal", lambda: fake_db)
+    monkeypatch.setattr(impact, "download_many", download_many)
+    monkeypatch.setattr(impact, "get_project_graph", nothing)
+    monkeypatch.setattr(impact, "compute_blast_radius", lambda *a: BlastRadius("c-origin", 3, [hits]))
+    monkeypatch.setattr(impact, "find_symbol_references", nothing)
+    monkeypatch.setattr(impact, "analyze_with_llm", nothing)
+    monkeypatch.setattr(impact, "publish_many", publish_many)
+    monkeypatch.setattr(impact, "publish", publish)
+
+    asyncio.run(impact._analyze_impact_async("cr1"))
+
+    # change request, drafts + files, contributors, impacts, flags, notifications
+    assert len(fake_db.statements) == 6
+    (_, impacts), = fake_db.on("change_impacts")
+    assert len(impacts) == 20
+    (flag, _), = fake_db.on("components")
+    assert "WHERE components.id IN" in fake_db.sql(flag)
+    (_, notifications), = fake_db.on("notifications")
+    assert sorted(n["user_id"] for n in notifications) == ["u0", "u1", "u2"]
+    assert [channel for channel, _ in published[:4]] == [
+        "ws:user:u0", "ws:user:u1", "ws:user:u2", "ws:user:u-author",
+    ]
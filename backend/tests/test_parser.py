@@ -15,3 +15,177 @@ def test_parse_dashboard_dependency():
     
     import_sources = [imp.source for imp in result.imports]
     assert "../auth/validateUser" in import_sources
+
+def test_parser_pool_reuses_parsers():
+    from app.services.impact.parser_pool import get_parser, pool_stats, reset_stats
+
+    first = get_parser("typescript")
+    reset_stats()
+    parse_file("a.ts", "export const a = 1;")
+    assert get_parser("typescript") is first
+
+    stats = pool_stats()["typescript"]
+    assert stats["misses"] == 0
+    assert stats["hits"] == 2
+
+def test_parse_source_dispatches_on_language():
+    from app.services.impact.extractors import parse_source
+
+    tsx = open("tests/fixtures/ripple-mock-project/dashboard/UserPanel.tsx", "rb").read()
+    parsed = parse_source("dashboard/UserPanel.tsx", tsx)
+    assert parsed.language == "typescript"
+    assert "../auth/validateUser" in [imp.source for imp in parsed.imports]
+
+    py = parse_source("svc.py", b"from .auth import validate_user\n\ndef run():\n    return validate_user()\n")
+    assert py.language == "python"
+    assert [e.name for e in py.exports] == ["run"]
+
+    assert parse_source("README.md", b"# hi") is None
+
+def test_incremental_reparse_matches_full_parse():
+    from dataclasses import asdict
+
+    from app.services.impact.extractors import parse_source
+    from app.services.impact.incremental import parse_edit, tree_cache
+
+    original = (
+        b'import { db } from "./db";\n\n'
+        b"export function load(id) {\n  return db.get(id);\n}\n\n"
+        b"export class Store {\n  save(v) { return db.put(v); }\n}\n"
+    )
+    draft = original.replace(b"return db.get(id);", b"const row = db.get(id);\n  return audit(row);")
+
+    tree_cache.clear()
+    before, after = parse_edit("store.ts", original, draft)
+    for parsed, content in ((before, original), (after, draft)):
+        full = parse_source("store.ts", content)
+        for kind in ("imports", "exports", "definitions", "calls"):
+            key = lambda item: sorted(asdict(item).items())
+            assert sorted(map(key, getattr(parsed, kind))) == sorted(map(key, getattr(full, kind)))
+
+    # The draft's tree is cached for the next edit
+    _, again = parse_edit("store.ts", draft, draft + b"export const TTL = 1;\n")
+    assert [e.name for e in again.exports] == ["load", "Store", "TTL"]
+
+def test_visitor_walks_each_node_once():
+    from app.services.impact.extractors import TypeScriptExtractor
+    from app.services.impact.extractors.base import BaseExtractor, ParsedFile, VisitContext
+    from app.services.impact.parser_pool import get_parser
+
+    source = b'import { a } from "./a";\nexport function f() { return a(require("./b")); }\n'
+    root = get_parser("typescript").parse(source).root_node
+    extractor = TypeScriptExtractor()
+    result = ParsedFile(path="f.ts", language="typescript")
+
+    visited = extractor.visit(root, VisitContext(source, result))
+    assert visited == sum(1 for _ in BaseExtractor._preorder(root))
+    assert [i.source for i in result.imports] == ["./a", "./b"]
+    assert [c.callee for c in result.calls] == ["a", "require"]
+    assert len(TypeScriptExtractor.handlers["call_expression"]) == 2
+
+    # Overriding a handler replaces it rather than adding a second one
+    class NoCalls(TypeScriptExtractor):
+        def _call(self, node, ctx):
+            pass
+
+    assert NoCalls.handlers["call_expression"] == (TypeScriptExtractor._require_call, NoCalls._call)
+    assert NoCalls().extract(root, source, "f.ts").calls == []
+
+def test_query_engine_matches_hand_written_extractors():
+    from app.services.impact.extractors import EXTRACTORS
+    from app.services.impact.extractors.queries import get_query_engine
+    from app.services.impact.parser_pool import get_parser
+
+    samples = [
+        ("tsx", "typescript", open("tests/fixtures/ripple-mock-project/dashboard/UserPanel.tsx", "rb").read()),
+        ("typescript", "typescript", open("tests/fixtures/ripple-mock-project/auth/validateUser.ts", "rb").read()),
+        ("python", "python", (
+            b"import os.path as osp\nfrom .auth import validate_user\n\n__all__ = ['Service']\n\n"
+            b"class Service:\n    def run(self, x) -> bool:\n        return validate_user(osp.join(x))\n\n"
+            b"def helper():\n    return Service().run(1)\n"
+        )),
+    ]
+    for grammar, language, source in samples:
+        root = get_parser(grammar).parse(source).root_node
+        extractor = EXTRACTORS[language]
+        hand = extractor.extract(root, source, "f").to_dict()
+        query = get_query_engine(grammar).extract(extractor, root, source, "f").to_dict()
+        for kind in ("imports", "exports", "definitions", "calls"):
+            assert sorted(map(repr, query[kind])) == sorted(map(repr, hand[kind])), (grammar, kind)
+
+    # Grammars without a spec fall back to the hand-written extractor
+    assert get_query_engine("go") is None
+
+def test_call_scopes_match_parent_walk():
+    from app.services.impact.extractors import EXTRACTORS
+    from app.services.impact.parser_pool import get_parser
+
+    source = (
+        b"def outer():\n    setup()\n    def inner():\n        work()\n    inner()\n\n"
+        b"class A:\n    def m(self):\n        lambda: self.go()\n\nmain()\n"
+    )
+    root = get_parser("python").parse(source).root_node
+    extractor = EXTRACTORS["python"]
+    parsed = extractor.extract(root, source, "f.py")
+    # find_enclosing_function() climbs parent pointers; extract() uses a scope stack
+    expected = [extractor.find_enclosing_function(n, source)
+                for n in extractor.walk_nodes(root, ["call"])]
+    assert [c.parent_def for c in parsed.calls] == expected == ["outer", "inner", "outer", "m", None]
+
+    # Callee names seen repeatedly share one interned str
+    repeated = b"fetch_user()\nfetch_user()\n"
+    again = extractor.extract(get_parser("python").parse(repeated).root_node, repeated, "g.py")
+    assert again.calls[0].callee is again.calls[1].callee
+
+def test_parsed_file_round_trips_through_jsonb_layout():
+    import json
+
+    from app.services.impact.extractors import parse_source
+    from app.services.impact.extractors.base import ParsedFile
+
+    parsed = parse_source("UserPanel.tsx", open("tests/fixtures/ripple-mock-project/dashboard/UserPanel.tsx", "rb").read())
+    row = json.loads(json.dumps(parsed.to_dict()))
+    restored = ParsedFile.from_dict(row)
+    assert restored == parsed
+    assert restored.to_dict() == row
+
+    # Slotted, and names decoded from separate rows share one interned str
+    assert not hasattr(restored.imports[0], "__dict__")
+    other = ParsedFile.from_dict(json.loads(json.dumps(row)))
+    assert other.imports[0].source is restored.imports[0].source
+
+
+def _parse_in_daemon(results):
+    import asyncio
+
+    from app.core.config import settings
+    from app.services.impact import parse_cache, pipeline
+
+    async def no_cache(entries):
+        return [None] * len(entries)
+
+    async def download(key):
+        return b"export function validate(input: string) { return input }\n"
+
+    async def run():
+        jobs = [pipeline.ParseJob(f"f{n}", f"src/f{n}.ts", f"k{n}") for n in range(3)]
+        return [r async for batch in pipeline.parse_files(jobs, download) for r in batch]
+
+    settings.parse_workers = 2
+    parse_cache.get_many = no_cache
+    parse_cache.set_many = no_cache
+    parsed = asyncio.run(run())
+    results.put([(r.error, [e["name"] for e in (r.parsed_symbols or {}).get("exports", [])]) for r in parsed])
+
+
+def test_parse_files_falls_back_to_threads_in_daemonic_process():
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    child = ctx.Process(target=_parse_in_daemon, args=(results,), daemon=True)
+    child.start()
+    parsed = results.get(timeout=60)
+    child.join()
+
+    assert parsed == [(None, ["validate"])] * 3
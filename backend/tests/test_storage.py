@@ -0,0 +1,193 @@
+import asyncio
+import datetime
+import hashlib
+import io
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import parse_qs, quote, urlsplit
+
+import boto3
+import pytest
+from botocore.auth import S3SigV4Auth, S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+
+from app.api.v1.routers import files
+from app.core import storage
+from app.core.s3 import PresignedUrlCache, Presigner, SigV4Signer
+
+NOW = datetime.datetime(2026, 10, 16, 12, 30, 5)
+
+
+def _botocore_signed(request: AWSRequest, auth) -> AWSRequest:
+    with mock.patch("botocore.auth.datetime") as dt:
+        dt.datetime.utcnow.return_value = NOW
+        auth.add_auth(request)
+    return request
+
+
+def test_download_many_bounds_concurrency_and_keeps_order(monkeypatch):
+    class S3:
+        active = peak = 0
+        lock = threading.Lock()
+
+        def get_object(self, Bucket, Key):
+            with self.lock:
+                S3.active += 1
+                S3.peak = max(S3.peak, S3.active)
+            time.sleep(0.01)
+            with self.lock:
+                S3.active -= 1
+            if Key == "missing":
+                raise KeyError(Key)
+            return {"Body": io.BytesIO(Key.encode())}
+
+    monkeypatch.setattr(storage, "get_s3_client", S3)
+    monkeypatch.setattr(storage.settings, "s3_async_client", False)
+    keys = [f"k{i}" for i in range(12)] + ["missing"]
+    results = asyncio.run(storage.download_many(keys, concurrency=3))
+
+    assert results[:12] == [k.encode() for k in keys[:12]]
+    assert isinstance(results[12], KeyError)
+    assert 1 < S3.peak <= 3
+
+
+def test_sigv4_signer_matches_botocore():
+    body = b"hello"
+    path = "/ripple-files/projects/p1/src/a%20b%2Bc.ts"
+    signer = SigV4Signer("AKID", "secret", "us-east-1")
+    ours = signer.sign_headers(
+        "PUT", "localhost:9000", path, {"Content-Type": "text/plain"},
+        hashlib.sha256(body).hexdigest(), now=NOW,
+    )
+
+    request = _botocore_signed(
+        AWSRequest("PUT", "http://localhost:9000" + path, data=body, headers={"Content-Type": "text/plain"}),
+        S3SigV4Auth(Credentials("AKID", "secret"), "s3", "us-east-1"),
+    )
+    assert ours["authorization"] == request.headers["Authorization"]
+
+
+def test_async_s3_client_against_moto_server(monkeypatch):
+    server_mod = pytest.importorskip("moto.server")
+
+    server = server_mod.ThreadedMotoServer(port=0, verbose=False)
+    server.start()
+    try:
+        host, port = server.get_host_and_port()
+        endpoint = f"http://{host}:{port}"
+        for name, value in {
+            "aws_endpoint_url": endpoint, "aws_s3_bucket": "ripple-test",
+            "aws_access_key_id": "testing", "aws_secret_access_key": "testing",
+        }.items():
+            monkeypatch.setattr(storage.settings, name, value)
+        boto3.client(
+            "s3", endpoint_url=endpoint, region_name="us-east-1",
+            aws_access_key_id="testing", aws_secret_access_key="testing",
+        ).create_bucket(Bucket="ripple-test")
+
+        async def roundtrip():
+            keys = [f"projects/p1/src/file {i}+x.ts" for i in range(20)]
+            await asyncio.gather(*(storage.upload_bytes(k, k.encode(), "text/plain") for k in keys))
+            fetched = await storage.download_many(keys + ["projects/p1/missing.ts"])
+            exists = await storage.object_exists(keys[0]), await storage.object_exists("nope")
+            await storage.delete_object(keys[0])
+            return keys, fetched, exists, await storage.object_exists(keys[0])
+
+        keys, fetched, exists, after_delete = asyncio.run(roundtrip())
+    finally:
+        server.stop()
+
+    assert fetched[:20] == [k.encode() for k in keys]
+    assert fetched[20].status_code == 404
+    assert exists == (True, False)
+    assert after_delete is False
+
+
+def _presigner() -> Presigner:
+    return Presigner(
+        endpoint_url="http://localhost:9000", bucket="ripple-files", region="us-east-1",
+        access_key="AKID", secret_key="secret",
+    )
+
+
+def test_presigned_urls_match_botocore():
+    keys = ["projects/p1/u1/src/a b+c.ts", "projects/p1/u2/README.md"]
+    put_urls = _presigner().urls("PUT", keys, 900, [{"content-type": "text/plain"}] * 2, now=NOW)
+    get_urls = _presigner().urls("GET", keys, 900, now=NOW)
+
+    def botocore_signature(method, url, headers):
+        request = _botocore_signed(
+            AWSRequest(method, url.split("?")[0], headers=headers),
+            S3SigV4QueryAuth(Credentials("AKID", "secret"), "s3", "us-east-1", expires=900),
+        )
+        return parse_qs(urlsplit(request.url).query)["X-Amz-Signature"]
+
+    for url in put_urls:
+        assert parse_qs(urlsplit(url).query)["X-Amz-Signature"] == botocore_signature(
+            "PUT", url, {"Content-Type": "text/plain"}
+        )
+    for url in get_urls:
+        assert parse_qs(urlsplit(url).query)["X-Amz-Signature"] == botocore_signature("GET", url, {})
+    assert urlsplit(put_urls[0]).path == "/ripple-files/projects/p1/u1/src/a%20b%2Bc.ts"
+
+
+def test_upload_url_endpoint_inserts_files_in_one_statement(fake_db):
+    owner = SimpleNamespace(id="u1")
+    fake_db.returns("projects", [SimpleNamespace(id="p1", owner_id="u1")])
+    req = files.UploadBatchReq(project_id="p1", files=[
+        files.FileUploadReq(name=f"src/file{n}.ts", size=n, content_type="text/plain" if n % 2 else "text/x-ts")
+        for n in range(50)
+    ])
+
+    response = asyncio.run(files.generate_presigned_urls(req, db=fake_db, current_user=owner))
+
+    (_, rows), = fake_db.on("project_files")
+    assert len(rows) == 50 and fake_db.commits == 1
+    by_id = {row["id"]: row for row in rows}
+    for n, item in enumerate(response["data"]):
+        row = by_id[item["file_id"]]
+        assert (row["path"], row["size_bytes"], row["confirmed"]) == (f"src/file{n}.ts", n, False)
+        assert item["storage_key"] == row["s3_key"]
+        url = urlsplit(item["upload_url"])
+        assert url.path == "/ripple-files/" + quote(row["s3_key"])
+        # Signed for this file's key and declared content type
+        signed_at = datetime.datetime.strptime(parse_qs(url.query)["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ")
+        content_type = req.files[n].content_type
+        assert item["upload_url"] == storage.get_presigner().urls(
+            "PUT", [row["s3_key"]], 900, [{"content-type": content_type}], now=signed_at
+        )[0]
+
+
+def test_presigned_get_urls_are_cached_per_window():
+    signed = []
+
+    class CountingPresigner(Presigner):
+        def urls(self, method, keys, expires, headers=None, now=None):
+            signed.extend(keys)
+            return super().urls(method, keys, expires, headers, now)
+
+    presigner = CountingPresigner(
+        endpoint_url="http://localhost:9000", bucket="ripple-files", region="us-east-1",
+        access_key="AKID", secret_key="secret",
+    )
+    cache = PresignedUrlCache(window=300, maxsize=3)
+    start = 1_792_000_200  # a window boundary
+    keys = ["a.ts", "b.ts"]
+
+    first = cache.urls(presigner, keys, 900, now=start + 10)
+    again = cache.urls(presigner, keys, 900, now=start + 290)
+    assert again == first and signed == keys
+    # Signed as of the window start, whatever the request time
+    assert parse_qs(urlsplit(first[0]).query)["X-Amz-Date"] == ["20261014T175000Z"]
+
+    # Over maxsize the least recently served URL is signed again
+    cache.urls(presigner, ["c.ts", "d.ts"], 900, now=start + 295)
+    cache.urls(presigner, ["d.ts", "a.ts"], 900, now=start + 296)
+    assert signed == ["a.ts", "b.ts", "c.ts", "d.ts", "a.ts"]
+
+    rolled = cache.urls(presigner, keys, 900, now=start + 300)
+    assert rolled != first and signed[-2:] == keys
+    assert PresignedUrlCache(window=0, maxsize=3).urls(presigner, keys, 900) != first